@@ -1,18 +1,26 @@
 """EcoAgent package initialization."""
 
-from ecoagent.main import EcoAgentApp, get_app
-from ecoagent.agent import root_agent
-from ecoagent.config import config
-from ecoagent.database import db
-from ecoagent.errors import error_service
-from ecoagent.observability import (
-    ecoagent_logger,
-    metrics_collector,
-    log_interaction,
-    log_tool_execution,
-    log_metric,
-    traced_function
-)
+import importlib
+import sys
+import types
+
+# Public names are resolved lazily on first access so that importing a light
+# submodule (e.g. ``ecoagent.cli`` for ``ecoagent info``) does not load the
+# agents and the Gemini SDK.
+_LAZY_EXPORTS = {
+    "EcoAgentApp": "ecoagent.main",
+    "get_app": "ecoagent.main",
+    "root_agent": "ecoagent.agent",
+    "config": "ecoagent.config",
+    "db": "ecoagent.database",
+    "error_service": "ecoagent.errors",
+    "ecoagent_logger": "ecoagent.observability",
+    "metrics_collector": "ecoagent.observability",
+    "log_interaction": "ecoagent.observability",
+    "log_tool_execution": "ecoagent.observability",
+    "log_metric": "ecoagent.observability",
+    "traced_function": "ecoagent.observability",
+}
 
 __version__ = "1.0.0"
 __author__ = "Vinh Nguyen"
@@ -32,4 +40,29 @@ __all__ = [
     "log_tool_execution",
     "log_metric",
     "traced_function"
-]
\ No newline at end of file
+]
+
+
+class _EcoAgentPackage(types.ModuleType):
+    """Package module that keeps ``ecoagent.config`` bound to the config instance.
+
+    Importing the ``ecoagent.config`` submodule would otherwise rebind the
+    package attribute to the module object and shadow the lazy export.
+    """
+
+    def __setattr__(self, name, value):
+        if name in _LAZY_EXPORTS and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _EcoAgentPackage
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
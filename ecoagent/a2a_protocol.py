@@ -234,8 +234,20 @@ def agent_communicator_tool(recipient: str, message: str, context: Optional[Dict
     }
 
 # Enhanced agents with A2A capabilities
+_a2a_enhanced_agents: Optional[Dict[str, Agent]] = None
+
+
 def create_a2a_enhanced_agents():
-    """Create agents with A2A communication capabilities."""
+    """Create agents with A2A communication capabilities.
+
+    The specialist agents are module-level singletons, so enhancing them is
+    done once and the same mapping is returned on subsequent calls (calling
+    this repeatedly would otherwise append duplicate A2A tools).
+    """
+    global _a2a_enhanced_agents
+    if _a2a_enhanced_agents is not None:
+        return dict(_a2a_enhanced_agents)
+
     from ecoagent.carbon_calculator.agent import carbon_calculator_agent
     from ecoagent.recommendation.agent import recommendation_agent
     from ecoagent.progress_tracker.agent import progress_tracker_agent
@@ -288,12 +300,14 @@ def create_a2a_enhanced_agents():
     progress_tracker_agent.tools.append(a2a_communicator_tool)
     community_agent.tools.append(a2a_communicator_tool)
     
-    return {
+    _a2a_enhanced_agents = {
         "carbon_calculator": carbon_calculator_agent,
         "recommendation": recommendation_agent,
         "progress_tracker": progress_tracker_agent,
         "community": community_agent
     }
+    return dict(_a2a_enhanced_agents)
+
 
 def get_a2a_communicator():
     """Get the global A2A communicator instance."""
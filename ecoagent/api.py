@@ -7,6 +7,7 @@ the core EcoAgent functionality.
 import os
 from typing import Dict, Any, Optional
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from datetime import datetime
 from ecoagent.database import db
@@ -23,7 +24,8 @@ from ecoagent.tools.carbon_calculator import (
     transportation_carbon_tool,
     flight_carbon_tool,
     home_energy_tool,
-    total_carbon_tool
+    total_carbon_tool,
+    warm_up as warm_up_carbon_kernels
 )
 from ecoagent.observability import log_interaction, get_metrics_summary
 import logging
@@ -36,7 +38,9 @@ from contextlib import asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle application startup and shutdown."""
     print("🚀 EcoAgent starting up...")
-    # Initialize any required services
+    # Runs in every worker process, so each one compiles (or loads from
+    # cache) the kernels before its first /carbon/calculate request
+    warm_up_carbon_kernels()
     yield
     print("🛑 EcoAgent shutting down...")
 
@@ -46,7 +50,8 @@ app = FastAPI(
     title="EcoAgent API",
     description="AI-Powered Sustainability Assistant for Environmental Impact Reduction",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure logging
@@ -77,7 +82,7 @@ class CarbonCalculationResponse(BaseModel):
     """Response for carbon footprint calculation."""
     user_id: str
     total_carbon_lbs: float
-    breakdown: Dict[str, float]
+    breakdown: Optional[Dict[str, float]] = None
     timestamp: datetime
 
 
@@ -97,7 +102,7 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.utcnow()}
 
 
-@app.post("/register", response_model=Dict[str, str])
+@app.post("/register", response_model=Dict[str, str], response_model_exclude_none=True)
 async def register_user(request: UserRegistrationRequest):
     """Register a new user."""
     try:
@@ -110,18 +115,18 @@ async def register_user(request: UserRegistrationRequest):
             'lifestyle_factors': request.lifestyle_factors
         }
         
-        success = db.save_user_profile(request.user_id, user_data)
+        success = await db.save_user_profile_async(request.user_id, user_data)
         if not success:
             raise HTTPException(status_code=500, detail="Failed to save user profile")
         
         return {"message": "User registered successfully", "user_id": request.user_id}
     
     except Exception as e:
-        logger.error(f"Error registering user {request.user_id}: {str(e)}")
+        logger.error("Error registering user %s: %s", request.user_id, e)
         raise HTTPException(status_code=500, detail="Registration failed")
 
 
-@app.get("/users/{user_id}", response_model=Dict[str, Any])
+@app.get("/users/{user_id}", response_model=Dict[str, Any], response_model_exclude_none=True)
 async def get_user_profile(user_id: str):
     """Retrieve user profile."""
     try:
@@ -130,62 +135,73 @@ async def get_user_profile(user_id: str):
             raise HTTPException(status_code=404, detail="User not found")
         return profile
     except Exception as e:
-        logger.error(f"Error getting profile for user {user_id}: {str(e)}")
+        logger.error("Error getting profile for user %s: %s", user_id, e)
         raise HTTPException(status_code=500, detail="Failed to retrieve user profile")
 
 
-@app.post("/carbon/calculate", response_model=CarbonCalculationResponse)
+@app.post("/carbon/calculate", response_model=CarbonCalculationResponse, response_model_exclude_none=True)
 async def calculate_carbon_footprint(request: CarbonCalculationRequest):
     """Calculate carbon footprint for a user."""
     try:
-        results = {}
+        transport_result = flight_result = energy_result = None
+        footprints = []
         
         if request.transportation:
             transport_result = transportation_carbon_tool.execute(
                 miles_driven=request.transportation['miles_driven'],
                 vehicle_mpg=request.transportation.get('vehicle_mpg', 25.0)
             )
-            results['transportation'] = transport_result
-            # Save to database
-            db.save_carbon_footprint(request.user_id, 'transportation', transport_result, request.transportation)
+            footprints.append({'user_id': request.user_id, 'carbon_type': 'transportation',
+                               'value': transport_result, 'context': request.transportation})
         
         if request.flight:
             flight_result = flight_carbon_tool.execute(
                 miles_flown=request.flight['miles_flown']
             )
-            results['flight'] = flight_result
-            # Save to database
-            db.save_carbon_footprint(request.user_id, 'flight', flight_result, request.flight)
+            footprints.append({'user_id': request.user_id, 'carbon_type': 'flight',
+                               'value': flight_result, 'context': request.flight})
         
         if request.energy:
             energy_result = home_energy_tool.execute(
                 kwh_used=request.energy['kwh_used'],
                 renewable_ratio=request.energy.get('renewable_ratio', 0.0)
             )
-            results['energy'] = energy_result
-            # Save to database
-            db.save_carbon_footprint(request.user_id, 'energy', energy_result, request.energy)
+            footprints.append({'user_id': request.user_id, 'carbon_type': 'energy',
+                               'value': energy_result, 'context': request.energy})
+        
+        # Save every component in one transaction
+        if not await db.save_carbon_footprint_batch_async(footprints):
+            logger.error("Failed to save %d carbon footprint records for user %s", len(footprints), request.user_id)
         
         # Calculate total
         total_result = total_carbon_tool.execute(
-            transportation_carbon=results.get('transportation'),
-            flight_carbon=results.get('flight'),
-            home_energy_carbon=results.get('energy')
+            transportation_carbon=transport_result or 0.0,
+            flight_carbon=flight_result or 0.0,
+            home_energy_carbon=energy_result or 0.0
         )
+        breakdown = {
+            key: value
+            for key, value in (
+                ('transportation', transport_result),
+                ('flight', flight_result),
+                ('energy', energy_result)
+            )
+            if value is not None
+        }
         
         return CarbonCalculationResponse(
             user_id=request.user_id,
             total_carbon_lbs=total_result['total_carbon'],
-            breakdown=results,
+            breakdown=breakdown or None,
             timestamp=datetime.utcnow()
         )
     
     except Exception as e:
-        logger.error(f"Error calculating carbon for user {request.user_id}: {str(e)}")
+        logger.error("Error calculating carbon for user %s: %s", request.user_id, e)
         raise HTTPException(status_code=500, detail="Carbon calculation failed")
 
 
-@app.post("/goals/create", response_model=Dict[str, str])
+@app.post("/goals/create", response_model=Dict[str, str], response_model_exclude_none=True)
 async def create_sustainability_goal(request: GoalCreationRequest):
     """Create a new sustainability goal."""
     try:
@@ -199,25 +215,25 @@ async def create_sustainability_goal(request: GoalCreationRequest):
             'status': 'in_progress'
         }
         
-        success = db.save_sustainability_goal(goal_data)
+        success = await db.save_sustainability_goal_async(goal_data)
         if not success:
             raise HTTPException(status_code=500, detail="Failed to save goal")
         
         return {"message": "Goal created successfully", "goal_id": goal_data['id']}
     
     except Exception as e:
-        logger.error(f"Error creating goal for user {request.user_id}: {str(e)}")
+        logger.error("Error creating goal for user %s: %s", request.user_id, e)
         raise HTTPException(status_code=500, detail="Goal creation failed")
 
 
-@app.get("/goals/{user_id}", response_model=Dict[str, Any])
+@app.get("/goals/{user_id}", response_model=Dict[str, Any], response_model_exclude_none=True)
 async def get_user_goals(user_id: str):
     """Retrieve all goals for a user."""
     try:
         goals = db.get_user_goals(user_id)
         return {"user_id": user_id, "goals": goals}
     except Exception as e:
-        logger.error(f"Error getting goals for user {user_id}: {str(e)}")
+        logger.error("Error getting goals for user %s: %s", user_id, e)
         raise HTTPException(status_code=500, detail="Failed to retrieve goals")
 
 
@@ -228,7 +244,7 @@ async def get_system_metrics():
         metrics = get_metrics_summary()
         return {"metrics": metrics, "timestamp": datetime.utcnow()}
     except Exception as e:
-        logger.error(f"Error getting metrics: {str(e)}")
+        logger.error("Error getting metrics: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve metrics")
 
 
@@ -239,7 +255,7 @@ async def log_user_interaction(user_id: str, session_id: str, query: str, respon
         log_interaction(user_id, session_id, query, response)
         return {"message": "Interaction logged successfully"}
     except Exception as e:
-        logger.error(f"Error logging interaction: {str(e)}")
+        logger.error("Error logging interaction: %s", e)
         raise HTTPException(status_code=500, detail="Failed to log interaction")
 
 
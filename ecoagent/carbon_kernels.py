@@ -0,0 +1,43 @@
+"""Compiled numeric kernels for EcoAgent carbon calculations.
+
+The kernels are JIT-compiled with Numba when it is installed (with an on-disk
+cache so the compiled code survives across CLI invocations) and run as plain
+Python otherwise.
+"""
+
+from ecoagent.emission_factors import CO2_PER_FLIGHT_MILE, CO2_PER_GALLON, CO2_PER_KWH
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def carbon_total(miles, mpg, flight_miles, kwh, renewable):
+    """
+    Calculate carbon emissions for one set of inputs.
+
+    Args:
+        miles: Miles driven
+        mpg: Vehicle fuel efficiency in miles per gallon (must be positive)
+        flight_miles: Miles flown
+        kwh: Kilowatt-hours of energy used
+        renewable: Fraction of energy from renewable sources (0.0 to 1.0)
+
+    Returns:
+        Tuple of (transportation, flight, energy, total) lbs CO2
+    """
+    trans = miles / mpg * CO2_PER_GALLON
+    flight = flight_miles * CO2_PER_FLIGHT_MILE
+    energy = kwh * (1.0 - renewable) * CO2_PER_KWH
+    return trans, flight, energy, trans + flight + energy
+
+
+def warm_up() -> None:
+    """Compile (or load from cache) the kernels so the first real call pays no JIT cost."""
+    carbon_total(1.0, 1.0, 1.0, 1.0, 0.0)
@@ -7,50 +7,126 @@ which helps users understand and reduce their environmental impact.
 
 import argparse
 import asyncio
-import json
 import sys
 import os
 import logging
 from typing import Dict, Any, Optional
 import datetime
-from ecoagent.main import get_app
-from ecoagent.agent import root_agent
-from ecoagent.config import config
-from ecoagent.database import db as ecoagent_db
-from ecoagent.models import CalculationRequest
+from functools import lru_cache
+from ecoagent.emission_factors import CO2_PER_FLIGHT_MILE, CO2_PER_GALLON, CO2_PER_KWH, DEFAULT_MPG
+
+logger = logging.getLogger(__name__)
+
+CLI_VERSION = "EcoAgent CLI 1.0.0"
+CHAT_HISTORY_FILE = "~/.ecoagent_history"
+
+_EPILOG = """
+Examples:
+  ecoagent carbon --transportation.miles_driven 500 --transportation.vehicle_mpg 25
+  ecoagent carbon --csv trips.csv
+  ecoagent recommend --profile.diet vegetarian --profile.location urban
+  ecoagent track --goal "Reduce carbon by 20%" --target_value 200.0
+  ecoagent --help
+"""
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Serialize ``obj`` to indented JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> str:
+        """Serialize ``obj`` to indented JSON."""
+        return json.dumps(obj, indent=2)
+
+# Breakdown keys, in the order the carbon kernels return their values
+CARBON_CATEGORIES = ("transportation", "flight", "energy")
+
+# Column order expected by ``ecoagent carbon --csv``
+CARBON_CSV_COLUMNS = ("miles_driven", "vehicle_mpg", "miles_flown", "kwh_used", "renewable_ratio")
+
+
+def calc_carbon_batch(rows):
+    """
+    Calculate carbon footprints for many records at once.
+
+    Args:
+        rows: Array of shape (N, 5) with columns ordered as CARBON_CSV_COLUMNS.
+            A non-positive vehicle_mpg falls back to DEFAULT_MPG.
+
+    Returns:
+        Array of shape (N, 4): transportation, flight, energy and total lbs CO2.
+    """
+    import numpy as np
+
+    rows = np.asarray(rows, dtype=np.float64).reshape(-1, len(CARBON_CSV_COLUMNS))
+    miles, mpg, flight_miles, kwh, renewable = rows.T
+
+    mpg = np.where(mpg > 0, mpg, DEFAULT_MPG)
+    trans = np.multiply(np.divide(miles, mpg), CO2_PER_GALLON)
+    flight = np.multiply(flight_miles, CO2_PER_FLIGHT_MILE)
+    energy = np.multiply(np.multiply(kwh, np.subtract(1.0, renewable)), CO2_PER_KWH)
+
+    categories = np.stack((trans, flight, energy), axis=1)
+    total = np.add.reduce(categories, axis=1)
+    return np.column_stack((categories, total))
 
 
 class EcoAgentCLI:
     """Command Line Interface for the EcoAgent system."""
 
     def __init__(self):
-        self.app = get_app()
+        self._app = None
         self.args = None
 
+    @property
+    def app(self):
+        """The EcoAgent application, created on first use.
+
+        Importing ``ecoagent.main`` pulls in the agents and the Gemini SDK, so
+        commands that don't need it (``info``, ``--help``) never pay for it.
+        """
+        if self._app is None:
+            from ecoagent.main import get_app
+            self._app = get_app()
+        return self._app
+
     def setup_parser(self) -> argparse.ArgumentParser:
-        """Set up the argument parser."""
-        parser = argparse.ArgumentParser(
-            description="EcoAgent: AI-Powered Sustainability Assistant",
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  ecoagent carbon --transportation.miles_driven 500 --transportation.vehicle_mpg 25
-  ecoagent recommend --profile.diet vegetarian --profile.location urban
-  ecoagent track --goal "Reduce carbon by 20%" --target_value 200.0
-  ecoagent --help
-            """
-        )
+        """Set up the argument parser (built once and shared, see _build_parser)."""
+        return _build_parser()
 
-        parser.add_argument(
-            '--version',
-            action='version',
-            version='EcoAgent CLI 1.0.0'
-        )
+    @staticmethod
+    def _enable_line_editing() -> None:
+        """Enable readline editing for the chat prompt, with history kept in ~/.ecoagent_history."""
+        try:
+            import readline
+        except ImportError:  # e.g. Windows without pyreadline
+            return
+        import atexit
 
-        subparsers = parser.add_subparsers(dest='command', help='Available commands')
+        history_path = os.path.expanduser(CHAT_HISTORY_FILE)
+        try:
+            readline.read_history_file(history_path)
+        except OSError:
+            pass
+        readline.set_history_length(1000)
+        atexit.register(readline.write_history_file, history_path)
+
+    @staticmethod
+    def _log_command_failure(cmd: str, args: argparse.Namespace) -> None:
+        """Log a failed command; the traceback is included only at DEBUG level."""
+        logger.error(
+            "%s_command_failed", cmd,
+            extra={"cmd": cmd, "user_id": getattr(args, 'user_id', None)},
+            exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
 
-        # Carbon footprint command
-        carbon_parser = subparsers.add_parser('carbon', help='Calculate carbon footprint')
+    @staticmethod
+    def _add_carbon_arguments(carbon_parser: argparse.ArgumentParser) -> None:
+        """Add the ``carbon`` subcommand's arguments to a parser."""
         carbon_parser.add_argument('--transportation.miles_driven', type=float, dest='trans_miles',
                                   help='Miles driven in transportation')
         carbon_parser.add_argument('--transportation.vehicle_mpg', type=float, dest='trans_mpg',
@@ -61,59 +137,33 @@ Examples:
                                   help='Kilowatt-hours of energy used')
         carbon_parser.add_argument('--energy.renewable_ratio', type=float, dest='energy_renewable',
                                   default=0.0, help='Fraction of energy from renewable sources (0.0 to 1.0)')
+        carbon_parser.add_argument('--csv', type=str, dest='csv_path',
+                                  help='CSV file of records to calculate in batch '
+                                       '(columns: ' + ', '.join(CARBON_CSV_COLUMNS) + ')')
         carbon_parser.add_argument('--user_id', type=str, default='cli_user', help='User identifier')
 
-        # Recommendation command
-        rec_parser = subparsers.add_parser('recommend', help='Get sustainability recommendations')
-        rec_parser.add_argument('--profile.name', type=str, dest='user_name', help='Your name')
-        rec_parser.add_argument('--profile.location', type=str, dest='user_location', help='Your location')
-        rec_parser.add_argument('--profile.housing_type', type=str, dest='housing_type',
-                               choices=['apartment', 'house', 'condo'], help='Type of housing')
-        rec_parser.add_argument('--profile.family_size', type=int, dest='family_size', default=1,
-                               help='Number of people in household')
-        rec_parser.add_argument('--profile.diet', type=str, dest='diet',
-                               choices=['omnivore', 'vegetarian', 'vegan', 'pescatarian'],
-                               help='Dietary preference')
-        rec_parser.add_argument('--goal', type=str, help='Sustainability goal to focus on')
-        rec_parser.add_argument('--user_id', type=str, default='cli_user', help='User identifier')
-
-        # Tracking command
-        track_parser = subparsers.add_parser('track', help='Track sustainability goals')
-        track_parser.add_argument('--goal', type=str, required=True, help='Goal description')
-        track_parser.add_argument('--target_value', type=float, required=True, help='Target value')
-        track_parser.add_argument('--current_value', type=float, default=0.0, help='Current progress value')
-        track_parser.add_argument('--user_id', type=str, default='cli_user', help='User identifier')
-
-        # Profile command
-        profile_parser = subparsers.add_parser('profile', help='Manage user profile')
-        profile_parser.add_argument('--action', type=str, choices=['get', 'update'],
-                                   default='get', help='Action to perform')
-        profile_parser.add_argument('--user_id', type=str, default='cli_user', help='User identifier')
-
-        # Chat command for direct conversation
-        chat_parser = subparsers.add_parser('chat', help='Chat with the EcoAgent')
-        chat_parser.add_argument('--user_id', type=str, default='cli_user', help='User identifier')
-        chat_parser.add_argument('--message', type=str, help='Message to send (interactive if not provided)')
-
-        # Server command to run API service
-        server_parser = subparsers.add_parser('serve', help='Run the EcoAgent API service')
-        server_parser.add_argument('--host', type=str, default='127.0.0.1', help='Host to bind to')
-        server_parser.add_argument('--port', type=int, default=8000, help='Port to run on')
-        server_parser.add_argument('--reload', action='store_true', help='Enable auto-reload (development)')
-
-        # Info command
-        subparsers.add_parser('info', help='Show system information')
-
-        return parser
+    def setup_carbon_parser(self) -> argparse.ArgumentParser:
+        """Set up a parser for just the ``carbon`` subcommand (CLI fast path)."""
+        carbon_parser = argparse.ArgumentParser(
+            prog='ecoagent carbon',
+            description='Calculate carbon footprint'
+        )
+        self._add_carbon_arguments(carbon_parser)
+        carbon_parser.set_defaults(command='carbon')
+        return carbon_parser
 
     async def run_carbon_command(self, args: argparse.Namespace) -> None:
         """Execute the carbon footprint calculation command."""
+        if getattr(args, 'csv_path', None):
+            self.run_carbon_batch_command(args)
+            return
+
         # Prepare carbon calculation data
         calc_data = {}
         if args.trans_miles is not None or args.trans_mpg is not None:
             calc_data['transportation'] = {
                 'miles_driven': args.trans_miles or 0,
-                'vehicle_mpg': args.trans_mpg or 25.0
+                'vehicle_mpg': args.trans_mpg or DEFAULT_MPG
             }
         if args.flight_miles is not None:
             calc_data['flight'] = {'miles_flown': args.flight_miles}
@@ -131,50 +181,42 @@ Examples:
         calc_data['user_id'] = args.user_id
 
         try:
-            # Simulate carbon calculation using internal functions
-            total_carbon = 0
-            breakdown = {}
-
-            # Calculate transportation carbon
-            if 'transportation' in calc_data:
-                trans_data = calc_data['transportation']
-                miles = trans_data['miles_driven']
-                mpg = trans_data['vehicle_mpg']
-                # Estimate: 19.6 lbs CO2 per gallon for gas, average car is ~24 MPG
-                gallons = miles / mpg
-                trans_carbon = gallons * 19.6
-                total_carbon += trans_carbon
-                breakdown['transportation'] = round(trans_carbon, 2)
-
-            # Calculate flight carbon
-            if 'flight' in calc_data:
-                flight_data = calc_data['flight']
-                miles = flight_data['miles_flown']
-                # Estimate: ~0.44 lbs CO2 per passenger-mile for flights
-                flight_carbon = miles * 0.44
-                total_carbon += flight_carbon
-                breakdown['flight'] = round(flight_carbon, 2)
-
-            # Calculate energy carbon
-            if 'energy' in calc_data:
-                energy_data = calc_data['energy']
-                kwh = energy_data['kwh_used']
-                renewable_ratio = energy_data.get('renewable_ratio', 0.0)
-                non_renewable_kwh = kwh * (1 - renewable_ratio)
-                # Estimate: ~0.954 lbs CO2 per kWh from grid
-                energy_carbon = non_renewable_kwh * 0.954
-                total_carbon += energy_carbon
-                breakdown['energy'] = round(energy_carbon, 2)
+            from ecoagent.carbon_kernels import carbon_total
+
+            trans_data = calc_data.get('transportation')
+            flight_data = calc_data.get('flight')
+            energy_data = calc_data.get('energy')
+
+            trans_carbon, flight_carbon, energy_carbon, total_carbon = carbon_total(
+                float(trans_data['miles_driven']) if trans_data else 0.0,
+                float(trans_data['vehicle_mpg']) if trans_data else DEFAULT_MPG,
+                float(flight_data['miles_flown']) if flight_data else 0.0,
+                float(energy_data['kwh_used']) if energy_data else 0.0,
+                float(energy_data.get('renewable_ratio', 0.0)) if energy_data else 0.0
+            )
+
+            # One pass over (category, value, present) tuples, rounding each value once
+            breakdown = {
+                category: round(value, 2)
+                for category, value, present in zip(
+                    CARBON_CATEGORIES,
+                    (trans_carbon, flight_carbon, energy_carbon),
+                    (trans_data, flight_data, energy_data)
+                )
+                if present
+            }
+            total_carbon = round(total_carbon, 2)
 
             print(f"\n🌱 Carbon Footprint Calculation Results:")
-            print(f"Total Carbon: {round(total_carbon, 2)} lbs CO2")
-            print(f"Breakdown: {json.dumps(breakdown, indent=2)}")
+            print(f"Total Carbon: {total_carbon} lbs CO2")
+            print(f"Breakdown: {_dumps(breakdown)}")
 
             # Save to database
-            success = ecoagent_db.save_carbon_footprint(
+            from ecoagent.database import db as ecoagent_db
+            success = await ecoagent_db.save_carbon_footprint_async(
                 user_id=args.user_id,
                 carbon_type='total_calculated',
-                value=round(total_carbon, 2),
+                value=total_carbon,
                 context=calc_data
             )
 
@@ -185,8 +227,40 @@ Examples:
 
         except Exception as e:
             print(f"❌ Error calculating carbon footprint: {e}")
-            import traceback
-            traceback.print_exc()
+            self._log_command_failure('carbon', args)
+
+    def run_carbon_batch_command(self, args: argparse.Namespace) -> None:
+        """Calculate carbon footprints for every record in a CSV file in one pass."""
+        try:
+            import numpy as np
+
+            rows = np.loadtxt(args.csv_path, delimiter=',', skiprows=1, ndmin=2)
+            results = calc_carbon_batch(rows)
+
+            print(f"\n🌱 Carbon Footprint Batch Results ({len(results)} records):")
+            print("  #  transportation   flight   energy    total (lbs CO2)")
+            for i, (trans, flight, energy, total) in enumerate(results.round(2).tolist(), 1):
+                print(f"{i:3d}  {trans:14.2f} {flight:8.2f} {energy:8.2f} {total:8.2f}")
+            print(f"Total Carbon: {round(float(results[:, 3].sum()), 2)} lbs CO2")
+
+            from ecoagent.database import db as ecoagent_db
+            saved = ecoagent_db.save_carbon_footprint_batch([
+                {
+                    'user_id': args.user_id,
+                    'carbon_type': 'total_calculated',
+                    'value': round(result[3], 2),
+                    'context': dict(zip(CARBON_CSV_COLUMNS, row))
+                }
+                for row, result in zip(rows.tolist(), results.tolist())
+            ])
+            if saved:
+                print(f"✅ {len(results)} results saved to your profile")
+            else:
+                print("⚠️  Note: Could not save results to profile")
+
+        except Exception as e:
+            print(f"❌ Error calculating carbon footprint batch: {e}")
+            self._log_command_failure('carbon_batch', args)
 
     async def run_recommend_command(self, args: argparse.Namespace) -> None:
         """Execute the recommendation command."""
@@ -194,11 +268,13 @@ Examples:
 
         try:
             # Build profile description for the agent
-            profile_desc = f"name: {args.user_name or 'User'}, "
-            profile_desc += f"location: {args.user_location or 'unknown'}, "
-            profile_desc += f"family_size: {args.family_size}, "
-            profile_desc += f"diet: {args.diet or 'omnivore'}, "
-            profile_desc += f"housing: {args.housing_type or 'unknown'}"
+            profile_desc = ", ".join((
+                f"name: {args.user_name or 'User'}",
+                f"location: {args.user_location or 'unknown'}",
+                f"family_size: {args.family_size}",
+                f"diet: {args.diet or 'omnivore'}",
+                f"housing: {args.housing_type or 'unknown'}"
+            ))
 
             goal_text = f" with a focus on {args.goal}" if args.goal else ""
 
@@ -224,8 +300,7 @@ Examples:
 
         except Exception as e:
             print(f"❌ Error generating recommendations: {e}")
-            import traceback
-            traceback.print_exc()
+            self._log_command_failure('recommend', args)
 
     async def run_track_command(self, args: argparse.Namespace) -> None:
         """Execute the tracking command."""
@@ -242,7 +317,8 @@ Examples:
             }
 
             # Save goal to database
-            success = ecoagent_db.save_sustainability_goal(goal_data)
+            from ecoagent.database import db as ecoagent_db
+            success = await ecoagent_db.save_sustainability_goal_async(goal_data)
             if success:
                 print(f"✅ Goal saved successfully:")
                 print(f"   Goal: {args.goal}")
@@ -253,11 +329,12 @@ Examples:
 
         except Exception as e:
             print(f"❌ Error tracking goal: {e}")
-            import traceback
-            traceback.print_exc()
+            self._log_command_failure('track', args)
 
     async def run_profile_command(self, args: argparse.Namespace) -> None:
         """Execute the profile command."""
+        from ecoagent.database import db as ecoagent_db
+
         if args.action == 'get':
             profile = ecoagent_db.get_user_profile(args.user_id)
             if profile:
@@ -271,6 +348,17 @@ Examples:
             print(f"🔄 Profile update functionality for {args.user_id} would go here")
             print("   (This would require additional parameters to update profile)")
 
+    async def _print_streamed_response(self, user_id: str, query: str) -> None:
+        """Print the agent's reply to ``query`` chunk by chunk as it arrives."""
+        print("EcoAgent: ", end="", flush=True)
+        async for chunk in self.app.stream_query(
+            user_id=user_id,
+            session_id=f"session_{user_id}",
+            query=query
+        ):
+            print(chunk, end="", flush=True)
+        print()
+
     async def run_chat_command(self, args: argparse.Namespace) -> None:
         """Execute the chat command."""
         # Initialize the app first
@@ -279,27 +367,22 @@ Examples:
         if args.message:
             # Process single message
             print(f"User: {args.message}")
-            print(" EcoAgent: Processing your query...")
 
             try:
-                # Call the actual agent through the app
-                response = await self.app.process_query(
-                    user_id=args.user_id,
-                    session_id=f"session_{args.user_id}",
-                    query=args.message
-                )
-                print(f"EcoAgent: {response}")
+                await self._print_streamed_response(args.user_id, args.message)
             except Exception as e:
-                print(f"❌ Error: {e}")
+                print(f"\n❌ Error: {e}")
         else:
             # Interactive chat
             print("🌱 EcoAgent Interactive Chat (type 'quit' or 'exit' to exit)")
             print("Ask about carbon footprint, sustainability tips, or environmental impact.")
             print("-" * 60)
+            self._enable_line_editing()
 
             while True:
                 try:
-                    user_input = input(f"{args.user_id}@ecoagent> ").strip()
+                    # Read in a worker thread so the event loop keeps running meanwhile
+                    user_input = (await asyncio.to_thread(input, f"{args.user_id}@ecoagent> ")).strip()
                     if user_input.lower() in ['quit', 'exit', 'q', 'bye']:
                         print(" EcoAgent: Thank you for using EcoAgent. Have a sustainable day! 🌱")
                         break
@@ -307,18 +390,11 @@ Examples:
                     if not user_input:
                         continue
 
-                    print(" EcoAgent: Processing...")
-
-                    # Call the actual agent through the app
+                    # Stream the agent's reply as it is generated
                     try:
-                        response = await self.app.process_query(
-                            user_id=args.user_id,
-                            session_id=f"session_{args.user_id}",
-                            query=user_input
-                        )
-                        print(f"EcoAgent: {response}")
+                        await self._print_streamed_response(args.user_id, user_input)
                     except Exception as e:
-                        print(f"EcoAgent: Sorry, I encountered an error: {e}")
+                        print(f"\nEcoAgent: Sorry, I encountered an error: {e}")
 
                 except KeyboardInterrupt:
                     print("\n\n EcoAgent: Thank you for using EcoAgent. Have a sustainable day! 🌱")
@@ -331,21 +407,48 @@ Examples:
         """Execute the serve command."""
         import uvicorn
         print(f"🚀 Starting EcoAgent API service on {args.host}:{args.port}")
+
+        # uvloop + httptools where available; Windows (or a missing extra)
+        # falls back to the stdlib asyncio loop and h11
+        loop, http = "asyncio", "h11"
+        if sys.platform != "win32":
+            try:
+                import uvloop  # noqa: F401
+                loop = "uvloop"
+            except ImportError:
+                pass
+            try:
+                import httptools  # noqa: F401
+                http = "httptools"
+            except ImportError:
+                pass
+
+        # reload=True only works with a single worker process
         if args.reload:
-            print("(Auto-reload enabled - development mode)")
+            workers = 1
+            print("(Auto-reload enabled - development mode, single worker)")
+        else:
+            # Each worker has its own in-memory database, sessions and
+            # metrics, so more than one is opt-in
+            workers = getattr(args, 'workers', None) or 1
 
-        # Import and run the API
-        from ecoagent.api import app as api_app
+        # Run the API; uvicorn needs an import string for reload/multiple workers
         uvicorn.run(
-            api_app,
+            "ecoagent.api:app",
             host=args.host,
             port=args.port,
             reload=args.reload,
+            workers=workers,
+            loop=loop,
+            http=http,
             log_level="info"
         )
 
     def run_info_command(self, args: argparse.Namespace) -> None:
         """Execute the info command."""
+        from ecoagent.config_lite import get_lite_config
+        config = get_lite_config()
+
         print("\n🌱 EcoAgent System Information:")
         print(f"  Version: 1.0.0")
         print(f"  Model: {config.default_model}")
@@ -386,7 +489,86 @@ Examples:
             parser.print_help()
             return
 
-        await self.run_command(args)
+        try:
+            await self.run_command(args)
+        finally:
+            # Stop the Gemini executor threads before the loop closes
+            if self._app is not None:
+                await self._app.shutdown()
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full CLI argument parser.
+
+    Cached so that repeated ``EcoAgentCLI.run()`` calls from a test harness or
+    an embedding service reuse one parser instead of rebuilding the tree.
+    """
+    parser = argparse.ArgumentParser(
+        description="EcoAgent: AI-Powered Sustainability Assistant",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
+    )
+
+    parser.add_argument(
+        '--version',
+        action='version',
+        version=CLI_VERSION
+    )
+
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    # Carbon footprint command
+    carbon_parser = subparsers.add_parser('carbon', help='Calculate carbon footprint')
+    EcoAgentCLI._add_carbon_arguments(carbon_parser)
+
+    # Recommendation command
+    rec_parser = subparsers.add_parser('recommend', help='Get sustainability recommendations')
+    rec_parser.add_argument('--profile.name', type=str, dest='user_name', help='Your name')
+    rec_parser.add_argument('--profile.location', type=str, dest='user_location', help='Your location')
+    rec_parser.add_argument('--profile.housing_type', type=str, dest='housing_type',
+                           choices=['apartment', 'house', 'condo'], help='Type of housing')
+    rec_parser.add_argument('--profile.family_size', type=int, dest='family_size', default=1,
+                           help='Number of people in household')
+    rec_parser.add_argument('--profile.diet', type=str, dest='diet',
+                           choices=['omnivore', 'vegetarian', 'vegan', 'pescatarian'],
+                           help='Dietary preference')
+    rec_parser.add_argument('--goal', type=str, help='Sustainability goal to focus on')
+    rec_parser.add_argument('--user_id', type=str, default='cli_user', help='User identifier')
+
+    # Tracking command
+    track_parser = subparsers.add_parser('track', help='Track sustainability goals')
+    track_parser.add_argument('--goal', type=str, required=True, help='Goal description')
+    track_parser.add_argument('--target_value', type=float, required=True, help='Target value')
+    track_parser.add_argument('--current_value', type=float, default=0.0, help='Current progress value')
+    track_parser.add_argument('--user_id', type=str, default='cli_user', help='User identifier')
+
+    # Profile command
+    profile_parser = subparsers.add_parser('profile', help='Manage user profile')
+    profile_parser.add_argument('--action', type=str, choices=['get', 'update'],
+                               default='get', help='Action to perform')
+    profile_parser.add_argument('--user_id', type=str, default='cli_user', help='User identifier')
+
+    # Chat command for direct conversation
+    chat_parser = subparsers.add_parser('chat', help='Chat with the EcoAgent')
+    chat_parser.add_argument('--user_id', type=str, default='cli_user', help='User identifier')
+    chat_parser.add_argument('--message', type=str, help='Message to send (interactive if not provided)')
+
+    # Server command to run API service
+    server_parser = subparsers.add_parser('serve', help='Run the EcoAgent API service')
+    server_parser.add_argument('--host', type=str, default='127.0.0.1', help='Host to bind to')
+    server_parser.add_argument('--port', type=int, default=8000, help='Port to run on')
+    server_parser.add_argument('--reload', action='store_true',
+                               help='Enable auto-reload (development; implies a single worker)')
+    server_parser.add_argument('--workers', type=int, default=1,
+                               help='Number of worker processes (default: 1). Workers do not share '
+                                    'state: each has its own database (in-memory by default), '
+                                    'sessions, delegation tracker and metrics')
+
+    # Info command
+    subparsers.add_parser('info', help='Show system information')
+
+    return parser
 
 
 def main():
@@ -396,7 +578,6 @@ def main():
     if 'LOG_LEVEL' not in os.environ:
         os.environ['LOG_LEVEL'] = 'WARNING'
 
-    import logging
     log_level = os.getenv("LOG_LEVEL", "WARNING")
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
@@ -404,8 +585,23 @@ def main():
     )
 
     cli = EcoAgentCLI()
-    parser = cli.setup_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    command = argv[0] if argv else None
+
+    # Fast paths: skip building the full argparse tree for the hot subcommands
+    if argv == ['--version']:
+        print(CLI_VERSION)
+        return
+    if argv == ['info']:
+        cli.run_info_command(argparse.Namespace(command='info'))
+        return
+
+    if command == 'carbon' and '-h' not in argv and '--help' not in argv:
+        parser = cli.setup_carbon_parser()
+        args = parser.parse_args(argv[1:])
+    else:
+        parser = cli.setup_parser()
+        args = parser.parse_args(argv)
 
     try:
         # Handle serve command synchronously (it creates its own event loop)
@@ -423,8 +619,8 @@ def main():
         sys.exit(0)
     except Exception as e:
         print(f"❌ Error running EcoAgent CLI: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error("cli_failed", extra={"cmd": args.command},
+                     exc_info=logger.isEnabledFor(logging.DEBUG))
         sys.exit(1)
 
 
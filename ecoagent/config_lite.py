@@ -0,0 +1,30 @@
+"""Lightweight configuration for fast CLI commands.
+
+Reads the handful of settings shown by ``ecoagent info`` straight from the
+environment, without importing pydantic or the Gemini SDK like
+``ecoagent.config`` does. Commands that need validated settings should keep
+using ``ecoagent.config.config``.
+"""
+
+import os
+from typing import NamedTuple, Optional
+
+# Defaults shared with ecoagent.config.AgentConfig
+DEFAULT_MODEL = "gemini-2.5-flash-lite"
+DEFAULT_ENVIRONMENT = "development"
+
+
+class LiteConfig(NamedTuple):
+    """Unvalidated subset of AgentConfig."""
+
+    default_model: str
+    environment: str
+    db_connection_string: Optional[str] = None
+
+
+def get_lite_config() -> LiteConfig:
+    """Build the lightweight configuration from environment variables."""
+    return LiteConfig(
+        default_model=DEFAULT_MODEL,
+        environment=os.environ.get("ECOAGENT_ENVIRONMENT", DEFAULT_ENVIRONMENT)
+    )
@@ -1,14 +1,38 @@
 """Database module for EcoAgent system with SQLite support."""
 
+import asyncio
 import sqlite3
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import count
 from typing import List, Dict, Any, Optional
 from contextlib import contextmanager
 import threading
 import os
 
 
+# Hot insert statements, kept as single constants so every call passes the
+# same SQL text and hits the connection's prepared-statement cache.
+_INSERT_USER_PROFILE_SQL = '''
+    INSERT OR REPLACE INTO user_profiles
+    (user_id, name, location, housing_type, family_size, lifestyle_factors)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+_INSERT_CARBON_FOOTPRINT_SQL = '''
+    INSERT INTO carbon_footprints (user_id, carbon_type, value, context)
+    VALUES (?, ?, ?, ?)
+'''
+_INSERT_SUSTAINABILITY_GOAL_SQL = '''
+    INSERT INTO sustainability_goals
+    (id, user_id, description, target_value, current_value, target_date, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Names for in-memory databases, unique per EcoAgentDB instance
+_MEMORY_DB_IDS = count()
+
+
 class EcoAgentDB:
     """Database interface for EcoAgent system."""
     
@@ -20,15 +44,36 @@ class EcoAgentDB:
             db_path: Path to the database file. If None, uses in-memory database.
         """
         self.db_path = db_path or ":memory:"
+        if self.db_path == ":memory:":
+            # Connections are per thread, so a plain :memory: database would be
+            # a separate, empty database in every thread. A named shared-cache
+            # database is one database for all of this instance's connections.
+            self._database = f"file:ecoagent-{next(_MEMORY_DB_IDS)}?mode=memory&cache=shared"
+            # SQLite drops the database with its last connection; this one keeps
+            # it alive even if the thread that created the tables exits
+            self._keepalive = sqlite3.connect(self._database, check_same_thread=False, uri=True)
+        else:
+            self._database = self.db_path
         self._local = threading.local()  # Thread-local storage for connections
+        # Async writes run here, one at a time, off the caller's event loop
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ecoagent-db-writer")
         self._init_db()
     
     @contextmanager
     def get_connection(self):
         """Get a database connection, creating one per thread if needed."""
         if not hasattr(self._local, 'connection'):
-            self._local.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-            self._local.connection.row_factory = sqlite3.Row  # Enable column access by name
+            connection = sqlite3.connect(self._database, check_same_thread=False, cached_statements=256, uri=True)
+            connection.row_factory = sqlite3.Row  # Enable column access by name
+            if self.db_path == ":memory:":
+                # Shared-cache readers would otherwise fail with "table is
+                # locked" while the writer thread holds a transaction
+                connection.execute('PRAGMA read_uncommitted=true')
+            else:
+                # WAL lets readers proceed during writes; NORMAL sync is safe under WAL
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
         try:
             yield self._local.connection
         except Exception:
@@ -181,11 +226,7 @@ class EcoAgentDB:
             try:
                 lifestyle_factors_json = json.dumps(profile_data.get('lifestyle_factors', {}))
                 
-                conn.execute('''
-                    INSERT OR REPLACE INTO user_profiles 
-                    (user_id, name, location, housing_type, family_size, lifestyle_factors)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
+                conn.execute(_INSERT_USER_PROFILE_SQL, (
                     user_id,
                     profile_data.get('name'),
                     profile_data.get('location'),
@@ -218,10 +259,26 @@ class EcoAgentDB:
             try:
                 context_json = json.dumps(context or {})
                 
-                conn.execute('''
-                    INSERT INTO carbon_footprints (user_id, carbon_type, value, context)
-                    VALUES (?, ?, ?, ?)
-                ''', (user_id, carbon_type, value, context_json))
+                conn.execute(_INSERT_CARBON_FOOTPRINT_SQL, (user_id, carbon_type, value, context_json))
+                return True
+            except Exception:
+                return False
+    
+    def save_carbon_footprint_batch(self, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Save many carbon footprint records in a single transaction.
+        
+        Args:
+            rows: Records with 'user_id', 'carbon_type', 'value' and optional 'context' keys.
+        """
+        if not rows:
+            return True
+        with self.get_connection() as conn:
+            try:
+                conn.executemany(_INSERT_CARBON_FOOTPRINT_SQL, [
+                    (row['user_id'], row['carbon_type'], row['value'], json.dumps(row.get('context') or {}))
+                    for row in rows
+                ])
                 return True
             except Exception:
                 return False
@@ -249,11 +306,7 @@ class EcoAgentDB:
         """Save sustainability goal."""
         with self.get_connection() as conn:
             try:
-                conn.execute('''
-                    INSERT INTO sustainability_goals
-                    (id, user_id, description, target_value, current_value, target_date, status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                conn.execute(_INSERT_SUSTAINABILITY_GOAL_SQL, (
                     goal_data['id'],
                     goal_data['user_id'],
                     goal_data['description'],
@@ -266,6 +319,26 @@ class EcoAgentDB:
             except Exception:
                 return False
 
+    async def _write_async(self, func, *args) -> bool:
+        """Run a synchronous write on the writer thread and await its result."""
+        return await asyncio.get_running_loop().run_in_executor(self._writer, func, *args)
+    
+    async def save_user_profile_async(self, user_id: str, profile_data: Dict[str, Any]) -> bool:
+        """Save a user profile without blocking the event loop."""
+        return await self._write_async(self.save_user_profile, user_id, profile_data)
+    
+    async def save_carbon_footprint_async(self, user_id: str, carbon_type: str, value: float, context: Optional[Dict[str, Any]] = None) -> bool:
+        """Save carbon footprint data without blocking the event loop."""
+        return await self._write_async(self.save_carbon_footprint, user_id, carbon_type, value, context)
+    
+    async def save_carbon_footprint_batch_async(self, rows: List[Dict[str, Any]]) -> bool:
+        """Save many carbon footprint records in one transaction without blocking the event loop."""
+        return await self._write_async(self.save_carbon_footprint_batch, rows)
+    
+    async def save_sustainability_goal_async(self, goal_data: Dict[str, Any]) -> bool:
+        """Save a sustainability goal without blocking the event loop."""
+        return await self._write_async(self.save_sustainability_goal, goal_data)
+
     def get_user_goals(self, user_id: str) -> List[Dict[str, Any]]:
         """Retrieve sustainability goals for a user."""
         with self.get_connection() as conn:
@@ -0,0 +1,19 @@
+"""Emission factors shared by the EcoAgent carbon calculations.
+
+Kept in a dependency-free module so the CLI can import them at startup and
+the Numba kernels treat them as compile-time constants.
+"""
+
+from typing import Final
+
+# lbs CO2 per gallon of gasoline burned
+CO2_PER_GALLON: Final = 19.6
+
+# lbs CO2 per passenger-mile flown (economy)
+CO2_PER_FLIGHT_MILE: Final = 0.44
+
+# lbs CO2 per kWh drawn from the grid
+CO2_PER_KWH: Final = 0.954
+
+# Fuel efficiency assumed when none is given (miles per gallon)
+DEFAULT_MPG: Final = 25.0
@@ -0,0 +1,25 @@
+"""Event loop selection for EcoAgent entry points.
+
+Kept in a dependency-free module so the MCP servers can pick a loop without
+importing the agents, the database or the Gemini SDK.
+"""
+
+import asyncio
+import sys
+
+
+def install_event_loop_policy() -> str:
+    """
+    Use uvloop's libuv-backed event loop when it is available.
+    
+    Falls back to the default asyncio loop on Windows or when uvloop is not
+    installed. Returns the name of the selected loop.
+    """
+    if sys.platform == "win32":
+        return "asyncio"
+    try:
+        import uvloop
+    except ImportError:
+        return "asyncio"
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return "uvloop"
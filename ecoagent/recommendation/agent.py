@@ -1,9 +1,109 @@
 """Recommendation Agent - Suggests personalized sustainable practices with advanced Gemini capabilities."""
 
+from types import MappingProxyType
+
 from google.adk import Agent
 from ecoagent.tools.memory import memorize, recall
 from ecoagent.advanced_tools import advanced_sustainability_analyzer, personalized_recommendation_generator
 
+# Recommendation entries are static, so every branch result is built once at
+# import. Entries are read-only proxies; callers get fresh dict copies.
+_WALK_BIKE = MappingProxyType({
+    "option": "Walk or Bike",
+    "impact": "Near zero carbon emissions, health benefits",
+    "feasibility": "High for short distances"
+})
+_PUBLIC_TRANSIT = MappingProxyType({
+    "option": "Public Transit",
+    "impact": "Significantly lower emissions than driving alone",
+    "feasibility": "Check local transit availability"
+})
+_ELECTRIC_VEHICLE = MappingProxyType({
+    "option": "Electric Vehicle",
+    "impact": "Zero direct emissions, lower overall emissions",
+    "feasibility": "Consider charging infrastructure"
+})
+_CARPOOLING = MappingProxyType({
+    "option": "Carpooling",
+    "impact": "Reduces per-person emissions by sharing rides",
+    "feasibility": "Coordinate with colleagues or neighbors"
+})
+
+# Keyed by (distance <= 3, distance <= 15)
+_TRANSPORT_TABLE = MappingProxyType({
+    (True, True): (_WALK_BIKE, _PUBLIC_TRANSIT, _ELECTRIC_VEHICLE, _CARPOOLING),
+    (False, True): (_PUBLIC_TRANSIT, _ELECTRIC_VEHICLE, _CARPOOLING),
+    (False, False): (_ELECTRIC_VEHICLE, _CARPOOLING),
+})
+
+_BASIC_ENERGY_IMPROVEMENTS = (
+    MappingProxyType({
+        "action": "Upgrade to LED lighting",
+        "benefit": "Uses 75% less energy than traditional bulbs",
+        "cost": "Low upfront cost",
+        "difficulty": "Easy DIY"
+    }),
+    MappingProxyType({
+        "action": "Install a programmable thermostat",
+        "benefit": "Can save 10-15% on heating/cooling costs",
+        "cost": "Moderate cost",
+        "difficulty": "Moderate installation"
+    }),
+)
+_HOUSE_ENERGY_IMPROVEMENTS = _BASIC_ENERGY_IMPROVEMENTS + (
+    MappingProxyType({
+        "action": "Improve insulation",
+        "benefit": "Significant long-term energy savings",
+        "cost": "Higher upfront cost",
+        "difficulty": "Professional installation recommended"
+    }),
+    MappingProxyType({
+        "action": "Consider solar panels",
+        "benefit": "Renewable energy source, potential for selling back to grid",
+        "cost": "High upfront cost but long-term savings",
+        "difficulty": "Professional installation required"
+    }),
+)
+_HOUSE_TYPES = frozenset(("house", "detached"))
+
+_MINIMIZE_PACKAGING = MappingProxyType({
+    "change": "Minimize packaging",
+    "impact": "Reduces waste generation",
+    "suggestion": "Buy in bulk, choose minimal packaging, bring reusable bags"
+})
+
+# Keyed by environmental concern; any other concern gets only the packaging tip
+_DIETARY_TABLE = MappingProxyType({
+    "carbon": (
+        MappingProxyType({
+            "change": "Reduce meat consumption",
+            "impact": "Animal agriculture contributes significantly to greenhouse gases",
+            "suggestion": "Try 'Meatless Mondays' or plant-based alternatives"
+        }),
+        MappingProxyType({
+            "change": "Choose locally sourced foods",
+            "impact": "Reduces transportation emissions",
+            "suggestion": "Shop at farmers markets or join a CSA"
+        }),
+        _MINIMIZE_PACKAGING,
+    ),
+    "water": (
+        MappingProxyType({
+            "change": "Reduce food waste",
+            "impact": "Significant water savings as food waste represents wasted water resources",
+            "suggestion": "Plan meals, store food properly, compost scraps"
+        }),
+        MappingProxyType({
+            "change": "Choose plant-based options",
+            "impact": "Plant-based foods generally require less water than animal products",
+            "suggestion": "Replace some animal products with plant proteins"
+        }),
+        _MINIMIZE_PACKAGING,
+    ),
+})
+_DEFAULT_DIETARY_CHANGES = (_MINIMIZE_PACKAGING,)
+
+
 # Custom functions for sustainability recommendations
 def suggest_transportation_alternatives(distance_miles: float) -> list:
     """
@@ -15,35 +115,7 @@ def suggest_transportation_alternatives(distance_miles: float) -> list:
     Returns:
         List of transportation alternatives with environmental impact
     """
-    alternatives = []
-
-    if distance_miles <= 3:
-        alternatives.append({
-            "option": "Walk or Bike",
-            "impact": "Near zero carbon emissions, health benefits",
-            "feasibility": "High for short distances"
-        })
-
-    if distance_miles <= 15:
-        alternatives.append({
-            "option": "Public Transit",
-            "impact": "Significantly lower emissions than driving alone",
-            "feasibility": "Check local transit availability"
-        })
-
-    alternatives.append({
-        "option": "Electric Vehicle",
-        "impact": "Zero direct emissions, lower overall emissions",
-        "feasibility": "Consider charging infrastructure"
-    })
-
-    alternatives.append({
-        "option": "Carpooling",
-        "impact": "Reduces per-person emissions by sharing rides",
-        "feasibility": "Coordinate with colleagues or neighbors"
-    })
-
-    return alternatives
+    return [dict(entry) for entry in _TRANSPORT_TABLE[(distance_miles <= 3, distance_miles <= 15)]]
 
 def suggest_energy_efficiency_improvements(home_type: str, current_energy_source: str) -> list:
     """
@@ -56,38 +128,9 @@ def suggest_energy_efficiency_improvements(home_type: str, current_energy_source
     Returns:
         List of energy efficiency improvements
     """
-    improvements = []
-
-    improvements.append({
-        "action": "Upgrade to LED lighting",
-        "benefit": "Uses 75% less energy than traditional bulbs",
-        "cost": "Low upfront cost",
-        "difficulty": "Easy DIY"
-    })
-
-    improvements.append({
-        "action": "Install a programmable thermostat",
-        "benefit": "Can save 10-15% on heating/cooling costs",
-        "cost": "Moderate cost",
-        "difficulty": "Moderate installation"
-    })
-
-    if home_type.lower() in ["house", "detached"]:
-        improvements.append({
-            "action": "Improve insulation",
-            "benefit": "Significant long-term energy savings",
-            "cost": "Higher upfront cost",
-            "difficulty": "Professional installation recommended"
-        })
-
-        improvements.append({
-            "action": "Consider solar panels",
-            "benefit": "Renewable energy source, potential for selling back to grid",
-            "cost": "High upfront cost but long-term savings",
-            "difficulty": "Professional installation required"
-        })
-
-    return improvements
+    if home_type.lower() in _HOUSE_TYPES:
+        return [dict(entry) for entry in _HOUSE_ENERGY_IMPROVEMENTS]
+    return [dict(entry) for entry in _BASIC_ENERGY_IMPROVEMENTS]
 
 def suggest_dietary_changes(environmental_concern: str) -> list:
     """
@@ -99,41 +142,7 @@ def suggest_dietary_changes(environmental_concern: str) -> list:
     Returns:
         List of dietary changes with impact
     """
-    changes = []
-
-    if environmental_concern == "carbon":
-        changes.append({
-            "change": "Reduce meat consumption",
-            "impact": "Animal agriculture contributes significantly to greenhouse gases",
-            "suggestion": "Try 'Meatless Mondays' or plant-based alternatives"
-        })
-
-        changes.append({
-            "change": "Choose locally sourced foods",
-            "impact": "Reduces transportation emissions",
-            "suggestion": "Shop at farmers markets or join a CSA"
-        })
-
-    if environmental_concern == "water":
-        changes.append({
-            "change": "Reduce food waste",
-            "impact": "Significant water savings as food waste represents wasted water resources",
-            "suggestion": "Plan meals, store food properly, compost scraps"
-        })
-
-        changes.append({
-            "change": "Choose plant-based options",
-            "impact": "Plant-based foods generally require less water than animal products",
-            "suggestion": "Replace some animal products with plant proteins"
-        })
-
-    changes.append({
-        "change": "Minimize packaging",
-        "impact": "Reduces waste generation",
-        "suggestion": "Buy in bulk, choose minimal packaging, bring reusable bags"
-    })
-
-    return changes
+    return [dict(entry) for entry in _DIETARY_TABLE.get(environmental_concern, _DEFAULT_DIETARY_CHANGES)]
 
 
 MODEL = "gemini-2.5-flash-lite"
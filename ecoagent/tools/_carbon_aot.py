@@ -0,0 +1,41 @@
+"""Ahead-of-time build of the scalar carbon calculator kernels.
+
+Numba's ``@njit`` kernels in ``carbon_calculator`` are compiled on first use
+(or loaded from the on-disk cache). Building them ahead of time removes even
+that cost for short-lived processes::
+
+    python -m ecoagent.tools._carbon_aot
+
+This writes the ``carbon_aot`` extension module next to this file;
+``carbon_calculator`` picks it up automatically when it is importable and
+falls back to the JIT kernels otherwise. Building needs a Numba release that
+still ships ``numba.pycc`` and a C compiler.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from ecoagent.emission_factors import CO2_PER_GALLON
+
+cc = CC("carbon_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export("trans_kernel", "f8(f8, f8)")
+def trans_kernel(miles, mpg):
+    return miles / mpg * CO2_PER_GALLON
+
+
+@cc.export("flight_kernel", "f8(f8, f8)")
+def flight_kernel(miles, factor):
+    return miles * factor
+
+
+@cc.export("home_kernel", "f8(f8, f8, f8)")
+def home_kernel(kwh, renewable, emission_factor):
+    return kwh * (1.0 - renewable) * emission_factor
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,41 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Cython build of the carbon calculator's scalar kernels.
+
+Optional; build in place with::
+
+    cythonize -i -3 ecoagent/tools/_carbon_ext.pyx
+
+``carbon_calculator`` picks these up when the extension is importable: the
+``*_kernel`` functions replace its Numba scalar kernels, and
+``calculate_transportation_carbon`` hands both its checks and the arithmetic
+to ``transportation_carbon`` in a single C call. The kernels are ``nogil`` so
+C-level callers can run them without holding the GIL.
+"""
+
+from ecoagent.emission_factors import CO2_PER_GALLON
+
+cdef double _CO2_PER_GALLON = CO2_PER_GALLON
+
+
+cpdef double trans_kernel(double miles, double mpg) noexcept nogil:
+    """miles / mpg * CO2_PER_GALLON, in lbs CO2 (mpg must be positive)."""
+    return miles / mpg * _CO2_PER_GALLON
+
+
+cpdef double flight_kernel(double miles, double factor) noexcept nogil:
+    """miles * per-mile class factor, in lbs CO2."""
+    return miles * factor
+
+
+cpdef double home_kernel(double kwh, double renewable, double emission_factor) noexcept nogil:
+    """Non-renewable kWh * source emission factor, in lbs CO2."""
+    return kwh * (1.0 - renewable) * emission_factor
+
+
+cpdef double transportation_carbon(double miles_driven, double vehicle_mpg) except? -1.0:
+    """Validated miles / mpg * CO2_PER_GALLON, in lbs CO2."""
+    if miles_driven < 0:
+        raise ValueError("Miles driven must be non-negative")
+    if vehicle_mpg <= 0:
+        raise ValueError("Vehicle MPG must be positive")
+    return trans_kernel(miles_driven, vehicle_mpg)
@@ -1,13 +1,205 @@
 """Enhanced carbon calculator tools with international unit support."""
 
 from google.adk.tools import FunctionTool
-from ecoagent.utils.unit_conversion import convert_units, normalize_distance_input, normalize_weight_input, normalize_energy_input, normalize_volume_input
+from ecoagent.utils.unit_conversion import (
+    DISTANCE_CONVERSIONS, ENERGY_CONVERSIONS, VOLUME_CONVERSIONS, WEIGHT_CONVERSIONS,
+    normalize_distance_input, normalize_weight_input, normalize_energy_input, normalize_volume_input
+)
 from ecoagent.models import CarbonFootprint
-from typing import Dict, Any
+from ecoagent.carbon_kernels import njit
+from ecoagent.emission_factors import CO2_PER_GALLON, CO2_PER_KWH
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, asdict
+from functools import lru_cache, wraps
+from time import time as _now
 import logging
+import sys
+
+import numpy as np
+
+try:
+    import numexpr as ne
+except ImportError:  # pragma: no cover - numexpr is optional
+    ne = None
 
 logger = logging.getLogger(__name__)
 
+# Emission factors vary by class (business/first have higher emissions per passenger mile)
+_FLIGHT_FACTORS: Dict[str, float] = {
+    "economy": 0.44,  # Average lbs CO2 per passenger mile for economy
+    "premium_economy": 0.50,
+    "business": 0.66,  # Higher for business class
+    "first": 0.88      # Highest for first class
+}
+
+# Multipliers on the grid emission factor by energy source
+_SOURCE_FACTORS: Dict[str, float] = {
+    "grid": 1.0,
+    "solar": 0.1,  # Much lower emissions accounting for manufacturing
+    "wind": 0.05,   # Very low operational emissions
+    "hydro": 0.08,   # Low emissions with some methane from reservoirs
+    "coal": 1.5,     # High emissions
+    "natural_gas": 0.9,  # Medium emissions
+    "nuclear": 0.05  # Very low emissions
+}
+
+# Grid emission factor times the source multiplier, precomputed per source
+# (lbs CO2 per non-renewable kWh)
+_FUSED_EMISSION: Dict[str, float] = {
+    source: CO2_PER_KWH * factor for source, factor in _SOURCE_FACTORS.items()
+}
+
+# Breakdown keys for calculate_total_carbon, in argument order
+_CARBON_SOURCES = ("transportation", "flight", "home_energy")
+
+# Batch arrays are single precision: the emission factors carry three
+# significant digits, and the array kernels are memory-bound, so halving the
+# bytes per element roughly halves their run time.
+_BATCH_DTYPE = np.float32
+_CO2_PER_GALLON_BATCH = _BATCH_DTYPE(CO2_PER_GALLON)
+_ONE_BATCH = _BATCH_DTYPE(1.0)
+
+# The same tables for the batch calculators: names are encoded to small ints
+# so the per-row factor lookup is a single np.take over a contiguous array.
+_FLIGHT_CLASS_INDEX = {name: i for i, name in enumerate(_FLIGHT_FACTORS)}
+_FLIGHT_FACTOR_ARR = np.fromiter(_FLIGHT_FACTORS.values(), dtype=_BATCH_DTYPE)
+
+_ENERGY_SOURCE_INDEX = {name: i for i, name in enumerate(_FUSED_EMISSION)}
+_FUSED_EMISSION_ARR = np.fromiter(_FUSED_EMISSION.values(), dtype=_BATCH_DTYPE)
+
+
+# Unit families recognised by convert_units_with_context: each unit maps to
+# the index of its family's message in _CAT_MSG
+_UNIT_FAMILIES = (
+    (('miles', 'kilometers', 'meters', 'feet', 'yards'),
+     "Distance conversion between imperial and metric systems."),
+    (('pounds', 'kilograms', 'grams', 'ounces'),
+     "Weight conversion between imperial and metric systems."),
+    (('kwh', 'kilowatt_hours', 'megajoules', 'btu', 'calories'),
+     "Energy conversion between different energy measurement systems."),
+    (('gallons', 'liters', 'cubic_meters', 'milliliters'),
+     "Volume conversion between imperial and metric systems."),
+)
+_UNIT_TO_CATEGORY = {unit: cat for cat, (units, _) in enumerate(_UNIT_FAMILIES) for unit in units}
+_CAT_MSG = tuple(message for _, message in _UNIT_FAMILIES)
+
+# Direct conversion ratios keyed by (from_unit, to_unit)
+_CONVERSIONS = {**DISTANCE_CONVERSIONS, **WEIGHT_CONVERSIONS, **ENERGY_CONVERSIONS, **VOLUME_CONVERSIONS}
+
+# Arithmetic kernels, compiled by Numba when it is installed. Validation and
+# logging stay in the Python wrappers below.
+@njit(cache=True, fastmath=True)
+def _trans_kernel(miles, mpg):
+    return miles / mpg * CO2_PER_GALLON
+
+
+@njit(cache=True, fastmath=True)
+def _flight_kernel(miles, factor):
+    return miles * factor
+
+
+@njit(cache=True, fastmath=True)
+def _home_kernel(kwh, renewable, emission_factor):
+    return kwh * (1.0 - renewable) * emission_factor
+
+
+# Prefer the ahead-of-time compiled kernels when they have been built
+# (python -m ecoagent.tools._carbon_aot): no JIT work even on the first call.
+try:
+    from ecoagent.tools.carbon_aot import (
+        flight_kernel as _flight_kernel,
+        home_kernel as _home_kernel,
+        trans_kernel as _trans_kernel,
+    )
+except ImportError:
+    pass
+
+# The Cython build (cythonize -i -3 ecoagent/tools/_carbon_ext.pyx) takes
+# precedence over both, and also fuses the transportation tool's validation
+# and arithmetic into one C call.
+try:
+    from ecoagent.tools._carbon_ext import (
+        flight_kernel as _flight_kernel,
+        home_kernel as _home_kernel,
+        trans_kernel as _trans_kernel,
+        transportation_carbon as _transportation_carbon_ext,
+    )
+except ImportError:
+    _transportation_carbon_ext = None
+
+
+def warm_up() -> None:
+    """Compile (or load from cache) the scalar kernels behind the carbon tools."""
+    _trans_kernel(1.0, 1.0)
+    _flight_kernel(1.0, 1.0)
+    _home_kernel(1.0, 0.0, 1.0)
+
+
+# Array kernels: with parallel=True Numba splits these array expressions
+# across cores; without Numba they are ordinary vectorized NumPy.
+@njit(cache=True, fastmath=True, parallel=True)
+def _trans_kernel_batch(miles, mpg):
+    return miles / mpg * _CO2_PER_GALLON_BATCH
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _flight_kernel_batch(miles, factors):
+    return miles * factors
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _home_kernel_batch(kwh, renewable, emission_factors):
+    return kwh * (_ONE_BATCH - renewable) * emission_factors
+
+
+# Optional GPU kernels for offline aggregation over millions of records.
+# One thread per row; the flight factor table lives in constant memory.
+try:
+    from numba import cuda
+    _CUDA_AVAILABLE = cuda.is_available()
+except ImportError:  # pragma: no cover - numba is optional
+    _CUDA_AVAILABLE = False
+
+_CUDA_THREADS_PER_BLOCK = 256
+
+if _CUDA_AVAILABLE:
+    @cuda.jit
+    def _trans_kernel_cuda(miles, mpg, out):
+        i = cuda.grid(1)
+        if i < miles.size:
+            out[i] = miles[i] / mpg[i] * _CO2_PER_GALLON_BATCH
+
+    @cuda.jit
+    def _flight_kernel_cuda(miles, class_idx, out):
+        factors = cuda.const.array_like(_FLIGHT_FACTOR_ARR)
+        i = cuda.grid(1)
+        if i < miles.size:
+            out[i] = miles[i] * factors[class_idx[i]]
+
+
+def _cuda_blocks(size: int) -> int:
+    return (size + _CUDA_THREADS_PER_BLOCK - 1) // _CUDA_THREADS_PER_BLOCK
+
+
+@lru_cache(maxsize=32)
+def _norm_class(name: str) -> str:
+    """Lowercase and intern a flight class or energy source name.
+
+    Agents use a tiny vocabulary, so after the first call per spelling this
+    skips the lower() allocation, and the interned result matches the
+    (compiler-interned) table keys by identity in the dict lookup.
+    """
+    return sys.intern(name.lower())
+
+
+def _encode(names: Optional[List[str]], index: Dict[str, int], size: int) -> np.ndarray:
+    """Encode category names to int8 table indices; unknown or missing names map to 0."""
+    if names is None:
+        return np.zeros(size, dtype=np.int8)
+    if len(names) != size:
+        raise ValueError("All batch inputs must have the same length")
+    return np.fromiter((index.get(_norm_class(name), 0) for name in names), dtype=np.int8, count=size)
+
 def calculate_transportation_carbon(miles_driven: float, vehicle_mpg: float, tool_context=None) -> float:
     """
     Calculate carbon emissions from transportation based on miles driven and vehicle efficiency.
@@ -20,17 +212,18 @@ def calculate_transportation_carbon(miles_driven: float, vehicle_mpg: float, too
     Returns:
         Carbon emissions in pounds of CO2
     """
-    if miles_driven < 0:
-        raise ValueError("Miles driven must be non-negative")
-    if vehicle_mpg <= 0:
-        raise ValueError("Vehicle MPG must be positive")
-    
-    # Average of 19.6 lbs CO2 per gallon for gasoline
-    gallons_used = miles_driven / vehicle_mpg
-    carbon_lbs = gallons_used * 19.6
-    carbon_lbs = round(carbon_lbs, 2)
+    if _transportation_carbon_ext is not None:
+        carbon_lbs = _transportation_carbon_ext(miles_driven, vehicle_mpg)
+    else:
+        if miles_driven < 0:
+            raise ValueError("Miles driven must be non-negative")
+        if vehicle_mpg <= 0:
+            raise ValueError("Vehicle MPG must be positive")
+        
+        # Average of 19.6 lbs CO2 per gallon for gasoline
+        carbon_lbs = _trans_kernel(miles_driven, vehicle_mpg)
     
-    logger.info(f"Transportation carbon: {miles_driven} miles @ {vehicle_mpg} MPG = {carbon_lbs} lbs CO2")
+    logger.info("Transportation carbon: %s miles @ %s MPG = %.2f lbs CO2", miles_driven, vehicle_mpg, carbon_lbs)
     
     return carbon_lbs
 
@@ -49,19 +242,10 @@ def calculate_flight_carbon(miles_flown: float, flight_class: str = "economy", t
     if miles_flown < 0:
         raise ValueError("Miles flown must be non-negative")
     
-    # Emission factors vary by class (business/first have higher emissions per passenger mile)
-    emission_factors = {
-        "economy": 0.44,  # Average lbs CO2 per passenger mile for economy
-        "premium_economy": 0.50,
-        "business": 0.66,  # Higher for business class
-        "first": 0.88      # Highest for first class
-    }
+    factor = _FLIGHT_FACTORS.get(_norm_class(flight_class), 0.44)
+    carbon_lbs = _flight_kernel(miles_flown, factor)
     
-    factor = emission_factors.get(flight_class.lower(), 0.44)
-    carbon_lbs = miles_flown * factor
-    carbon_lbs = round(carbon_lbs, 2)
-    
-    logger.info(f"Flight carbon: {miles_flown} miles, {flight_class} class = {carbon_lbs} lbs CO2")
+    logger.info("Flight carbon: %s miles, %s class = %.2f lbs CO2", miles_flown, flight_class, carbon_lbs)
     
     return carbon_lbs
 
@@ -80,32 +264,49 @@ def calculate_home_energy_carbon(kwh_used: float, renewable_ratio: float = 0.0,
     """
     if kwh_used < 0:
         raise ValueError("kWh used must be non-negative")
-    if not 0 <= renewable_ratio <= 1:
+    if not 0.0 <= renewable_ratio <= 1.0:
         raise ValueError("Renewable ratio must be between 0 and 1")
     
-    # Emission factor varies by source (in lbs CO2 per kWh)
-    base_emission_factor = 0.954  # Average lbs CO2 per kWh from the grid
-    
-    # Adjust factor based on source
-    source_factors = {
-        "grid": 1.0,
-        "solar": 0.1,  # Much lower emissions accounting for manufacturing
-        "wind": 0.05,   # Very low operational emissions
-        "hydro": 0.08,   # Low emissions with some methane from reservoirs
-        "coal": 1.5,     # High emissions
-        "natural_gas": 0.9,  # Medium emissions
-        "nuclear": 0.05  # Very low emissions
-    }
+    # Grid emission factor (0.954 lbs CO2 per kWh) already adjusted for the source
+    emission_factor = _FUSED_EMISSION.get(_norm_class(energy_source), CO2_PER_KWH)
+    carbon_lbs = _home_kernel(kwh_used, renewable_ratio, emission_factor)
     
-    source_factor = source_factors.get(energy_source.lower(), 1.0)
-    non_renewable_kwh = kwh_used * (1 - renewable_ratio)
-    carbon_lbs = non_renewable_kwh * base_emission_factor * source_factor
-    carbon_lbs = round(carbon_lbs, 2)
-    
-    logger.info(f"Home energy carbon: {kwh_used} kWh from {energy_source} with {renewable_ratio*100}% renewable = {carbon_lbs} lbs CO2")
+    logger.info("Home energy carbon: %s kWh from %s with %s%% renewable = %.2f lbs CO2",
+                kwh_used, energy_source, renewable_ratio * 100, carbon_lbs)
     
     return carbon_lbs
 
+@dataclass(slots=True, frozen=True)
+class TotalCarbonResult:
+    """Total carbon footprint with its non-zero per-source breakdown (lbs CO2)."""
+    total_carbon: float
+    breakdown: Dict[str, float]
+    timestamp: float
+
+def total_carbon_result(transportation_carbon: float = 0, flight_carbon: float = 0, home_energy_carbon: float = 0) -> TotalCarbonResult:
+    """
+    Combine per-source carbon into a TotalCarbonResult.
+    
+    Used directly by Python callers aggregating many footprints; the
+    calculate_total_carbon tool converts it to a dict for ADK.
+    
+    Args:
+        transportation_carbon: Carbon from transportation (lbs CO2)
+        flight_carbon: Carbon from flights (lbs CO2)
+        home_energy_carbon: Carbon from home energy (lbs CO2)
+        
+    Returns:
+        TotalCarbonResult with the rounded total and breakdown
+    """
+    values = (transportation_carbon, flight_carbon, home_energy_carbon)
+    breakdown = {name: round(float(value), 2) for name, value in zip(_CARBON_SOURCES, values) if value}
+    
+    return TotalCarbonResult(
+        round(transportation_carbon + flight_carbon + home_energy_carbon, 2),
+        breakdown,
+        _now()
+    )
+
 def calculate_total_carbon(transportation_carbon: float = 0, flight_carbon: float = 0, home_energy_carbon: float = 0, tool_context=None) -> Dict[str, Any]:
     """
     Calculate total carbon footprint from multiple sources.
@@ -119,26 +320,200 @@ def calculate_total_carbon(transportation_carbon: float = 0, flight_carbon: floa
     Returns:
         Dictionary with total carbon and breakdown
     """
-    total_carbon = transportation_carbon + flight_carbon + home_energy_carbon
+    result = total_carbon_result(transportation_carbon, flight_carbon, home_energy_carbon)
+    
+    logger.info("Total carbon: %s lbs CO2 from %d sources", result.total_carbon, len(result.breakdown))
     
-    breakdown = {}
-    if transportation_carbon != 0:
-        breakdown['transportation'] = transportation_carbon
-    if flight_carbon != 0:
-        breakdown['flight'] = flight_carbon
-    if home_energy_carbon != 0:
-        breakdown['home_energy'] = home_energy_carbon
+    return asdict(result)
+
+def _rounded_list(values: np.ndarray) -> List[float]:
+    """Round float32 batch results to two decimals, as the scalar tools do, for Python callers."""
+    return np.round(values.astype(np.float64), 2).tolist()
+
+def calculate_total_carbon_batch(transportation_carbon: List[float], flight_carbon: Optional[List[float]] = None, home_energy_carbon: Optional[List[float]] = None, tool_context=None) -> Dict[str, Any]:
+    """
+    Calculate the total carbon footprint of many records at once.
+    
+    Args:
+        transportation_carbon: Carbon from transportation for each record (lbs CO2)
+        flight_carbon: Carbon from flights for each record (defaults to 0)
+        home_energy_carbon: Carbon from home energy for each record (defaults to 0)
+        tool_context: ADK tool context (injected by ADK)
+        
+    Returns:
+        Dictionary with the overall total, per-source breakdown and per-record totals
+    """
+    trans = np.asarray(transportation_carbon, dtype=_BATCH_DTYPE)
+    columns = np.zeros((len(_CARBON_SOURCES), trans.size), dtype=_BATCH_DTYPE)
+    columns[0] = trans
+    for row, column in enumerate((flight_carbon, home_energy_carbon), start=1):
+        if column is not None:
+            values = np.asarray(column, dtype=_BATCH_DTYPE)
+            if values.shape != trans.shape:
+                raise ValueError("All batch inputs must have the same length")
+            columns[row] = values
+    
+    source_totals = np.add.reduce(columns, axis=1)
+    if ne is not None:
+        record_totals = ne.evaluate("t + f + h", local_dict=dict(zip("tfh", columns)))
+    else:
+        record_totals = np.add.reduce(columns, axis=0)
+    nonzero = source_totals != 0
+    breakdown = dict(zip(np.asarray(_CARBON_SOURCES)[nonzero].tolist(), _rounded_list(source_totals[nonzero])))
     
     result = {
-        'total_carbon': round(total_carbon, 2),
+        'total_carbon': round(float(np.add.reduce(source_totals)), 2),
         'breakdown': breakdown,
-        'timestamp': __import__('time').time()
+        'record_totals': _rounded_list(record_totals),
+        'timestamp': _now()
     }
     
-    logger.info(f"Total carbon: {result['total_carbon']} lbs CO2 from {len(breakdown)} sources")
+    logger.info("Total carbon batch: %s lbs CO2 over %d records", result['total_carbon'], trans.size)
     
     return result
 
+def calculate_transportation_carbon_batch(miles_driven: List[float], vehicle_mpg: List[float], tool_context=None) -> List[float]:
+    """
+    Calculate transportation carbon emissions for many trips at once.
+    
+    Args:
+        miles_driven: Miles driven for each trip
+        vehicle_mpg: Miles per gallon of the vehicle for each trip
+        tool_context: ADK tool context (injected by ADK)
+        
+    Returns:
+        Carbon emissions in pounds of CO2 for each trip, rounded to 2 decimals
+    """
+    miles = np.asarray(miles_driven, dtype=_BATCH_DTYPE)
+    mpg = np.asarray(vehicle_mpg, dtype=_BATCH_DTYPE)
+    if miles.shape != mpg.shape:
+        raise ValueError("All batch inputs must have the same length")
+    if np.any(miles < 0):
+        raise ValueError("Miles driven must be non-negative")
+    if np.any(mpg <= 0):
+        raise ValueError("Vehicle MPG must be positive")
+    
+    carbon = _trans_kernel_batch(miles, mpg)
+    
+    logger.info("Transportation carbon batch: %d trips", carbon.size)
+    
+    return _rounded_list(carbon)
+
+def calculate_flight_carbon_batch(miles_flown: List[float], flight_classes: Optional[List[str]] = None, tool_context=None) -> List[float]:
+    """
+    Calculate flight carbon emissions for many flights at once.
+    
+    Args:
+        miles_flown: Miles flown for each flight
+        flight_classes: Class of each flight (defaults to economy for all)
+        tool_context: ADK tool context (injected by ADK)
+        
+    Returns:
+        Carbon emissions in pounds of CO2 for each flight, rounded to 2 decimals
+    """
+    miles = np.asarray(miles_flown, dtype=_BATCH_DTYPE)
+    if np.any(miles < 0):
+        raise ValueError("Miles flown must be non-negative")
+    
+    class_idx = _encode(flight_classes, _FLIGHT_CLASS_INDEX, miles.size)
+    carbon = _flight_kernel_batch(miles, np.take(_FLIGHT_FACTOR_ARR, class_idx))
+    
+    logger.info("Flight carbon batch: %d flights", carbon.size)
+    
+    return _rounded_list(carbon)
+
+def calculate_home_energy_carbon_batch(kwh_used: List[float], renewable_ratio: Optional[List[float]] = None, energy_sources: Optional[List[str]] = None, tool_context=None) -> List[float]:
+    """
+    Calculate home energy carbon emissions for many records at once.
+    
+    Args:
+        kwh_used: Kilowatt-hours of energy used for each record
+        renewable_ratio: Fraction of renewable energy for each record (defaults to 0.0)
+        energy_sources: Energy source for each record (defaults to grid)
+        tool_context: ADK tool context (injected by ADK)
+        
+    Returns:
+        Carbon emissions in pounds of CO2 for each record, rounded to 2 decimals
+    """
+    kwh = np.asarray(kwh_used, dtype=_BATCH_DTYPE)
+    if renewable_ratio is None:
+        renewable = np.zeros_like(kwh)
+    else:
+        renewable = np.asarray(renewable_ratio, dtype=_BATCH_DTYPE)
+        if renewable.shape != kwh.shape:
+            raise ValueError("All batch inputs must have the same length")
+    if np.any(kwh < 0):
+        raise ValueError("kWh used must be non-negative")
+    if np.any((renewable < 0) | (renewable > 1)):
+        raise ValueError("Renewable ratio must be between 0 and 1")
+    
+    source_idx = _encode(energy_sources, _ENERGY_SOURCE_INDEX, kwh.size)
+    carbon = _home_kernel_batch(kwh, renewable, np.take(_FUSED_EMISSION_ARR, source_idx))
+    
+    logger.info("Home energy carbon batch: %d records", carbon.size)
+    
+    return _rounded_list(carbon)
+
+def calculate_transportation_carbon_cuda(miles_driven, vehicle_mpg):
+    """
+    Calculate transportation carbon for large arrays on a CUDA GPU.
+    
+    Intended for aggregation pipelines rather than agent tool calls: inputs
+    are not validated, and CUDA device arrays are used in place (and the
+    result left on the device). Falls back to the CPU batch kernel when no
+    GPU is available.
+    
+    Args:
+        miles_driven: Array of miles driven (host or CUDA device array)
+        vehicle_mpg: Array of vehicle miles per gallon, same length
+        
+    Returns:
+        Array of carbon emissions in pounds of CO2
+    """
+    if not _CUDA_AVAILABLE:
+        return _trans_kernel_batch(np.asarray(miles_driven, dtype=_BATCH_DTYPE), np.asarray(vehicle_mpg, dtype=_BATCH_DTYPE))
+    
+    out = cuda.device_array(len(miles_driven), dtype=_BATCH_DTYPE)
+    _trans_kernel_cuda[_cuda_blocks(out.size), _CUDA_THREADS_PER_BLOCK](miles_driven, vehicle_mpg, out)
+    return out
+
+def calculate_flight_carbon_cuda(miles_flown, flight_classes: Optional[List[str]] = None):
+    """
+    Calculate flight carbon for large arrays on a CUDA GPU.
+    
+    See calculate_transportation_carbon_cuda; the class names are encoded on
+    the host and looked up against the constant-memory factor table.
+    
+    Args:
+        miles_flown: Array of miles flown (host or CUDA device array)
+        flight_classes: Class of each flight (defaults to economy for all)
+        
+    Returns:
+        Array of carbon emissions in pounds of CO2
+    """
+    class_idx = _encode(flight_classes, _FLIGHT_CLASS_INDEX, len(miles_flown))
+    if not _CUDA_AVAILABLE:
+        return _flight_kernel_batch(np.asarray(miles_flown, dtype=_BATCH_DTYPE), np.take(_FLIGHT_FACTOR_ARR, class_idx))
+    
+    out = cuda.device_array(len(miles_flown), dtype=_BATCH_DTYPE)
+    _flight_kernel_cuda[_cuda_blocks(out.size), _CUDA_THREADS_PER_BLOCK](miles_flown, class_idx, out)
+    return out
+
+@lru_cache(maxsize=128)
+def _conversion_factor(from_unit: str, to_unit: str) -> float:
+    """Return the multiplier from one lowercase unit to another.
+
+    Agents convert the same few unit pairs over and over, so the table
+    lookup (and reverse-pair division) is done once per pair.
+    """
+    if from_unit == to_unit:
+        return 1.0
+    if (from_unit, to_unit) in _CONVERSIONS:
+        return _CONVERSIONS[from_unit, to_unit]
+    if (to_unit, from_unit) in _CONVERSIONS:
+        return 1.0 / _CONVERSIONS[to_unit, from_unit]
+    raise ValueError(f"Conversion from {from_unit} to {to_unit} is not supported")
+
 def convert_units_with_context(from_value: float, from_unit: str, to_unit: str, tool_context=None) -> Dict[str, Any]:
     """
     Convert between different units with additional context about the conversion.
@@ -153,71 +528,58 @@ def convert_units_with_context(from_value: float, from_unit: str, to_unit: str,
         Dictionary with conversion result and contextual information
     """
     try:
+        fu = from_unit.lower()
+        tu = to_unit.lower()
+        
         # Perform the unit conversion
-        converted_value = convert_units(from_value, from_unit, to_unit)
+        converted_value = round(from_value * _conversion_factor(fu, tu), 6)
         
         # Add contextual information about the units
         context_info = f"Converted {from_value} {from_unit} to {converted_value} {to_unit}. "
         
         # Add specific context based on unit types
-        distance_units = ['miles', 'kilometers', 'meters', 'feet', 'yards']
-        weight_units = ['pounds', 'kilograms', 'grams', 'ounces']
-        energy_units = ['kwh', 'kilowatt_hours', 'megajoules', 'btu', 'calories']
-        volume_units = ['gallons', 'liters', 'cubic_meters', 'milliliters']
-        
-        if from_unit.lower() in distance_units and to_unit.lower() in distance_units:
-            context_info += "Distance conversion between imperial and metric systems."
-        elif from_unit.lower() in weight_units and to_unit.lower() in weight_units:
-            context_info += "Weight conversion between imperial and metric systems."
-        elif from_unit.lower() in energy_units and to_unit.lower() in energy_units:
-            context_info += "Energy conversion between different energy measurement systems."
-        elif from_unit.lower() in volume_units and to_unit.lower() in volume_units:
-            context_info += "Volume conversion between imperial and metric systems."
+        fc = _UNIT_TO_CATEGORY.get(fu, -1)
+        if fc >= 0 and fc == _UNIT_TO_CATEGORY.get(tu, -1):
+            context_info += _CAT_MSG[fc]
         else:
             context_info += "Unit conversion between different measurement systems."
         
         return {
             "original_value": from_value,
             "original_unit": from_unit,
-            "converted_value": round(converted_value, 6),
+            "converted_value": converted_value,
             "converted_unit": to_unit,
             "contextual_info": context_info
         }
     except Exception as e:
-        logger.error(f"Unit conversion error: {str(e)}")
+        logger.error("Unit conversion error: %s", e)
         raise ValueError(f"Unable to convert from {from_unit} to {to_unit}: {str(e)}")
 
 # Create tool definitions using FunctionTool which extracts metadata from function signature and docstring
-transportation_carbon_tool = FunctionTool(
-    func=calculate_transportation_carbon,
-    require_confirmation=False
-)
-
-flight_carbon_tool = FunctionTool(
-    func=calculate_flight_carbon,
-    require_confirmation=False
-)
-
-home_energy_tool = FunctionTool(
-    func=calculate_home_energy_carbon,
-    require_confirmation=False
-)
-
-total_carbon_tool = FunctionTool(
-    func=calculate_total_carbon,
-    require_confirmation=False
-)
+def _rounded(func):
+    """Wrap a scalar calculator so agents get its result as a 2-decimal float."""
+    @wraps(func)
+    def tool(*args, **kwargs):
+        return round(float(func(*args, **kwargs)), 2)
+    return tool
 
-unit_converter_tool = FunctionTool(
-    func=convert_units_with_context,
-    require_confirmation=False
+# The batch and CUDA calculators stay Python-only: their float32 results
+# are for bulk scoring, not for showing to the model or the user
+_TOOL_FUNCS = (
+    _rounded(calculate_transportation_carbon),
+    _rounded(calculate_flight_carbon),
+    _rounded(calculate_home_energy_carbon),
+    calculate_total_carbon,
+    convert_units_with_context
 )
 
 # List of all carbon calculation tools
-carbon_calculation_tools = [
+carbon_calculation_tools = [FunctionTool(func=func, require_confirmation=False) for func in _TOOL_FUNCS]
+
+(
     transportation_carbon_tool,
     flight_carbon_tool,
     home_energy_tool,
     total_carbon_tool,
     unit_converter_tool
-]
\ No newline at end of file
+) = carbon_calculation_tools
@@ -1,20 +1,126 @@
 """Delegation tracking and user notification tools for A2A communication."""
 
+import atexit
 import logging
+import threading
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import count, islice
+from time import monotonic, time_ns
 from typing import Dict, Any, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Most recent delegations kept overall and per user; older records are dropped
+_HISTORY_LIMIT = 10000
+_USER_HISTORY_LIMIT = 1000
+
+
+def _iso(ns: int) -> str:
+    """Format a time.time_ns() value as a local ISO-8601 timestamp."""
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+@dataclass(slots=True)
+class DelegationRecord:
+    """A single delegation. Timestamps stay integer nanoseconds until to_dict()."""
+    id: int
+    timestamp_ns: int
+    user_id: str
+    from_agent: str
+    to_agent: str
+    task: str
+    notification: str
+    status: str = "initiated"
+    completion_timestamp_ns: Optional[int] = None
+    result_summary: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the record with ISO timestamps for callers and tool output."""
+        return {
+            "id": self.id,
+            "timestamp": _iso(self.timestamp_ns),
+            "user_id": self.user_id,
+            "from_agent": self.from_agent,
+            "to_agent": self.to_agent,
+            "task": self.task,
+            "notification": self.notification,
+            "status": self.status,
+            "completion_timestamp": _iso(self.completion_timestamp_ns) if self.completion_timestamp_ns is not None else None,
+            "result_summary": self.result_summary
+        }
+
+class _LogBatcher:
+    """Buffers delegation log entries and emits each batch as a single log record.
+    
+    A batch is written once ``flush_at`` entries are queued or ``max_age``
+    seconds after its first entry, whichever comes first, so entries are
+    never held back for long on a quiet server.
+    """
+    
+    def __init__(self, flush_at: int = 64, capacity: int = 256, max_age: float = 5.0):
+        self._pending: deque = deque(maxlen=capacity)
+        self._flush_at = flush_at
+        self._max_age = max_age
+        self._last_flush = monotonic()
+        self._timer: Optional[threading.Timer] = None
+        self._timer_lock = threading.Lock()
+    
+    def push(self, from_agent: str, to_agent: str, user_id: str, task: str):
+        """Queue one delegation entry, flushing when the batch is full or old enough."""
+        self._pending.append((from_agent, to_agent, user_id, task))
+        if len(self._pending) >= self._flush_at or monotonic() - self._last_flush >= self._max_age:
+            self.flush()
+            return
+        
+        # Make sure a quiet period still gets this entry out within max_age
+        with self._timer_lock:
+            if self._timer is None:
+                self._timer = threading.Timer(self._max_age, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def flush(self):
+        """Emit all queued entries as one INFO record."""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._last_flush = monotonic()
+        entries = []
+        while self._pending:
+            try:
+                entries.append(self._pending.popleft())
+            except IndexError:
+                break
+        if entries:
+            logger.info(
+                "Delegations logged (%d):\n%s",
+                len(entries),
+                "\n".join("%s -> %s | User: %s | Task: %s" % entry for entry in entries)
+            )
+
 class DelegationTracker:
     """Tracks and manages agent delegations for observability and user notification."""
     
     def __init__(self):
-        self.delegations = []
+        self.delegations: deque = deque(maxlen=_HISTORY_LIMIT)
         self.user_notifications = {}
+        # Ids come from a counter rather than len(self.delegations) so concurrent
+        # callers never share one; all state changes happen under _lock
+        self._id_gen = count()
+        self._lock = threading.Lock()
+        self._by_id: Dict[int, DelegationRecord] = {}
+        # Indexes maintained on insert so history and stats never scan self.delegations
+        self._by_user: Dict[str, deque] = defaultdict(lambda: deque(maxlen=_USER_HISTORY_LIMIT))
+        self._by_agent_counter: Counter = Counter()
+        self._by_user_agent_counter: Dict[str, Counter] = defaultdict(Counter)
+        self._log_batch = _LogBatcher()
     
     def log_delegation(self, user_id: str, from_agent: str, to_agent: str, 
-                      task: str, notification: str) -> Dict[str, Any]:
+                      task: str, notification: str) -> DelegationRecord:
         """
         Log a delegation and prepare user notification.
         
@@ -26,32 +132,36 @@ class DelegationTracker:
             notification: Message to show user
             
         Returns:
-            Delegation record
+            Delegation record; timestamps are formatted only by to_dict(),
+            which the history readers call
         """
-        record = {
-            "id": len(self.delegations),  # Track record by index
-            "timestamp": datetime.now().isoformat(),
-            "user_id": user_id,
-            "from_agent": from_agent,
-            "to_agent": to_agent,
-            "task": task,
-            "notification": notification,
-            "status": "initiated",
-            "completion_timestamp": None,
-            "result_summary": None
-        }
-        self.delegations.append(record)
-        
-        # Store notification for user
-        if user_id not in self.user_notifications:
-            self.user_notifications[user_id] = []
-        self.user_notifications[user_id].append(notification)
+        record = DelegationRecord(
+            id=next(self._id_gen),
+            timestamp_ns=time_ns(),
+            user_id=user_id,
+            from_agent=from_agent,
+            to_agent=to_agent,
+            task=task,
+            notification=notification
+        )
+        with self._lock:
+            if len(self.delegations) == self.delegations.maxlen:
+                self._by_id.pop(self.delegations[0].id, None)
+            self.delegations.append(record)
+            self._by_id[record.id] = record
+            self._by_user[user_id].append(record)
+            self._by_agent_counter[to_agent] += 1
+            self._by_user_agent_counter[user_id][to_agent] += 1
+            
+            # Store notification for user
+            self.user_notifications.setdefault(user_id, []).append(notification)
         
-        logger.info(f"Delegation logged: {from_agent} -> {to_agent} | User: {user_id} | Task: {task}")
+        if logger.isEnabledFor(logging.INFO):
+            self._log_batch.push(from_agent, to_agent, user_id, task)
         
         return record
     
-    def mark_delegation_complete(self, delegation_id: int, result_summary: str = None) -> Dict[str, Any]:
+    def mark_delegation_complete(self, delegation_id: int, result_summary: str = None) -> Optional[DelegationRecord]:
         """
         Mark a delegation as completed.
         
@@ -60,37 +170,71 @@ class DelegationTracker:
             result_summary: Summary of the delegation results
             
         Returns:
-            Updated delegation record
+            Updated delegation record, or None for an unknown id
         """
-        if 0 <= delegation_id < len(self.delegations):
-            record = self.delegations[delegation_id]
-            record["status"] = "completed"
-            record["completion_timestamp"] = datetime.now().isoformat()
-            record["result_summary"] = result_summary
-            logger.info(f"Delegation completed: {record['from_agent']} -> {record['to_agent']} | User: {record['user_id']}")
+        with self._lock:
+            record = self._by_id.get(delegation_id)
+            if record is not None:
+                record.status = "completed"
+                record.completion_timestamp_ns = time_ns()
+                record.result_summary = result_summary
+        if record is not None:
+            logger.info("Delegation completed: %s -> %s | User: %s", record.from_agent, record.to_agent, record.user_id)
             return record
         return None
     
+    def flush_logs(self):
+        """Write out delegation log entries still waiting in the batch."""
+        self._log_batch.flush()
+    
     def get_user_notifications(self, user_id: str) -> list:
         """Get pending notifications for a user."""
-        return self.user_notifications.get(user_id, [])
+        with self._lock:
+            return list(self.user_notifications.get(user_id, []))
     
     def clear_user_notifications(self, user_id: str):
         """Clear notifications for a user after displaying them."""
-        if user_id in self.user_notifications:
-            self.user_notifications[user_id] = []
+        with self._lock:
+            if user_id in self.user_notifications:
+                self.user_notifications[user_id] = []
     
     def get_delegation_history(self, user_id: str = None, limit: int = 10) -> list:
-        """Get delegation history, optionally filtered by user."""
-        if user_id:
-            history = [d for d in self.delegations if d["user_id"] == user_id]
-        else:
-            history = self.delegations
+        """Get delegation history, optionally filtered by user, oldest first."""
+        with self._lock:
+            history = self._by_user.get(user_id, ()) if user_id else self.delegations
+            if limit:
+                history = list(islice(reversed(history), limit))
+                history.reverse()
+            else:
+                history = list(history)
         
-        return history[-limit:] if limit else history
+        return [record.to_dict() for record in history]
+    
+    def count_by_agent(self, user_id: str = None) -> Dict[str, int]:
+        """Get delegation counts per target agent, optionally for one user."""
+        with self._lock:
+            if user_id:
+                return dict(self._by_user_agent_counter.get(user_id, ()))
+            return dict(self._by_agent_counter)
 
 # Global delegation tracker
 delegation_tracker = DelegationTracker()
+atexit.register(delegation_tracker.flush_logs)
+
+# User-facing delegation messages per target agent
+_NOTIFICATION_TEMPLATES = {
+    "carbon_calculator_agent": "I'm delegating this to our carbon footprint specialist who will provide detailed calculations for {reason}.",
+    "recommendation_agent": "I'm passing this to our recommendation specialist to provide personalized sustainability advice on {reason}.",
+    "progress_tracker_agent": "I'm delegating this to our progress tracking specialist to help you monitor and celebrate your {reason}.",
+    "community_agent": "I'm connecting you with our community specialist who can help with {reason}."
+}
+_DEFAULT_NOTIFICATION = "I'm delegating this to a specialist to help with {reason}."
+
+
+@lru_cache(maxsize=512)
+def _build_notification(delegated_to: str, reason: str) -> str:
+    """Format the notification for an agent/reason pair; repeats are served from cache."""
+    return _NOTIFICATION_TEMPLATES.get(delegated_to, _DEFAULT_NOTIFICATION).format(reason=reason)
 
 def notify_user_of_delegation(delegated_to: str, reason: str, tool_context=None) -> str:
     """
@@ -107,19 +251,9 @@ def notify_user_of_delegation(delegated_to: str, reason: str, tool_context=None)
     user_id = getattr(tool_context, 'user_id', 'user') if tool_context else 'user'
     
     # Create appropriate notification based on agent
-    notifications = {
-        "carbon_calculator_agent": f"I'm delegating this to our carbon footprint specialist who will provide detailed calculations for {reason}.",
-        "recommendation_agent": f"I'm passing this to our recommendation specialist to provide personalized sustainability advice on {reason}.",
-        "progress_tracker_agent": f"I'm delegating this to our progress tracking specialist to help you monitor and celebrate your {reason}.",
-        "community_agent": f"I'm connecting you with our community specialist who can help with {reason}."
-    }
-    
-    notification = notifications.get(
-        delegated_to, 
-        f"I'm delegating this to a specialist to help with {reason}."
-    )
+    notification = _build_notification(delegated_to, reason)
     
-    # Log the delegation
+    # Log the delegation; its batched log entry also records this notification
     delegation_tracker.log_delegation(
         user_id=user_id,
         from_agent="root_agent",
@@ -128,8 +262,6 @@ def notify_user_of_delegation(delegated_to: str, reason: str, tool_context=None)
         notification=notification
     )
     
-    logger.info(f"User notification: {user_id} | {delegated_to} | {reason}")
-    
     return notification
 
 def log_delegation_completion(user_id: str, from_agent: str, to_agent: str, 
@@ -145,10 +277,10 @@ def log_delegation_completion(user_id: str, from_agent: str, to_agent: str,
         tool_context: ADK tool context
         
     Returns:
-        Completion record
+        Completion record; the timestamp is left as time.time_ns() nanoseconds
     """
     completion = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp_ns": time_ns(),
         "user_id": user_id,
         "from_agent": from_agent,
         "to_agent": to_agent,
@@ -156,7 +288,7 @@ def log_delegation_completion(user_id: str, from_agent: str, to_agent: str,
         "status": "completed"
     }
     
-    logger.info(f"Delegation completed: {from_agent} <- {to_agent} | User: {user_id}")
+    logger.info("Delegation completed: %s <- %s | User: %s", from_agent, to_agent, user_id)
     
     return completion
 
@@ -171,17 +303,13 @@ def get_delegation_stats(user_id: str = None, tool_context=None) -> Dict[str, An
     Returns:
         Delegation statistics
     """
-    history = delegation_tracker.get_delegation_history(user_id)
+    by_agent = delegation_tracker.count_by_agent(user_id)
     
     stats = {
-        "total_delegations": len(history),
-        "by_agent": {},
-        "recent_delegations": history[-5:] if history else [],
+        "total_delegations": sum(by_agent.values()),
+        "by_agent": by_agent,
+        "recent_delegations": delegation_tracker.get_delegation_history(user_id, limit=5),
         "pending_notifications": delegation_tracker.get_user_notifications(user_id) if user_id else []
     }
     
-    for record in history:
-        agent = record["to_agent"]
-        stats["by_agent"][agent] = stats["by_agent"].get(agent, 0) + 1
-    
     return stats
@@ -1,12 +1,18 @@
 """Gemini Google Search grounding for EcoAgent system to provide real-time environmental information."""
 
-from typing import Dict, Any, List, Optional
+from time import time as _now
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 import logging
 from ecoagent.config import config
 from google.adk.tools import FunctionTool
 
 logger = logging.getLogger(__name__)
 
+# Read-only tool configurations shared by every caller
+_EMPTY_CFG: Mapping[str, Any] = MappingProxyType({})
+_SEARCH_CFG: Mapping[str, Any] = MappingProxyType({"google_search": MappingProxyType({})})
+
 
 class GeminiSearchGrounding:
     """
@@ -26,25 +32,22 @@ class GeminiSearchGrounding:
             logger.warning("Google API key not found. Google Search grounding will be disabled.")
         else:
             logger.info("Gemini Google Search grounding is enabled.")
+        
+        # Settings are fixed after construction, so availability is computed once
+        self._available = bool(self.enabled and self.api_key)
     
     def is_available(self) -> bool:
         """Check if Google Search grounding is available."""
-        return self.enabled and self.api_key is not None
+        return self._available
     
-    def get_search_tool_config(self) -> Dict[str, Any]:
+    def get_search_tool_config(self) -> Mapping[str, Any]:
         """
         Get the Google Search tool configuration for Gemini API.
         
         Returns:
-            Dictionary with google_search tool configuration for use with Gemini API
+            Read-only mapping with google_search tool configuration for use with Gemini API
         """
-        if not self.is_available():
-            return {}
-        
-        # Return the google_search tool configuration for Gemini
-        return {
-            "google_search": {}
-        }
+        return _SEARCH_CFG if self._available else _EMPTY_CFG
 
 
 # Global instance
@@ -70,7 +73,7 @@ def search_environmental_info(query: str, tool_context=None) -> Dict[str, Any]:
         "grounding_available": search_grounding.is_available(),
         "note": "Search is handled by Gemini's built-in google_search tool. "
                 "Enable Google Search in your API calls to get live web results.",
-        "timestamp": __import__('time').time()
+        "timestamp": _now()
     }
 
 
@@ -94,7 +97,7 @@ def get_local_environmental_resources(location: str, resource_type: str = "gener
         "grounding_available": search_grounding.is_available(),
         "note": "Ask Gemini directly for location-based resources. It will search for "
                 f"'{resource_type}' resources in {location} using Google Search.",
-        "timestamp": __import__('time').time()
+        "timestamp": _now()
     }
 
 
@@ -115,7 +118,7 @@ def get_latest_environmental_news(topic: str = "climate change", tool_context=No
         "topic": topic,
         "grounding_available": search_grounding.is_available(),
         "note": f"Ask Gemini for latest news about '{topic}'. It will retrieve current information.",
-        "timestamp": __import__('time').time()
+        "timestamp": _now()
     }
 
 
@@ -136,7 +139,7 @@ def get_sustainability_practice_info(practice: str, tool_context=None) -> Dict[s
         "practice": practice,
         "grounding_available": search_grounding.is_available(),
         "note": f"Ask Gemini about '{practice}'. It will find current best practices and effectiveness data.",
-        "timestamp": __import__('time').time()
+        "timestamp": _now()
     }
 
 
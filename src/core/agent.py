@@ -47,9 +47,19 @@ from ecoagent.tools.delegation import (
     get_delegation_stats
 )
 from datetime import datetime
+from typing import Tuple
 
 logger = logging.getLogger(__name__)
 
+def _ctx_ids(tool_context) -> Tuple[str, str]:
+    """Return ``(user_id, session_id)`` from an ADK tool context, defaulting to 'unknown'."""
+    if tool_context is None:
+        return ("unknown", "unknown")
+    return (
+        tool_context.user_id if hasattr(tool_context, "user_id") else "unknown",
+        tool_context.session_id if hasattr(tool_context, "session_id") else "unknown"
+    )
+
 def welcome_new_user(user_name: str) -> str:
     """
     Generate a personalized welcome message for new users.
@@ -125,13 +135,13 @@ def delegate_with_notification(recipient_agent: str, task_description: str, reas
     Returns:
         User-friendly delegation notification message
     """
-    user_id = getattr(tool_context, 'user_id', 'unknown') if tool_context else 'unknown'
+    user_id, _ = _ctx_ids(tool_context)
     
     # Step 1: Notify user about delegation
     notification = notify_user_of_delegation(recipient_agent, reason, tool_context)
     
     # Step 2: Log delegation initiation
-    logger.info(f"Delegation initiated: {user_id} -> {recipient_agent} for {reason}")
+    logger.info("Delegation initiated: %s -> %s for %s", user_id, recipient_agent, reason)
     
     return notification
 
@@ -148,18 +158,19 @@ def a2a_communicator(recipient: str, message: str, context=None, tool_context=No
     Returns:
         Response from the recipient agent
     """
+    user_id, session_id = _ctx_ids(tool_context)
     return {
         "status": "sent",
         "recipient": recipient,
         "message": message,
         "context": context or {},
         "sender_context": {
-            "user_id": getattr(tool_context, 'user_id', 'unknown'),
-            "session_id": getattr(tool_context, 'session_id', 'unknown')
+            "user_id": user_id,
+            "session_id": session_id
         }
     }
 
-# Create A2A-enhanced agents
+# Create A2A-enhanced agents (built once; later calls return the same agents)
 a2a_agents = create_a2a_enhanced_agents()
 
 # Get the A2A communicator
@@ -399,4 +410,4 @@ root_agent = Agent(
         log_delegation_completion,
         get_delegation_stats
     ]
-    )
\ No newline at end of file
+)
\ No newline at end of file
@@ -4,6 +4,7 @@ import os
 from typing import Optional
 from pydantic import BaseModel, Field
 from google.genai.types import GenerationConfig
+from ecoagent.config_lite import DEFAULT_MODEL, DEFAULT_ENVIRONMENT
 
 
 class AgentConfig(BaseModel):
@@ -13,7 +14,7 @@ class AgentConfig(BaseModel):
     google_api_key: Optional[str] = Field(default=None, description="Google API Key for Gemini")
 
     # Model Configuration
-    default_model: str = Field(default="gemini-2.5-flash-lite", description="Default model for agents")
+    default_model: str = Field(default=DEFAULT_MODEL, description="Default model for agents")
 
     # Generation Configuration
     generation_config: GenerationConfig = Field(
@@ -25,13 +26,16 @@ class AgentConfig(BaseModel):
         )
     )
 
+    # Concurrency Configuration
+    llm_concurrency: int = Field(default=16, ge=1, description="Maximum concurrent Gemini calls (worker threads)")
+
     # Tool Configuration
     enable_advanced_tools: bool = Field(default=True, description="Enable advanced AI tools")
     enable_memory: bool = Field(default=True, description="Enable memory features")
     enable_google_search: bool = Field(default=True, description="Enable Gemini Google Search grounding for real-time information")
 
     # Environment Configuration
-    environment: str = Field(default="development", description="Environment: development, staging, production")
+    environment: str = Field(default=DEFAULT_ENVIRONMENT, description="Environment: development, staging, production")
 
     # Database Configuration (for persistence)
     db_connection_string: Optional[str] = Field(default=None, description="Database connection string")
@@ -52,8 +56,9 @@ def get_config() -> AgentConfig:
 
     return AgentConfig(
         google_api_key=api_key,
-        environment=os.getenv("ECOAGENT_ENVIRONMENT", "development"),
-        enable_google_search=enable_google_search
+        environment=os.getenv("ECOAGENT_ENVIRONMENT", DEFAULT_ENVIRONMENT),
+        enable_google_search=enable_google_search,
+        llm_concurrency=int(os.getenv("ECOAGENT_LLM_CONCURRENCY", "16"))
     )
 
 
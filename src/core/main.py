@@ -1,24 +1,37 @@
 """Main EcoAgent application with proper configuration and error handling."""
 
 import os
+import sys
+import signal
 import asyncio
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Dict, Any, AsyncIterator, Optional
 from ecoagent.agent import root_agent
 from ecoagent.config import config
 from ecoagent.errors import error_service, EcoAgentException
 from ecoagent.observability import ecoagent_logger, metrics_collector, log_interaction, get_metrics_summary
 from ecoagent.database import db
+from ecoagent.event_loop import install_event_loop_policy
 import logging
 
+# Marks the end of a streamed response on the chunk queue
+_STREAM_END = object()
+
 
 class EcoAgentApp:
     """Main application class for the EcoAgent system."""
     
     def __init__(self):
         self.root_agent = root_agent
+        self._system_prompt = root_agent.instruction
         self.started = False
         self.logger = ecoagent_logger
         self.metrics = metrics_collector
+        self._stop_event: Optional[asyncio.Event] = None
+        self._model = None
+        self._llm_executor: Optional[ThreadPoolExecutor] = None
+        self._model_name: Optional[str] = None
         
     async def initialize(self) -> bool:
         """Initialize the application."""
@@ -28,11 +41,23 @@ class EcoAgentApp:
             # Verify configuration
             if not config.google_api_key:
                 self.logger.logger.warning("No Google API key found. Gemini functionality may be limited.")
+            else:
+                try:
+                    self._get_model()
+                except Exception as model_err:
+                    self.logger.logger.warning(f"Gemini model could not be prepared: {model_err}")
             
             # Test database connection
             if hasattr(db, 'get_user_profile'):
                 self.logger.logger.info("Database connection verified.")
             
+            # Persistent worker threads for blocking Gemini calls
+            if self._llm_executor is None:
+                self._llm_executor = ThreadPoolExecutor(
+                    max_workers=config.llm_concurrency,
+                    thread_name_prefix="gemini"
+                )
+            
             # Log initialization
             self.logger.log_metric(
                 metric_name="app_initialized",
@@ -53,6 +78,29 @@ class EcoAgentApp:
             )
             return False
     
+    def _get_model(self):
+        """
+        Return the cached Gemini model, building it on first use.
+        
+        ``genai.configure`` and the ``GenerativeModel`` construction run once;
+        the model is rebuilt only if ``config.default_model`` changes.
+        """
+        if self._model is None or self._model_name != config.default_model:
+            import google.generativeai as genai
+            genai.configure(api_key=config.google_api_key)
+            self._model = genai.GenerativeModel(
+                config.default_model,
+                system_instruction=self._system_prompt
+            )
+            self._model_name = config.default_model
+        return self._model
+    
+    async def shutdown(self) -> None:
+        """Stop the Gemini worker threads."""
+        if self._llm_executor is not None:
+            self._llm_executor.shutdown(wait=False, cancel_futures=True)
+            self._llm_executor = None
+    
     async def process_query(self, user_id: str, session_id: str, query: str) -> str:
         """Process a user query through the agent system."""
         if not self.started:
@@ -61,27 +109,18 @@ class EcoAgentApp:
                 error_type="CONFIGURATION_ERROR"
             )
         
-        start_time = asyncio.get_event_loop().time()
+        start_time = perf_counter()
         
         try:
             # Log the incoming request (debug level)
             self.logger.logger.debug(f"Processing query for user {user_id}, session {session_id}: {query[:100]}...")
             
             try:
-                import google.generativeai as genai
-                genai.configure(api_key=config.google_api_key) if config.google_api_key else None
-                
                 if config.google_api_key:
-                    # Get system prompt from root_agent
-                    from ecoagent.agent import root_agent
-                    system_prompt = root_agent.instruction
-                    
-                    # Use Gemini API with system prompt
-                    model = genai.GenerativeModel(
-                        config.default_model,
-                        system_instruction=system_prompt
-                    )
-                    response = await asyncio.to_thread(
+                    # Gemini model configured with the root_agent system prompt
+                    model = self._get_model()
+                    response = await asyncio.get_running_loop().run_in_executor(
+                        self._llm_executor,
                         model.generate_content,
                         query
                     )
@@ -92,9 +131,9 @@ class EcoAgentApp:
             except Exception as agent_err:
                 # If agent fails, provide a helpful fallback
                 self.logger.logger.debug(f"Agent processing error: {agent_err}")
-                response_text = f"Thank you for your question about '{query}'. The EcoAgent system can help you calculate carbon footprints, get sustainability recommendations, track progress, and find community resources. Please try asking more specifically about what you'd like help with."
+                response_text = self._agent_error_response(query)
             
-            execution_time = asyncio.get_event_loop().time() - start_time
+            execution_time = perf_counter() - start_time
             
             # Log the interaction (debug level)
             self.logger.logger.debug(f"Query processed in {execution_time:.2f}s for user {user_id}")
@@ -110,7 +149,7 @@ class EcoAgentApp:
             return response_text
             
         except Exception as e:
-            execution_time = asyncio.get_event_loop().time() - start_time
+            execution_time = perf_counter() - start_time
             handled_error = error_service.handle_error(e, "process_query")
             error_service.log_error(handled_error)
             
@@ -124,6 +163,79 @@ class EcoAgentApp:
             # Return a helpful error response
             return "I encountered an issue while processing your request. Please try again or contact support if the problem persists."
     
+    @staticmethod
+    def _agent_error_response(query: str) -> str:
+        """Helpful reply used when the LLM call itself fails."""
+        return f"Thank you for your question about '{query}'. The EcoAgent system can help you calculate carbon footprints, get sustainability recommendations, track progress, and find community resources. Please try asking more specifically about what you'd like help with."
+
+    async def stream_query(self, user_id: str, session_id: str, query: str) -> AsyncIterator[str]:
+        """Process a user query, yielding the response text as it is generated.
+
+        Gemini's ``stream=True`` iterator blocks, so it is drained on the LLM
+        executor and each chunk is handed back to the event loop through an
+        ``asyncio.Queue``. Without an API key the full ``process_query``
+        response is yielded as a single chunk.
+        """
+        if not self.started:
+            raise EcoAgentException(
+                message="Application not initialized",
+                error_type="CONFIGURATION_ERROR"
+            )
+
+        if not config.google_api_key:
+            yield await self.process_query(user_id, session_id, query)
+            return
+
+        start_time = perf_counter()
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def produce() -> None:
+            try:
+                for chunk in self._get_model().generate_content(query, stream=True):
+                    text = chunk.text
+                    if text:
+                        loop.call_soon_threadsafe(queue.put_nowait, text)
+            except Exception as exc:
+                loop.call_soon_threadsafe(queue.put_nowait, exc)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+
+        loop.run_in_executor(self._llm_executor, produce)
+
+        chunks = []
+        error: Optional[Exception] = None
+        while (item := await queue.get()) is not _STREAM_END:
+            if isinstance(item, Exception):
+                error = item
+                self.logger.logger.warning(
+                    "Agent streaming error for user %s, session %s: %s", user_id, session_id, item
+                )
+                if not chunks:
+                    chunks.append(self._agent_error_response(query))
+                    yield chunks[-1]
+                continue
+            chunks.append(item)
+            yield item
+
+        execution_time = perf_counter() - start_time
+        metadata = {
+            "execution_time": execution_time,
+            "status": "success" if error is None else "error",
+            "streamed": True
+        }
+        if error is not None:
+            metadata["error"] = str(error)
+        log_interaction(user_id, session_id, query, "".join(chunks), metadata)
+        if error is None:
+            self.metrics.increment_counter("queries_processed", {"user_id": user_id})
+        else:
+            self.metrics.increment_counter("queries_failed", {
+                "user_id": user_id,
+                "error_type": str(type(error))
+            })
+        self.metrics.record_timer("query_processing_time", execution_time, {"user_id": user_id})
+
     async def run_server(self, host: str = "localhost", port: int = 8080):
         """Run the agent as a server."""
         if not await self.initialize():
@@ -135,16 +247,31 @@ class EcoAgentApp:
         # This would typically involve FastAPI or another web framework
         self.logger.logger.info("EcoAgent server started successfully")
         
+        self._stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        if sys.platform != "win32":
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, self._stop_event.set)
+        
         try:
-            # Run indefinitely or until interrupted
-            while True:
-                await asyncio.sleep(1)
+            # Sleep in the event loop's poller until stop() or a signal
+            await self._stop_event.wait()
+            self.logger.logger.info("Shutting down EcoAgent server...")
         except KeyboardInterrupt:
             self.logger.logger.info("Shutting down EcoAgent server...")
         except Exception as e:
             self.logger.logger.error(f"Error in server: {str(e)}")
         finally:
+            if sys.platform != "win32":
+                for sig in (signal.SIGINT, signal.SIGTERM):
+                    loop.remove_signal_handler(sig)
+            await self.shutdown()
             self.logger.logger.info("EcoAgent server stopped")
+    
+    def stop(self) -> None:
+        """Ask a running server to shut down."""
+        if self._stop_event is not None:
+            self._stop_event.set()
 
 
 # Global application instance
@@ -183,4 +310,5 @@ if __name__ == "__main__":
     logging.basicConfig(level=getattr(logging, log_level.upper()))
     
     # Run the main function
+    install_event_loop_policy()
     asyncio.run(main())
\ No newline at end of file
@@ -7,7 +7,6 @@ import json
 import asyncio
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
-import gradio as gr
 from src.core.main import get_app
 from src.tools.carbon_calculator import (
     calculate_transportation_carbon,
@@ -33,6 +32,17 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _result_text(result: Any) -> str:
+        """Encode a tool result as indented JSON text for MCP content."""
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _result_text(result: Any) -> str:
+        """Encode a tool result as indented JSON text for MCP content."""
+        return json.dumps(result, indent=2, ensure_ascii=False)
+
 
 class ToolDefinition(BaseModel):
     """MCP Tool Definition following MCP protocol specification."""
@@ -340,7 +350,7 @@ class EcoAgentMCP:
             # Format the result according to MCP specification
             content = [{
                 "type": "text",
-                "text": json.dumps(result, indent=2, ensure_ascii=False) if isinstance(result, (dict, list)) else str(result)
+                "text": _result_text(result) if isinstance(result, (dict, list)) else str(result)
             }]
             
             logger.info(f"Tool '{tool_name}' executed successfully with result: {result}")
@@ -371,6 +381,9 @@ class EcoAgentMCP:
     
     def create_gradio_interface(self):
         """Create enhanced Gradio interface optimized for Claude/Cursor integration demo."""
+        # Imported here so servers that never build the UI don't load Gradio
+        import gradio as gr
+        
         with gr.Blocks(
             title="EcoAgent MCP Server - Sustainability Tools", 
             theme=gr.themes.Soft(),
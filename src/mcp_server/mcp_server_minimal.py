@@ -3,21 +3,77 @@ Minimal MCP Server for EcoAgent without google.adk dependency
 """
 
 import os
+import sys
 import json
+import signal
 import asyncio
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel, Field
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Union
+from dataclasses import dataclass, field
 import logging
 
+from ecoagent.event_loop import install_event_loop_policy
+
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class ToolDefinition(BaseModel):
+class JsonRpcError(Exception):
+    """A JSON-RPC error to report in a response's ``error`` member"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _error_response(request_id: Any, code: int, message: str, data: Any = None) -> Dict[str, Any]:
+    """Build a JSON-RPC error response"""
+    error: Dict[str, Any] = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+
+@dataclass(slots=True, frozen=True)
+class ToolDefinition:
     name: str
     description: str
-    parameters: Dict[str, Any] = Field(default_factory=dict)
+    parameters: Dict[str, Any] = field(default_factory=dict)
+
+
+# Tool responses are constant; the read-only payloads are built once and each
+# call hands out a plain dict copy
+_CARBON_RESPONSE: Mapping[str, Any] = MappingProxyType({
+    "status": "success",
+    "carbon_footprint": 10.5,
+    "unit": "kg CO2"
+})
+_RECOMMENDATIONS_RESPONSE: Mapping[str, Any] = MappingProxyType({
+    "status": "success",
+    "recommendations": (
+        "Use public transportation",
+        "Reduce energy consumption",
+        "Plant trees"
+    )
+})
 
 
 class MinimalEcoAgentMCP:
@@ -47,10 +103,10 @@ class MinimalEcoAgentMCP:
                 }
             )
         ]
-    
-    def list_tools(self) -> List[Dict[str, Any]]:
-        """List available tools"""
-        return [
+
+        # Tools never change after construction, so the listing is built once;
+        # tools_listing_json is the encoded ``tools/list`` result payload
+        self._tools_listing: List[Dict[str, Any]] = [
             {
                 "name": tool.name,
                 "description": tool.description,
@@ -58,42 +114,42 @@ class MinimalEcoAgentMCP:
             }
             for tool in self.tools
         ]
+        self.tools_listing_json: bytes = _dumps({"tools": self._tools_listing})
+
+        self._handlers: Dict[str, Mapping[str, Any]] = {
+            "calculate_carbon": _CARBON_RESPONSE,
+            "get_recommendations": _RECOMMENDATIONS_RESPONSE
+        }
+    
+    def list_tools(self) -> List[Dict[str, Any]]:
+        """List available tools (a shared, cached list; do not mutate)"""
+        return self._tools_listing
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a tool by name"""
-        logger.info(f"Calling tool: {name} with arguments: {arguments}")
-        
-        if name == "calculate_carbon":
-            return {
-                "status": "success",
-                "carbon_footprint": 10.5,
-                "unit": "kg CO2"
-            }
-        elif name == "get_recommendations":
-            return {
-                "status": "success",
-                "recommendations": [
-                    "Use public transportation",
-                    "Reduce energy consumption",
-                    "Plant trees"
-                ]
-            }
-        else:
+        logger.info("Calling tool: %s with arguments: %s", name, arguments)
+
+        response = self._handlers.get(name)
+        if response is None:
             return {
                 "status": "error",
                 "message": f"Unknown tool: {name}"
             }
+        # A plain dict, so callers can serialize it with any JSON encoder
+        return dict(response)
 
 
 class MCPServer:
     """Simple MCP Protocol Server"""
     
-    def __init__(self, agent: MinimalEcoAgentMCP):
+    def __init__(self, agent: MinimalEcoAgentMCP, max_concurrent: Optional[int] = None):
         self.agent = agent
-    
-    async def initialize(self) -> Dict[str, Any]:
-        """Initialize the server"""
-        return {
+        # Bounds how many tool calls run at once across all requests and batches
+        if max_concurrent is None:
+            max_concurrent = int(os.getenv("MCP_MAX_INFLIGHT", "16"))
+        self._sem = asyncio.Semaphore(max_concurrent)
+        # The handshake never changes at runtime, so its result is encoded once
+        self._initialize_response: Dict[str, Any] = {
             "protocolVersion": "2024-11-05",
             "capabilities": {
                 "tools": {}
@@ -103,6 +159,22 @@ class MCPServer:
                 "version": "1.0.0"
             }
         }
+        # Encoded ``result`` payloads for methods whose answer never changes;
+        # handle_message splices them into a per-request envelope
+        self._static_results: Dict[str, bytes] = {
+            "initialize": _dumps(self._initialize_response),
+            "tools/list": self.agent.tools_listing_json
+        }
+        # JSON-RPC method name -> handler taking the full request
+        self._methods = {
+            "initialize": lambda _request: self.initialize(),
+            "tools/list": lambda _request: self.list_tools(),
+            "tools/call": self._call_tool
+        }
+    
+    async def initialize(self) -> Dict[str, Any]:
+        """Initialize the server"""
+        return self._initialize_response
     
     async def list_tools(self) -> Dict[str, Any]:
         """List available tools"""
@@ -112,23 +184,94 @@ class MCPServer:
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool"""
-        return await self.agent.call_tool(name, arguments)
+        async with self._sem:
+            return await self.agent.call_tool(name, arguments)
     
-    async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle a request"""
-        method = request.get("method")
-        
-        if method == "initialize":
-            return await self.initialize()
-        elif method == "tools/list":
-            return await self.list_tools()
-        elif method == "tools/call":
-            return await self.call_tool(
-                request.get("params", {}).get("name"),
-                request.get("params", {}).get("arguments", {})
-            )
+    async def _call_tool(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute the tool named in a ``tools/call`` request"""
+        params = request.get("params") or {}
+        return await self.call_tool(params.get("name"), params.get("arguments") or {})
+    
+    async def _dispatch(self, request: Dict[str, Any]) -> Any:
+        """Run the handler for a request's method
+
+        Raises:
+            JsonRpcError: If the method is not known
+        """
+        handler = self._methods.get(request.get("method"))
+        if handler is None:
+            raise JsonRpcError(-32601, "Method not found")
+        return await handler(request)
+
+    async def _respond(self, request: Any) -> Optional[Dict[str, Any]]:
+        """Run one request and wrap the outcome in a JSON-RPC envelope
+
+        Returns None for notifications (requests without an ``id``).
+        """
+        if not isinstance(request, dict):
+            return _error_response(None, -32600, "Invalid Request")
+
+        request_id = request.get("id")
+        try:
+            result = await self._dispatch(request)
+        except JsonRpcError as exc:
+            response = _error_response(request_id, exc.code, exc.message)
+        except Exception as exc:
+            logger.error("Request %s failed: %s", request_id, exc)
+            response = _error_response(request_id, -32603, "Internal error", str(exc))
         else:
-            return {"error": f"Unknown method: {method}"}
+            response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        return response if "id" in request else None
+
+    async def handle_request(
+        self, request: Union[Dict[str, Any], List[Any]]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], None]:
+        """Handle a request, or a JSON-RPC batch of requests
+
+        Returns the JSON-RPC response envelope(s); None for a notification.
+        """
+        if isinstance(request, list):
+            return await self.handle_batch(request)
+        return await self._respond(request)
+
+    async def handle_message(self, message: Union[bytes, str]) -> Optional[bytes]:
+        """Handle a raw JSON-RPC message and return the encoded response
+
+        This is the wire boundary for transports: parsing and encoding use
+        orjson when it is installed, and the ``initialize`` and ``tools/list``
+        results are encoded at startup and wrapped with the caller's ``id``.
+        Returns None when there is nothing to send back (notifications).
+        """
+        try:
+            request = _loads(message)
+        except ValueError:
+            return _dumps(_error_response(None, -32700, "Parse error"))
+
+        if isinstance(request, dict) and "id" in request:
+            result = self._static_results.get(request.get("method"))
+            if result is not None:
+                return b'{"jsonrpc":"2.0","id":%s,"result":%s}' % (_dumps(request["id"]), result)
+
+        response = await self.handle_request(request)
+        if not response:
+            return None
+        return _dumps(response)
+
+    async def handle_batch(self, requests: List[Any]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Handle a JSON-RPC batch concurrently
+
+        Each member gets its own ``jsonrpc``/``id`` envelope with either a
+        ``result`` or a top-level ``error``, so one failing member does not
+        fail the rest. Members that are not objects get a -32600 error with
+        a null ``id``. Notifications (members without an ``id``) are executed
+        but, as the JSON-RPC spec requires, get no entry in the response list.
+        An empty batch is answered with a single -32600 error.
+        """
+        if not requests:
+            return _error_response(None, -32600, "Invalid Request")
+
+        responses = await asyncio.gather(*(self._respond(r) for r in requests))
+        return [response for response in responses if response is not None]
 
 
 async def main():
@@ -139,12 +282,23 @@ async def main():
     logger.info("EcoAgent MCP Server started")
     logger.info("Available tools:")
     for tool in agent.list_tools():
-        logger.info(f"  - {tool['name']}: {tool['description']}")
+        logger.info("  - %s: %s", tool["name"], tool["description"])
     
-    # Keep server running
-    while True:
-        await asyncio.sleep(1)
+    # Keep server running until SIGINT/SIGTERM, without waking the loop while idle
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    if sys.platform != "win32":
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop_event.set)
+    try:
+        await stop_event.wait()
+    finally:
+        if sys.platform != "win32":
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
+        logger.info("EcoAgent MCP Server stopped")
 
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     asyncio.run(main())
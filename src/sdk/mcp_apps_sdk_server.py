@@ -4,19 +4,146 @@ Enhanced MCP Server for ChatGPT Apps SDK with custom UI components
 """
 
 import os
+import sys
 import json
+import signal
 import asyncio
+import threading
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+from types import MappingProxyType
 import logging
 
-from mcp_server import EcoAgentMCP
+from pydantic import ValidationError
+
+from mcp_server import CallToolRequest, EcoAgentMCP
+from ecoagent.event_loop import install_event_loop_policy
+
+try:
+    import watchfiles
+except ImportError:  # Widget hot reload is optional
+    watchfiles = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+WIDGET_URI = "ui://widget/ecoagent.html"
+WIDGET_PATH = Path(__file__).parent / "public" / "ecoagent-widget.html"
+
+
+@lru_cache(maxsize=8)
+def _load_widget(path: str, mtime_ns: int) -> str:
+    """Read widget HTML; keyed on mtime so an edited file is read again."""
+    return Path(path).read_bytes().decode("utf-8")
+
+
+_FRIENDLY_NAMES = {
+    "calculate_transportation_carbon": "Transportation Carbon Footprint",
+    "calculate_flight_carbon": "Flight Carbon Footprint",
+    "calculate_home_energy_carbon": "Home Energy Carbon Footprint",
+    "calculate_total_carbon": "Total Carbon Footprint",
+}
+
+
+@lru_cache(maxsize=128)
+def _friendly_name(tool_name: str) -> str:
+    """Convert tool name to friendly display name."""
+    return _FRIENDLY_NAMES.get(tool_name, tool_name.replace("_", " ").title())
+
+
+# Carbon calculation tools render their output in the widget
+_CARBON_TOOLS = (
+    "calculate_transportation_carbon",
+    "calculate_flight_carbon",
+    "calculate_home_energy_carbon",
+    "calculate_total_carbon",
+)
+
+# Recommendation tools only show status messages
+_RECOMMENDATION_TOOLS = (
+    "suggest_transportation_alternatives",
+    "suggest_energy_efficiency_improvements",
+    "suggest_dietary_changes",
+)
+
+# Information/search tools
+_INFO_TOOLS = (
+    "search_environmental_info",
+    "get_local_environmental_resources",
+    "get_latest_environmental_news",
+    "get_sustainability_practice_info",
+)
+
+_RECOMMENDATION_META = MappingProxyType({
+    "openai/toolInvocation/invoking": "Finding recommendations...",
+    "openai/toolInvocation/invoked": "Recommendations ready!",
+})
+
+_INFO_META = MappingProxyType({
+    "openai/toolInvocation/invoking": "Searching for information...",
+    "openai/toolInvocation/invoked": "Information found!",
+})
+
+# Apps SDK metadata per tool, built once at import. The mappings are
+# read-only, so every server instance can share them.
+_META_INDEX = {
+    **{
+        tool_name: MappingProxyType({
+            "openai/outputTemplate": WIDGET_URI,
+            "openai/toolInvocation/invoking": f"Calculating {_friendly_name(tool_name)}...",
+            "openai/toolInvocation/invoked": f"{_friendly_name(tool_name)} calculated successfully!",
+            "openai/widgetPrefersBorder": True,
+            "openai/widgetPrefersDarkMode": False,
+        })
+        for tool_name in _CARBON_TOOLS
+    },
+    **{tool_name: _RECOMMENDATION_META for tool_name in _RECOMMENDATION_TOOLS},
+    **{tool_name: _INFO_META for tool_name in _INFO_TOOLS},
+}
+
+_WIDGET_RESOURCE_META = MappingProxyType({
+    "openai/widgetPrefersBorder": True,
+    "openai/widgetPrefersDarkMode": False,
+})
+
+# Served when public/ecoagent-widget.html is missing
+_DEFAULT_WIDGET_HTML = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>EcoAgent</title>
+    <style>
+        body { font-family: system-ui; padding: 20px; background: #f6f8fb; margin: 0; }
+        main { max-width: 500px; margin: 0 auto; background: white; border-radius: 16px; padding: 20px; }
+        h1 { color: #1e7e34; margin-top: 0; }
+        .carbon-value { font-size: 2.5rem; font-weight: bold; color: #16a34a; }
+        .loading { color: #666; font-style: italic; }
+    </style>
+</head>
+<body>
+    <main>
+        <h1>🌱 EcoAgent</h1>
+        <div id="content" class="loading">Loading...</div>
+    </main>
+    <script>
+        function updateUI() {
+            const output = window.openai?.toolOutput || {};
+            const div = document.getElementById('content');
+            if (output.carbon_pounds) {
+                div.innerHTML = `<div class="carbon-value">${output.carbon_pounds} lbs CO₂</div>`;
+            }
+        }
+        window.addEventListener('openai-tool-output-updated', updateUI);
+        setInterval(updateUI, 500);
+        updateUI();
+    </script>
+</body>
+</html>"""
+
+
 class EcoAgentAppsSDK(EcoAgentMCP):
     """
     Enhanced EcoAgent MCP server with ChatGPT Apps SDK support.
@@ -31,140 +158,123 @@ class EcoAgentAppsSDK(EcoAgentMCP):
     def __init__(self):
         super().__init__()
         self.widget_html = None
+        self._widget_resource_response: Optional[Dict[str, Any]] = None
+        self._widget_watcher: Optional[asyncio.Task] = None
         self.setup_apps_sdk()
     
     def setup_apps_sdk(self):
         """Initialize Apps SDK components and resources."""
         logger.info("Setting up ChatGPT Apps SDK components...")
         
-        # Load the widget HTML
-        widget_path = Path(__file__).parent / "public" / "ecoagent-widget.html"
-        if widget_path.exists():
-            with open(widget_path, 'r', encoding='utf-8') as f:
-                self.widget_html = f.read()
-            logger.info(f"Loaded widget from {widget_path}")
-        else:
-            logger.warning(f"Widget file not found at {widget_path}")
+        # Load the widget HTML (cached per process until the file changes)
+        widget_path = WIDGET_PATH
+        try:
+            self.widget_html = _load_widget(str(widget_path), widget_path.stat().st_mtime_ns)
+            logger.info("Loaded widget from %s", widget_path)
+        except FileNotFoundError:
+            logger.warning("Widget file not found at %s", widget_path)
             self.widget_html = self._get_default_widget()
         
+        # Built once; only a widget reload swaps in a new response
+        self._widget_resource_response = self._build_widget_resource_response()
+        
+        # Hot-reload the widget when constructed inside a running event loop
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            self.start_widget_reloader()
+        
         # Enhance tools with Apps SDK metadata
         self.enhance_tools_with_apps_sdk_metadata()
     
-    def enhance_tools_with_apps_sdk_metadata(self):
-        """Add OpenAI Apps SDK metadata to tools for better integration."""
+    def reload_widget(self) -> None:
+        """Re-read the widget HTML and swap in a fresh resource response.
         
-        # Carbon calculation tools - use the widget for output
-        carbon_tools = [
-            "calculate_transportation_carbon",
-            "calculate_flight_carbon",
-            "calculate_home_energy_carbon",
-            "calculate_total_carbon"
-        ]
-        
-        for tool_name in carbon_tools:
-            if tool_name in self.tools:
-                self.tools[tool_name]["_meta"] = {
-                    "openai/outputTemplate": "ui://widget/ecoagent.html",
-                    "openai/toolInvocation/invoking": f"Calculating {self._get_friendly_name(tool_name)}...",
-                    "openai/toolInvocation/invoked": f"{self._get_friendly_name(tool_name)} calculated successfully!",
-                    "openai/widgetPrefersBorder": True,
-                    "openai/widgetPrefersDarkMode": False,
-                }
-        
-        # Recommendation tools - status messages only
-        recommendation_tools = [
-            "suggest_transportation_alternatives",
-            "suggest_energy_efficiency_improvements",
-            "suggest_dietary_changes"
-        ]
+        Readers of ``widget_html``/``get_resource_content`` see either the
+        old or the new objects, since each is replaced by a single assignment.
+        """
+        try:
+            widget_html = _load_widget(str(WIDGET_PATH), WIDGET_PATH.stat().st_mtime_ns)
+        except FileNotFoundError:
+            logger.warning("Widget file not found at %s; keeping the current widget", WIDGET_PATH)
+            return
+        self.widget_html = widget_html
+        self._widget_resource_response = self._build_widget_resource_response()
+        logger.info("Reloaded widget from %s", WIDGET_PATH)
+    
+    async def _watch_widget(self) -> None:
+        """Reload the widget whenever its file changes on disk."""
+        widget_file = str(WIDGET_PATH)
+        async for _changes in watchfiles.awatch(
+            WIDGET_PATH.parent,
+            watch_filter=lambda _change, path: path == widget_file
+        ):
+            self.reload_widget()
+    
+    def start_widget_reloader(self) -> None:
+        """Reload the widget on file changes and on SIGHUP.
         
-        for tool_name in recommendation_tools:
-            if tool_name in self.tools:
-                self.tools[tool_name]["_meta"] = {
-                    "openai/toolInvocation/invoking": "Finding recommendations...",
-                    "openai/toolInvocation/invoked": "Recommendations ready!",
-                }
+        Must be called from inside the running event loop. File watching
+        needs the optional ``watchfiles`` package; SIGHUP works without it.
+        """
+        loop = asyncio.get_running_loop()
+        if sys.platform != "win32":
+            loop.add_signal_handler(signal.SIGHUP, self.reload_widget)
+        if watchfiles is not None and WIDGET_PATH.parent.is_dir() and self._widget_watcher is None:
+            self._widget_watcher = loop.create_task(self._watch_widget())
+    
+    def start_widget_reloader_thread(self) -> None:
+        """Reload the widget on file changes and on SIGHUP without a running loop.
         
-        # Information/search tools
-        info_tools = [
-            "search_environmental_info",
-            "get_local_environmental_resources",
-            "get_latest_environmental_news",
-            "get_sustainability_practice_info"
-        ]
+        Used on the Gradio path, where ``launch()`` blocks the main thread and
+        Gradio serves from its own loop in another thread. Must be called from
+        the main thread, which is where Python delivers signals.
+        """
+        if sys.platform != "win32":
+            signal.signal(signal.SIGHUP, lambda _signum, _frame: self.reload_widget())
+        if watchfiles is not None and WIDGET_PATH.parent.is_dir():
+            threading.Thread(
+                target=asyncio.run, args=(self._watch_widget(),),
+                name="widget-reloader", daemon=True
+            ).start()
+    
+    def enhance_tools_with_apps_sdk_metadata(self):
+        """Add OpenAI Apps SDK metadata to tools for better integration."""
         
-        for tool_name in info_tools:
-            if tool_name in self.tools:
-                self.tools[tool_name]["_meta"] = {
-                    "openai/toolInvocation/invoking": "Searching for information...",
-                    "openai/toolInvocation/invoked": "Information found!",
-                }
+        # One pass over every categorized tool (widget, recommendation, info)
+        for tool_name, meta in _META_INDEX.items():
+            tool = self.tools.get(tool_name)
+            if tool is not None:
+                tool["_meta"] = meta
         
         logger.info("✅ Enhanced all tools with Apps SDK metadata")
     
-    def _get_friendly_name(self, tool_name: str) -> str:
-        """Convert tool name to friendly display name."""
-        names = {
-            "calculate_transportation_carbon": "Transportation Carbon Footprint",
-            "calculate_flight_carbon": "Flight Carbon Footprint",
-            "calculate_home_energy_carbon": "Home Energy Carbon Footprint",
-            "calculate_total_carbon": "Total Carbon Footprint",
-        }
-        return names.get(tool_name, tool_name.replace("_", " ").title())
+    # Memoized; tool names are bounded by the tool registry
+    _get_friendly_name = staticmethod(_friendly_name)
     
     def _get_default_widget(self) -> str:
         """Return a minimal widget if file not found."""
-        return """<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <title>EcoAgent</title>
-    <style>
-        body { font-family: system-ui; padding: 20px; background: #f6f8fb; margin: 0; }
-        main { max-width: 500px; margin: 0 auto; background: white; border-radius: 16px; padding: 20px; }
-        h1 { color: #1e7e34; margin-top: 0; }
-        .carbon-value { font-size: 2.5rem; font-weight: bold; color: #16a34a; }
-        .loading { color: #666; font-style: italic; }
-    </style>
-</head>
-<body>
-    <main>
-        <h1>🌱 EcoAgent</h1>
-        <div id="content" class="loading">Loading...</div>
-    </main>
-    <script>
-        function updateUI() {
-            const output = window.openai?.toolOutput || {};
-            const div = document.getElementById('content');
-            if (output.carbon_pounds) {
-                div.innerHTML = `<div class="carbon-value">${output.carbon_pounds} lbs CO₂</div>`;
-            }
+        return _DEFAULT_WIDGET_HTML
+    
+    def _build_widget_resource_response(self) -> Dict[str, Any]:
+        """Build the MCP resource response for the widget HTML."""
+        return {
+            "contents": [
+                {
+                    "uri": WIDGET_URI,
+                    "mimeType": "text/html+skybridge",
+                    "text": self.widget_html,
+                    "_meta": _WIDGET_RESOURCE_META
+                }
+            ]
         }
-        window.addEventListener('openai-tool-output-updated', updateUI);
-        setInterval(updateUI, 500);
-        updateUI();
-    </script>
-</body>
-</html>"""
     
     def get_resource_content(self, resource_uri: str) -> Optional[Dict[str, Any]]:
         """Get resource content for MCP resource requests."""
-        
-        if resource_uri == "ui://widget/ecoagent.html":
-            return {
-                "contents": [
-                    {
-                        "uri": resource_uri,
-                        "mimeType": "text/html+skybridge",
-                        "text": self.widget_html,
-                        "_meta": {
-                            "openai/widgetPrefersBorder": True,
-                            "openai/widgetPrefersDarkMode": False,
-                        }
-                    }
-                ]
-            }
-        
+        if resource_uri == WIDGET_URI:
+            return self._widget_resource_response
         return None
     
     def create_apps_sdk_interface(self):
@@ -300,16 +410,133 @@ class EcoAgentAppsSDK(EcoAgentMCP):
         - ✅ Error Handling
         """
     
+    def handle_jsonrpc(self, request: Any) -> Optional[Dict[str, Any]]:
+        """Answer one MCP JSON-RPC request; notifications return None.
+        
+        Failures are reported as JSON-RPC errors carrying the request ``id``
+        rather than raised, so one bad request never stops the transport.
+        """
+        if not isinstance(request, dict):
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+        
+        method = request.get("method")
+        params = request.get("params") or {}
+        result = None
+        error = None
+        
+        try:
+            if not isinstance(params, dict):
+                error = {"code": -32602, "message": "Invalid params: expected an object"}
+            else:
+                result, error = self._dispatch_jsonrpc(method, params)
+        except ValidationError as exc:
+            error = {"code": -32602, "message": "Invalid params", "data": str(exc)}
+        except Exception as exc:
+            logger.exception("JSON-RPC %s request failed", method)
+            error = {"code": -32603, "message": "Internal error", "data": str(exc)}
+        
+        if "id" not in request:
+            return None
+        if error is not None:
+            return {"jsonrpc": "2.0", "id": request["id"], "error": error}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+    
+    def _dispatch_jsonrpc(self, method: Any, params: Dict[str, Any]):
+        """Run one MCP method; returns (result, error)."""
+        result = None
+        error = None
+        
+        if method == "initialize":
+            result = {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {"tools": {}, "resources": {}},
+                "serverInfo": {"name": "EcoAgent Apps SDK", "version": "1.0.0"}
+            }
+        elif method == "tools/list":
+            result = {"tools": [
+                {
+                    "name": name,
+                    "description": info["description"],
+                    "inputSchema": info["input_schema"],
+                    **({"_meta": dict(info["_meta"])} if "_meta" in info else {})
+                }
+                for name, info in self.tools.items()
+            ]}
+        elif method == "tools/call":
+            response = self.call_tool(CallToolRequest(
+                name=params.get("name"),
+                arguments=params.get("arguments") or {}
+            ))
+            result = response.model_dump(exclude_none=True)
+        elif method == "resources/read":
+            resource = self.get_resource_content(params.get("uri"))
+            if resource is None:
+                error = {"code": -32002, "message": f"Resource not found: {params.get('uri')}"}
+            else:
+                result = {"contents": [
+                    {**content, "_meta": dict(content["_meta"])}
+                    for content in resource["contents"]
+                ]}
+        else:
+            error = {"code": -32601, "message": f"Method not found: {method}"}
+        
+        return result, error
+    
+    async def _serve_stdio(self) -> None:
+        """Serve newline-delimited MCP JSON-RPC over stdin/stdout until EOF."""
+        self.start_widget_reloader()
+        while True:
+            line = await asyncio.to_thread(sys.stdin.readline)
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            
+            try:
+                response = self.handle_jsonrpc(json.loads(line))
+            except json.JSONDecodeError:
+                response = {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}
+            
+            if response is not None:
+                sys.stdout.write(json.dumps(response, ensure_ascii=False) + "\n")
+                sys.stdout.flush()
+    
+    def run_headless(self):
+        """Serve MCP over stdio without importing or building the Gradio UI."""
+        event_loop = install_event_loop_policy()
+        logger.info(
+            "🚀 Starting EcoAgent Apps SDK Server (headless, stdio)\n"
+            "   Tools: %d\n"
+            "   Event loop: %s",
+            len(self.tools), event_loop
+        )
+        asyncio.run(self._serve_stdio())
+    
     def run_apps_sdk_server(self, host: str = "localhost", port: int = 8000):
-        """Run the Apps SDK-enhanced server."""
-        logger.info("🚀 Starting EcoAgent Apps SDK Server")
-        logger.info(f"   Host: {host}:{port}")
-        logger.info(f"   Model: gpt-4.5-nano")
-        logger.info(f"   Tools: {len(self.tools)}")
-        logger.info(f"   Widget: {'✅ Ready' if self.widget_html else '⚠️ Not loaded'}")
+        """Run the Apps SDK-enhanced server.
         
-        # Create and launch the interface
+        With HEADLESS=1 the Gradio UI is skipped entirely and MCP is served
+        over stdio instead; ``host`` and ``port`` are then unused.
+        """
+        if os.getenv("HEADLESS") == "1":
+            return self.run_headless()
+        
+        # Create and launch the interface on uvloop where available
+        event_loop = install_event_loop_policy()
+        logger.info(
+            "🚀 Starting EcoAgent Apps SDK Server\n"
+            "   Host: %s:%s\n"
+            "   Model: gpt-4.5-nano\n"
+            "   Tools: %d\n"
+            "   Widget: %s\n"
+            "   Event loop: %s",
+            host, port, len(self.tools),
+            "✅ Ready" if self.widget_html else "⚠️ Not loaded",
+            event_loop
+        )
         demo = self.create_apps_sdk_interface()
+        self.start_widget_reloader_thread()
         demo.launch(
             server_name=host,
             server_port=port,
@@ -324,14 +551,12 @@ def main():
     # Create the Apps SDK server
     sdk_server = EcoAgentAppsSDK()
     
-    # Print tools info
-    logger.info("\n📋 Available Sustainability Tools:")
-    for i, tool_name in enumerate(sdk_server.tools.keys(), 1):
-        tool = sdk_server.tools[tool_name]
-        meta = tool.get("_meta", {})
-        has_widget = "openai/outputTemplate" in meta
-        widget_indicator = "🎨" if has_widget else "📝"
-        logger.info(f"   {i:2d}. {widget_indicator} {tool_name}")
+    # Print tools info as a single log record
+    lines = ["\n📋 Available Sustainability Tools:"]
+    for i, (tool_name, tool) in enumerate(sdk_server.tools.items(), 1):
+        widget_indicator = "🎨" if "openai/outputTemplate" in tool.get("_meta", ()) else "📝"
+        lines.append(f"   {i:2d}. {widget_indicator} {tool_name}")
+    logger.info("\n".join(lines))
     
     # Run the server
     try:
@@ -342,7 +567,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("\n👋 Server stopped by user")
     except Exception as e:
-        logger.error(f"❌ Server error: {e}")
+        logger.error("❌ Server error: %s", e)
         raise
 
 
@@ -4,7 +4,6 @@ Following OpenAI best practices for great ChatGPT apps
 """
 
 import gradio as gr
-import asyncio
 import os
 from typing import List, Dict, Any
 from src.tools.chatgpt_integration import ChatGPTInterface
@@ -35,7 +34,7 @@ class EcoAgentChatGPTApp:
         new_history = chat_history + [[user_message, None]]
         return new_history
     
-    def get_bot_response(self, chat_history: List) -> List:
+    async def get_bot_response(self, chat_history: List) -> List:
         """Get bot response for the last user message using OpenAI API."""
         if not chat_history or not chat_history[-1][0]:  # Check if last message exists
             return chat_history
@@ -44,7 +43,7 @@ class EcoAgentChatGPTApp:
         
         try:
             # Process message using OpenAI integration
-            response = asyncio.run(self.interface.process_message(user_message))
+            response = await self.interface.process_message(user_message)
             
             # Update the last message with bot response
             chat_history[-1][1] = response
@@ -6,10 +6,17 @@ This module integrates EcoAgent's sustainability tools with OpenAI's ChatGPT fol
 import os
 import openai
 import json
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel, Field
+from typing import Dict, Any, List, Optional, Tuple, Type, Union
+from dataclasses import dataclass, asdict
+from pydantic import BaseModel, Field, ValidationError
+import numpy as np
 import asyncio
 import logging
+import random
+import re
+from functools import lru_cache
+from time import time
+from weakref import WeakKeyDictionary
 from src.tools.carbon_calculator import (
     calculate_transportation_carbon,
     calculate_flight_carbon,
@@ -29,12 +36,509 @@ from src.tools.search_grounding import (
     get_sustainability_practice_info
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        """Serialize ``obj`` to compact JSON text."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> str:
+        """Serialize ``obj`` to compact JSON text."""
+        return json.dumps(obj, default=asdict)
+
+# Search lookups repeat heavily within and across sessions, so results are
+# memoized per argument set. News is keyed on the current hour as well so
+# cached headlines are never more than an hour old.
+_NEWS_TTL_SECONDS = 3600
+
+_cached_environmental_info = lru_cache(maxsize=512)(search_environmental_info)
+_cached_local_resources = lru_cache(maxsize=512)(get_local_environmental_resources)
+_cached_practice_info = lru_cache(maxsize=512)(get_sustainability_practice_info)
+
+
+@lru_cache(maxsize=512)
+def _cached_news(topic: str, ttl_bucket: int) -> Dict[str, Any]:
+    return get_latest_environmental_news(topic=topic)
+
+
+_LBS_TO_KG = 0.453592
+
+# Ratios for the unit pairs users ask about most (CO2 weight and trip
+# distance), applied without a round trip through the unit converter
+_FAST_CONV = {
+    ("lbs", "kg"): _LBS_TO_KG,
+    ("kg", "lbs"): 2.20462,
+    ("miles", "km"): 1.60934,
+    ("km", "miles"): 0.621371,
+}
+
+# Attempts per OpenAI call when rate limited or timed out
+_API_MAX_ATTEMPTS = 3
+
 logger = logging.getLogger(__name__)
 
-# Set OpenAI API key
-openai.api_key = os.getenv("OPENAI_API_KEY")
+# Sent verbatim as the first message of every conversation. Keeping it a
+# constant (no interpolation) gives each request the same prefix, which
+# OpenAI's automatic prompt caching reuses across calls.
+_SYSTEM_PROMPT = """You are EcoAgent, a sustainability assistant integrated into ChatGPT.
+
+Your job: Help users understand and reduce their environmental impact.
+
+What makes you valuable:
+1. KNOW: You access real-time carbon calculations, environmental data, and local resources
+2. DO: You provide personalized, actionable recommendations for reducing environmental impact
+3. SHOW: You present environmental data in clear, structured formats with context
+
+Guidelines:
+- Always use tools to provide accurate, data-driven responses
+- Be conversational but specific - include numbers and context
+- If a user's intent is vague, ask 1-2 clarifying questions max (then show something useful)
+- Start with a quick win on first interaction - show immediate value
+- Explain what you're doing and why the answer matters for their sustainability goals
+- Format numerical results clearly with context (e.g., "That's equivalent to...")
+- Keep responses concise and actionable
+
+When to use tools:
+- Carbon questions: use calculate_carbon_footprint
+- "How can I reduce?" questions: use get_sustainability_recommendations
+- "Where do I..." or "What's happening with..." questions: use search_environmental_data
+- Unit questions: use convert_units_with_context (convert_units_batch for a list of values)"""
+
+# Requests that map unambiguously onto one tool call. Matching them locally
+# skips the model's tool-selection round trip; the model is only asked to
+# phrase the answer.
+_NUMBER = r"(\d+(?:\.\d+)?)"
+_UNIT = r"(lbs|kg|miles|km)"
+_CONVERT_RE = re.compile(rf"\bconvert\s+{_NUMBER}\s*{_UNIT}\s+(?:to|into|in)\s+{_UNIT}\b", re.IGNORECASE)
+_DRIVE_RE = re.compile(rf"\b{_NUMBER}\s*miles\b.*?\b{_NUMBER}\s*mpg\b", re.IGNORECASE | re.DOTALL)
+# Every number-with-unit in a message; a routed request must have exactly the
+# quantities its one tool call consumes
+_QUANTITY_RE = re.compile(rf"\b{_NUMBER}\s*(?:lbs|kg|miles|km|mpg)\b", re.IGNORECASE)
+# Comparisons and follow-up questions need more than one tool call
+_COMPARISON_RE = re.compile(
+    r"\b(?:instead|versus|vs|compared?|comparing|comparison|than|or|save|saving|savings|"
+    r"alternatives?|difference|switch(?:ing)?|better|also)\b",
+    re.IGNORECASE,
+)
+
+
+def _route_intent(user_input: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Match obvious single-tool requests without asking the model.
+    
+    Args:
+        user_input: Raw user message
+        
+    Returns:
+        (tool_name, tool_args) for a confident match, or None
+    """
+    if _COMPARISON_RE.search(user_input):
+        return None
+    quantities = len(_QUANTITY_RE.findall(user_input))
+    match = _CONVERT_RE.search(user_input)
+    if match and quantities == 1:
+        value, from_unit, to_unit = match.groups()
+        from_unit, to_unit = from_unit.lower(), to_unit.lower()
+        # Mismatched families (e.g. kg to miles) are left to the model
+        if (from_unit, to_unit) not in _FAST_CONV:
+            return None
+        return "convert_units_with_context", {
+            "from_value": float(value),
+            "from_unit": from_unit,
+            "to_unit": to_unit,
+        }
+    match = _DRIVE_RE.search(user_input)
+    if match and quantities == 2:
+        miles, mpg = match.groups()
+        return "calculate_carbon_footprint", {
+            "calculation_type": "transportation",
+            "miles_driven": float(miles),
+            "vehicle_mpg": float(mpg),
+        }
+    return None
+
+
+# Tool schemas following OpenAI best practices:
+# 1. Clear, descriptive names and scopes
+# 2. Minimal, required inputs only
+# 3. Predictable, structured outputs with IDs
+# 4. Privacy-conscious (no unnecessary data collection)
+_TOOLS_SCHEMA: Dict[str, Dict[str, Any]] = {
+    # KNOW: Provide new environmental data that ChatGPT can't access
+    "calculate_carbon_footprint": {
+        "description": "Calculate carbon emissions from transportation, flights, or home energy. Returns structured CO2 impact in multiple units. Use this when users ask about their environmental impact from specific activities.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "calculation_type": {
+                    "type": "string",
+                    "enum": ["transportation", "flight", "home_energy", "total"],
+                    "description": "Type of carbon calculation to perform"
+                },
+                "miles_driven": {
+                    "type": "number",
+                    "description": "Number of miles driven (for transportation calculation)",
+                },
+                "vehicle_mpg": {
+                    "type": "number", 
+                    "description": "Vehicle fuel efficiency in miles per gallon (for transportation)",
+                },
+                "miles_flown": {
+                    "type": "number",
+                    "description": "Distance flown in miles (for flight calculation)",
+                },
+                "flight_class": {
+                    "type": "string",
+                    "enum": ["economy", "premium_economy", "business", "first"],
+                    "description": "Class of flight affecting emissions (for flight calculation)",
+                    "default": "economy"
+                },
+                "kwh_used": {
+                    "type": "number",
+                    "description": "Kilowatt-hours of energy used (for home energy calculation)",
+                },
+                "renewable_ratio": {
+                    "type": "number",
+                    "description": "Fraction of energy from renewable sources (0.0 to 1.0) (for home energy)",
+                    "default": 0.0
+                },
+                "energy_source": {
+                    "type": "string",
+                    "enum": ["grid", "solar", "wind", "hydro", "coal", "natural_gas", "nuclear"],
+                    "description": "Source of energy (for home energy)",
+                    "default": "grid"
+                },
+                "transportation_carbon": {
+                    "type": "number",
+                    "description": "Carbon from transportation in lbs CO2 (for total calculation)",
+                    "default": 0
+                },
+                "flight_carbon": {
+                    "type": "number",
+                    "description": "Carbon from flights in lbs CO2 (for total calculation)", 
+                    "default": 0
+                },
+                "home_energy_carbon": {
+                    "type": "number",
+                    "description": "Carbon from home energy in lbs CO2 (for total calculation)",
+                    "default": 0
+                }
+            },
+            "required": ["calculation_type"]
+        }
+    },
+    
+    # DO: Provide actionable sustainability recommendations
+    "get_sustainability_recommendations": {
+        "description": "Get personalized sustainability recommendations for transportation, energy, or diet. Provides specific, actionable steps tailored to the user's situation. Use when users ask how to reduce their environmental impact.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "recommendation_type": {
+                    "type": "string",
+                    "enum": ["transportation", "energy", "diet"],
+                    "description": "Type of recommendation to generate"
+                },
+                "distance_miles": {
+                    "type": "number",
+                    "description": "Distance for transportation alternatives (for transportation recommendations)"
+                },
+                "home_type": {
+                    "type": "string",
+                    "description": "Type of home (for energy recommendations)"
+                },
+                "current_energy_source": {
+                    "type": "string",
+                    "description": "Current energy source (for energy recommendations)"
+                },
+                "environmental_concern": {
+                    "type": "string",
+                    "enum": ["carbon", "water", "waste"],
+                    "description": "Primary environmental concern (for diet recommendations)"
+                }
+            },
+            "required": ["recommendation_type"]
+        }
+    },
+    
+    # KNOW: Access real-time environmental information (current, not in training data)
+    "search_environmental_data": {
+        "description": "Search for environmental facts, local resources, current news, and sustainability practices. Returns up-to-date information that ChatGPT's training data doesn't include. Use for questions about where to recycle, latest climate news, or how to compost.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query_type": {
+                    "type": "string",
+                    "enum": ["general_info", "local_resources", "news", "practice_info"],
+                    "description": "Type of environmental data to search for"
+                },
+                "query": {
+                    "type": "string",
+                    "description": "Search query about environmental topics"
+                },
+                "location": {
+                    "type": "string",
+                    "description": "Location for local resource search"
+                },
+                "resource_type": {
+                    "type": "string",
+                    "description": "Type of resource to search for (for local resources)",
+                    "default": "general"
+                },
+                "topic": {
+                    "type": "string",
+                    "description": "Environmental topic for news (for news search)",
+                    "default": "climate change"
+                },
+                "practice": {
+                    "type": "string",
+                    "description": "Specific practice for detailed info (for practice info search)"
+                }
+            },
+            "required": ["query_type", "query"]
+        }
+    },
+    
+    # SHOW/DO: Convert units with context-aware explanations
+    "convert_units_with_context": {
+        "description": "Convert between sustainability-related units (CO2, weight, energy, water). Returns conversion with context (e.g., '10 lbs CO2 = equivalent to driving X miles'). Use for helping users understand environmental metrics in familiar units.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "from_value": {
+                    "type": "number",
+                    "description": "Value to convert"
+                },
+                "from_unit": {
+                    "type": "string", 
+                    "description": "Unit to convert from"
+                },
+                "to_unit": {
+                    "type": "string",
+                    "description": "Unit to convert to"
+                }
+            },
+            "required": ["from_value", "from_unit", "to_unit"]
+        }
+    },
+    
+    # SHOW/DO: Convert a list of values between the same pair of units
+    "convert_units_batch": {
+        "description": "Convert a list of values from one unit to another in a single call (e.g., '[10, 20, 50] lbs to kg'). Use instead of convert_units_with_context when the user gives several numbers in the same units.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "values": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "description": "Values to convert"
+                },
+                "from_unit": {
+                    "type": "string",
+                    "description": "Unit to convert from"
+                },
+                "to_unit": {
+                    "type": "string",
+                    "description": "Unit to convert to"
+                }
+            },
+            "required": ["values", "from_unit", "to_unit"]
+        }
+    }
+}
+
+# EcoAgentChatGPT method implementing each tool
+_TOOL_METHODS = {
+    "calculate_carbon_footprint": "_calculate_and_format_carbon",
+    "get_sustainability_recommendations": "_generate_sustainability_recommendations",
+    "search_environmental_data": "_search_environmental_info",
+    "convert_units_with_context": "_convert_units",
+    "convert_units_batch": "_convert_units_batch"
+}
+
+# The same schemas in OpenAI function-calling format, built once at import
+_OPENAI_TOOLS: Tuple[Dict[str, Any], ...] = tuple(
+    {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": tool_info["description"],
+            "parameters": tool_info["parameters"]
+        }
+    }
+    for name, tool_info in _TOOLS_SCHEMA.items()
+)
+
+
+# Successful tool results. Fixed slotted layouts instead of per-call dicts;
+# fields that don't apply to a given calculation/query type stay None.
+# orjson serializes dataclasses natively (see _dumps for the json fallback).
+@dataclass(slots=True, frozen=True)
+class CarbonResult:
+    calculation_type: str
+    carbon_pounds: float
+    carbon_kg: float
+    description: str
+    breakdown: Dict[str, float]
+    flight_class: Optional[str] = None
+    energy_source: Optional[str] = None
+    renewable_ratio: Optional[float] = None
+    status: str = "success"
+
+
+@dataclass(slots=True, frozen=True)
+class RecommendationResult:
+    recommendation_type: str
+    description: str
+    alternatives: Optional[List[Any]] = None
+    recommendations: Optional[List[Any]] = None
+    distance_miles: Optional[float] = None
+    home_type: Optional[str] = None
+    energy_source: Optional[str] = None
+    environmental_concern: Optional[str] = None
+    status: str = "success"
+
+
+@dataclass(slots=True, frozen=True)
+class SearchResult:
+    query_type: str
+    result: Any
+    description: str
+    query: Optional[str] = None
+    location: Optional[str] = None
+    resource_type: Optional[str] = None
+    topic: Optional[str] = None
+    practice: Optional[str] = None
+    status: str = "success"
+
+
+@dataclass(slots=True, frozen=True)
+class ConversionResult:
+    conversion: Dict[str, Any]
+    description: str
+    status: str = "success"
+
+
+ToolResult = Union[CarbonResult, RecommendationResult, SearchResult, ConversionResult, Dict[str, Any]]
+
+
+# Argument models for each tool variant, validated in one pass by
+# pydantic-core; unrelated keys from the shared tool schema are ignored.
+class TransportationCarbonArgs(BaseModel):
+    miles_driven: float
+    vehicle_mpg: float
+
+
+class FlightCarbonArgs(BaseModel):
+    miles_flown: float
+    flight_class: str = "economy"
+
+
+class HomeEnergyCarbonArgs(BaseModel):
+    kwh_used: float
+    renewable_ratio: float = 0.0
+    energy_source: str = "grid"
+
+
+class TotalCarbonArgs(BaseModel):
+    transportation_carbon: float = 0
+    flight_carbon: float = 0
+    home_energy_carbon: float = 0
+
+
+class TransportationRecommendationArgs(BaseModel):
+    distance_miles: float
+
+
+class EnergyRecommendationArgs(BaseModel):
+    home_type: str = Field(min_length=1)
+    current_energy_source: str = Field(min_length=1)
+
+
+class DietRecommendationArgs(BaseModel):
+    environmental_concern: str = Field(min_length=1)
+
+
+class GeneralInfoArgs(BaseModel):
+    pass
+
+
+class LocalResourcesArgs(BaseModel):
+    location: str = Field(min_length=1)
+    resource_type: str = "general"
+
+
+class NewsArgs(BaseModel):
+    topic: str = "climate change"
+
+
+class PracticeInfoArgs(BaseModel):
+    practice: str = Field(min_length=1)
+
+
+# (tool name, calculation/recommendation/query type) -> argument model
+_ARG_MODELS: Dict[Tuple[str, str], Type[BaseModel]] = {
+    ("calculate_carbon_footprint", "transportation"): TransportationCarbonArgs,
+    ("calculate_carbon_footprint", "flight"): FlightCarbonArgs,
+    ("calculate_carbon_footprint", "home_energy"): HomeEnergyCarbonArgs,
+    ("calculate_carbon_footprint", "total"): TotalCarbonArgs,
+    ("get_sustainability_recommendations", "transportation"): TransportationRecommendationArgs,
+    ("get_sustainability_recommendations", "energy"): EnergyRecommendationArgs,
+    ("get_sustainability_recommendations", "diet"): DietRecommendationArgs,
+    ("search_environmental_data", "general_info"): GeneralInfoArgs,
+    ("search_environmental_data", "local_resources"): LocalResourcesArgs,
+    ("search_environmental_data", "news"): NewsArgs,
+    ("search_environmental_data", "practice_info"): PracticeInfoArgs,
+}
+
+# Wording for error messages, per tool
+_SUBTYPE_LABELS = {
+    "calculate_carbon_footprint": "calculation",
+    "get_sustainability_recommendations": "recommendation",
+    "search_environmental_data": "query",
+}
+
+
+def _wrap_carbon(result: float, calc_type: str, label: str, suffix: str = "", **extra) -> CarbonResult:
+    """Structured response for a single-source carbon calculation.
+    
+    Args:
+        result: Carbon emissions in lbs CO2, unrounded
+        calc_type: Calculation type, also used as the breakdown key
+        label: Human-readable name of the source for the description
+        suffix: Extra detail appended to the description
+        **extra: Type-specific CarbonResult fields
+    """
+    pounds = round(result, 2)
+    return CarbonResult(
+        calculation_type=calc_type,
+        carbon_pounds=pounds,
+        carbon_kg=round(result * _LBS_TO_KG, 2),
+        **extra,
+        description=f"{label} carbon footprint: {pounds} lbs CO2{suffix}",
+        breakdown={calc_type: pounds}
+    )
+
+
+def _parse_args(tool_name: str, subtype: str, kwargs: Dict[str, Any]):
+    """Validate a tool call's arguments against the model for its subtype.
+    
+    Returns:
+        Tuple of (args, error); exactly one of them is None
+    """
+    label = _SUBTYPE_LABELS[tool_name]
+    model = _ARG_MODELS.get((tool_name, subtype))
+    if model is None:
+        return None, {"error": f"Unknown {label} type: {subtype}", "status": "error"}
+    try:
+        return model(**kwargs), None
+    except ValidationError as e:
+        problems = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+        return None, {"error": f"Invalid parameters for {subtype} {label}: {problems}", "status": "error"}
 
 
 class EcoAgentChatGPT:
@@ -54,444 +558,381 @@ class EcoAgentChatGPT:
     """
     
     def __init__(self):
-        # Initialize tools following OpenAI best practices:
-        # 1. Clear, descriptive names and scopes
-        # 2. Minimal, required inputs only
-        # 3. Predictable, structured outputs with IDs
-        # 4. Privacy-conscious (no unnecessary data collection)
+        # Static schemas are shared; only the bound tool methods are per instance
         self.tools = {
-            # KNOW: Provide new environmental data that ChatGPT can't access
-            "calculate_carbon_footprint": {
-                "function": self._calculate_and_format_carbon,
-                "description": "Calculate carbon emissions from transportation, flights, or home energy. Returns structured CO2 impact in multiple units. Use this when users ask about their environmental impact from specific activities.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "calculation_type": {
-                            "type": "string",
-                            "enum": ["transportation", "flight", "home_energy", "total"],
-                            "description": "Type of carbon calculation to perform"
-                        },
-                        "miles_driven": {
-                            "type": "number",
-                            "description": "Number of miles driven (for transportation calculation)",
-                        },
-                        "vehicle_mpg": {
-                            "type": "number", 
-                            "description": "Vehicle fuel efficiency in miles per gallon (for transportation)",
-                        },
-                        "miles_flown": {
-                            "type": "number",
-                            "description": "Distance flown in miles (for flight calculation)",
-                        },
-                        "flight_class": {
-                            "type": "string",
-                            "enum": ["economy", "premium_economy", "business", "first"],
-                            "description": "Class of flight affecting emissions (for flight calculation)",
-                            "default": "economy"
-                        },
-                        "kwh_used": {
-                            "type": "number",
-                            "description": "Kilowatt-hours of energy used (for home energy calculation)",
-                        },
-                        "renewable_ratio": {
-                            "type": "number",
-                            "description": "Fraction of energy from renewable sources (0.0 to 1.0) (for home energy)",
-                            "default": 0.0
-                        },
-                        "energy_source": {
-                            "type": "string",
-                            "enum": ["grid", "solar", "wind", "hydro", "coal", "natural_gas", "nuclear"],
-                            "description": "Source of energy (for home energy)",
-                            "default": "grid"
-                        },
-                        "transportation_carbon": {
-                            "type": "number",
-                            "description": "Carbon from transportation in lbs CO2 (for total calculation)",
-                            "default": 0
-                        },
-                        "flight_carbon": {
-                            "type": "number",
-                            "description": "Carbon from flights in lbs CO2 (for total calculation)", 
-                            "default": 0
-                        },
-                        "home_energy_carbon": {
-                            "type": "number",
-                            "description": "Carbon from home energy in lbs CO2 (for total calculation)",
-                            "default": 0
-                        }
-                    },
-                    "required": ["calculation_type"]
-                }
-            },
-            
-            # DO: Provide actionable sustainability recommendations
-            "get_sustainability_recommendations": {
-                "function": self._generate_sustainability_recommendations,
-                "description": "Get personalized sustainability recommendations for transportation, energy, or diet. Provides specific, actionable steps tailored to the user's situation. Use when users ask how to reduce their environmental impact.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "recommendation_type": {
-                            "type": "string",
-                            "enum": ["transportation", "energy", "diet"],
-                            "description": "Type of recommendation to generate"
-                        },
-                        "distance_miles": {
-                            "type": "number",
-                            "description": "Distance for transportation alternatives (for transportation recommendations)"
-                        },
-                        "home_type": {
-                            "type": "string",
-                            "description": "Type of home (for energy recommendations)"
-                        },
-                        "current_energy_source": {
-                            "type": "string",
-                            "description": "Current energy source (for energy recommendations)"
-                        },
-                        "environmental_concern": {
-                            "type": "string",
-                            "enum": ["carbon", "water", "waste"],
-                            "description": "Primary environmental concern (for diet recommendations)"
-                        }
-                    },
-                    "required": ["recommendation_type"]
-                }
-            },
-            
-            # KNOW: Access real-time environmental information (current, not in training data)
-            "search_environmental_data": {
-                "function": self._search_environmental_info,
-                "description": "Search for environmental facts, local resources, current news, and sustainability practices. Returns up-to-date information that ChatGPT's training data doesn't include. Use for questions about where to recycle, latest climate news, or how to compost.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query_type": {
-                            "type": "string",
-                            "enum": ["general_info", "local_resources", "news", "practice_info"],
-                            "description": "Type of environmental data to search for"
-                        },
-                        "query": {
-                            "type": "string",
-                            "description": "Search query about environmental topics"
-                        },
-                        "location": {
-                            "type": "string",
-                            "description": "Location for local resource search"
-                        },
-                        "resource_type": {
-                            "type": "string",
-                            "description": "Type of resource to search for (for local resources)",
-                            "default": "general"
-                        },
-                        "topic": {
-                            "type": "string",
-                            "description": "Environmental topic for news (for news search)",
-                            "default": "climate change"
-                        },
-                        "practice": {
-                            "type": "string",
-                            "description": "Specific practice for detailed info (for practice info search)"
-                        }
-                    },
-                    "required": ["query_type", "query"]
-                }
-            },
-            
-            # SHOW/DO: Convert units with context-aware explanations
-            "convert_units_with_context": {
-                "function": self._convert_units,
-                "description": "Convert between sustainability-related units (CO2, weight, energy, water). Returns conversion with context (e.g., '10 lbs CO2 = equivalent to driving X miles'). Use for helping users understand environmental metrics in familiar units.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "from_value": {
-                            "type": "number",
-                            "description": "Value to convert"
-                        },
-                        "from_unit": {
-                            "type": "string", 
-                            "description": "Unit to convert from"
-                        },
-                        "to_unit": {
-                            "type": "string",
-                            "description": "Unit to convert to"
-                        }
-                    },
-                    "required": ["from_value", "from_unit", "to_unit"]
-                }
-            }
+            name: {"function": getattr(self, _TOOL_METHODS[name]), **tool_info}
+            for name, tool_info in _TOOLS_SCHEMA.items()
         }
         
-        # Format tools for OpenAI API following best practices
-        self.openai_tools = self._format_tools_for_openai()
+        # Flat name -> function table for execute_tool_call
+        self._dispatch = {name: info["function"] for name, info in self.tools.items()}
+        
+        # Tools in OpenAI API format, shared across instances. They are sent
+        # via extra_body, which the SDK merges into the request body as-is,
+        # so the static schemas skip its per-call parameter transform.
+        self.openai_tools = _OPENAI_TOOLS
+        self._tools_body = {"tools": self.openai_tools}
+        
+        # One client per event loop: an httpx pool is bound to the loop that
+        # opened it, and entries go away with their loop
+        self._clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, openai.AsyncOpenAI]" = WeakKeyDictionary()
     
-    def _format_tools_for_openai(self) -> List[Dict[str, Any]]:
-        """Format EcoAgent tools for OpenAI function calling following best practices."""
-        openai_tools = []
+    @property
+    def client(self) -> "openai.AsyncOpenAI":
+        """Persistent ``AsyncOpenAI`` client for the running event loop.
         
-        for name, tool_info in self.tools.items():
-            openai_tool = {
-                "type": "function",
-                "function": {
-                    "name": name,
-                    "description": tool_info["description"],
-                    "parameters": tool_info["parameters"]
-                }
-            }
-            openai_tools.append(openai_tool)
+        Created on first use in each loop; its pooled ``httpx.AsyncClient``
+        keeps the TCP/TLS connection to the API alive across conversations.
+        A client from one loop is never reused or replaced from another, so
+        switching loops (e.g. ``asyncio.run`` and then Gradio's loop) leaves
+        the earlier client intact for that loop to close.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            import httpx
+            client = self._clients[loop] = openai.AsyncOpenAI(
+                api_key=os.getenv("OPENAI_API_KEY"),
+                max_retries=0,  # retried with jitter in chat_with_sustainability_assistant
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+                )
+            )
+        return client
+    
+    async def aclose(self) -> None:
+        """Close the running loop's OpenAI client, if one was created.
         
-        return openai_tools
+        Clients that belong to other loops are left alone, so this is safe
+        to call on the shared agent when the caller's loop is about to end.
+        """
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
     
     # Focused individual functions for each capability following best practices
-    def _calculate_and_format_carbon(self, calculation_type: str, **kwargs) -> Dict[str, Any]:
+    def _calculate_and_format_carbon(self, calculation_type: str, **kwargs) -> ToolResult:
         """Calculate carbon footprint with structured output following best practices."""
         try:
+            args, error = _parse_args("calculate_carbon_footprint", calculation_type, kwargs)
+            if error is not None:
+                return error
+            
             if calculation_type == "transportation":
-                if "miles_driven" not in kwargs or "vehicle_mpg" not in kwargs:
-                    return {"error": "Missing required parameters for transportation calculation", "status": "error"}
                 result = calculate_transportation_carbon(
-                    miles_driven=kwargs["miles_driven"], 
-                    vehicle_mpg=kwargs["vehicle_mpg"]
+                    miles_driven=args.miles_driven, 
+                    vehicle_mpg=args.vehicle_mpg
                 )
-                return {
-                    "calculation_type": "transportation",
-                    "carbon_pounds": result,
-                    "carbon_kg": round(result * 0.453592, 2),
-                    "description": f"Transportation carbon footprint: {result} lbs CO2",
-                    "breakdown": {"transportation": result},
-                    "status": "success"
-                }
+                return _wrap_carbon(result, "transportation", "Transportation")
             
             elif calculation_type == "flight":
-                miles_flown = kwargs.get("miles_flown")
-                if miles_flown is None:
-                    return {"error": "Missing required parameter 'miles_flown' for flight calculation", "status": "error"}
-                flight_class = kwargs.get("flight_class", "economy")
-                result = calculate_flight_carbon(miles_flown=miles_flown, flight_class=flight_class)
-                return {
-                    "calculation_type": "flight",
-                    "carbon_pounds": result,
-                    "carbon_kg": round(result * 0.453592, 2),
-                    "flight_class": flight_class,
-                    "description": f"Flight carbon footprint: {result} lbs CO2 for {miles_flown} miles in {flight_class}",
-                    "breakdown": {"flight": result},
-                    "status": "success"
-                }
+                result = calculate_flight_carbon(miles_flown=args.miles_flown, flight_class=args.flight_class)
+                return _wrap_carbon(
+                    result, "flight", "Flight",
+                    suffix=f" for {args.miles_flown} miles in {args.flight_class}",
+                    flight_class=args.flight_class
+                )
             
             elif calculation_type == "home_energy":
-                kwh_used = kwargs.get("kwh_used")
-                if kwh_used is None:
-                    return {"error": "Missing required parameter 'kwh_used' for home energy calculation", "status": "error"}
-                renewable_ratio = kwargs.get("renewable_ratio", 0.0)
-                energy_source = kwargs.get("energy_source", "grid")
                 result = calculate_home_energy_carbon(
-                    kwh_used=kwh_used,
-                    renewable_ratio=renewable_ratio,
-                    energy_source=energy_source
+                    kwh_used=args.kwh_used,
+                    renewable_ratio=args.renewable_ratio,
+                    energy_source=args.energy_source
+                )
+                return _wrap_carbon(
+                    result, "home_energy", "Home energy",
+                    energy_source=args.energy_source,
+                    renewable_ratio=args.renewable_ratio
                 )
-                return {
-                    "calculation_type": "home_energy",
-                    "carbon_pounds": result,
-                    "carbon_kg": round(result * 0.453592, 2),
-                    "energy_source": energy_source,
-                    "renewable_ratio": renewable_ratio,
-                    "description": f"Home energy carbon footprint: {result} lbs CO2",
-                    "breakdown": {"home_energy": result},
-                    "status": "success"
-                }
             
-            elif calculation_type == "total":
-                trans_carbon = kwargs.get("transportation_carbon", 0)
-                flight_carbon = kwargs.get("flight_carbon", 0)
-                home_carbon = kwargs.get("home_energy_carbon", 0)
+            else:  # total
                 result = calculate_total_carbon(
-                    transportation_carbon=trans_carbon,
-                    flight_carbon=flight_carbon,
-                    home_energy_carbon=home_carbon
+                    transportation_carbon=args.transportation_carbon,
+                    flight_carbon=args.flight_carbon,
+                    home_energy_carbon=args.home_energy_carbon
+                )
+                raw_total = args.transportation_carbon + args.flight_carbon + args.home_energy_carbon
+                return CarbonResult(
+                    calculation_type="total",
+                    carbon_pounds=result["total_carbon"],
+                    carbon_kg=round(raw_total * _LBS_TO_KG, 2),
+                    breakdown=result["breakdown"],
+                    description=f"Total carbon footprint: {result['total_carbon']} lbs CO2"
                 )
-                return {
-                    "calculation_type": "total",
-                    "carbon_pounds": result["total_carbon"],
-                    "carbon_kg": round(result["total_carbon"] * 0.453592, 2),
-                    "breakdown": result["breakdown"],
-                    "description": f"Total carbon footprint: {result['total_carbon']} lbs CO2",
-                    "status": "success"
-                }
-            else:
-                return {"error": f"Unknown calculation type: {calculation_type}", "status": "error"}
                 
         except Exception as e:
-            logger.error(f"Error in carbon calculation: {str(e)}")
+            logger.error("Error in carbon calculation: %s", e)
             return {"error": str(e), "status": "error"}
     
-    def _generate_sustainability_recommendations(self, recommendation_type: str, **kwargs) -> Dict[str, Any]:
+    def _generate_sustainability_recommendations(self, recommendation_type: str, **kwargs) -> ToolResult:
         """Generate structured sustainability recommendations."""
         try:
+            args, error = _parse_args("get_sustainability_recommendations", recommendation_type, kwargs)
+            if error is not None:
+                return error
+            
             if recommendation_type == "transportation":
-                distance_miles = kwargs.get("distance_miles")
-                if distance_miles is None:
-                    return {"error": "Missing required parameter 'distance_miles' for transportation recommendations", "status": "error"}
-                result = suggest_transportation_alternatives(distance_miles=distance_miles)
-                return {
-                    "recommendation_type": "transportation",
-                    "distance_miles": distance_miles,
-                    "alternatives": result,
-                    "description": f"Sustainable transportation options for {distance_miles} miles",
-                    "status": "success"
-                }
+                result = suggest_transportation_alternatives(distance_miles=args.distance_miles)
+                return RecommendationResult(
+                    recommendation_type="transportation",
+                    distance_miles=args.distance_miles,
+                    alternatives=result,
+                    description=f"Sustainable transportation options for {args.distance_miles} miles"
+                )
             
             elif recommendation_type == "energy":
-                home_type = kwargs.get("home_type")
-                current_energy_source = kwargs.get("current_energy_source")
-                if not home_type or not current_energy_source:
-                    return {"error": "Missing required parameters for energy recommendations", "status": "error"}
-                result = suggest_energy_efficiency_improvements(home_type=home_type, current_energy_source=current_energy_source)
-                return {
-                    "recommendation_type": "energy",
-                    "home_type": home_type,
-                    "energy_source": current_energy_source,
-                    "recommendations": result,
-                    "description": f"Energy efficiency improvements for {home_type} with {current_energy_source} energy",
-                    "status": "success"
-                }
+                result = suggest_energy_efficiency_improvements(home_type=args.home_type, current_energy_source=args.current_energy_source)
+                return RecommendationResult(
+                    recommendation_type="energy",
+                    home_type=args.home_type,
+                    energy_source=args.current_energy_source,
+                    recommendations=result,
+                    description=f"Energy efficiency improvements for {args.home_type} with {args.current_energy_source} energy"
+                )
             
-            elif recommendation_type == "diet":
-                environmental_concern = kwargs.get("environmental_concern")
-                if not environmental_concern:
-                    return {"error": "Missing required parameter 'environmental_concern' for diet recommendations", "status": "error"}
-                result = suggest_dietary_changes(environmental_concern=environmental_concern)
-                return {
-                    "recommendation_type": "diet",
-                    "environmental_concern": environmental_concern,
-                    "recommendations": result,
-                    "description": f"Dietary changes for {environmental_concern} reduction",
-                    "status": "success"
-                }
-            else:
-                return {"error": f"Unknown recommendation type: {recommendation_type}", "status": "error"}
+            else:  # diet
+                result = suggest_dietary_changes(environmental_concern=args.environmental_concern)
+                return RecommendationResult(
+                    recommendation_type="diet",
+                    environmental_concern=args.environmental_concern,
+                    recommendations=result,
+                    description=f"Dietary changes for {args.environmental_concern} reduction"
+                )
         
         except Exception as e:
-            logger.error(f"Error in recommendation generation: {str(e)}")
+            logger.error("Error in recommendation generation: %s", e)
             return {"error": str(e), "status": "error"}
     
-    def _search_environmental_info(self, query_type: str, query: str, **kwargs) -> Dict[str, Any]:
+    def _search_environmental_info(self, query_type: str, query: str, **kwargs) -> ToolResult:
         """Search for environmental information with structured output."""
         try:
+            args, error = _parse_args("search_environmental_data", query_type, kwargs)
+            if error is not None:
+                return error
+            
             if query_type == "general_info":
-                result = search_environmental_info(query=query)
-                return {
-                    "query_type": "general_info",
-                    "query": query,
-                    "result": result,
-                    "description": f"Environmental information about: {query}",
-                    "status": "success"
-                }
+                result = _cached_environmental_info(query=query)
+                return SearchResult(
+                    query_type="general_info",
+                    query=query,
+                    result=result,
+                    description=f"Environmental information about: {query}"
+                )
             
             elif query_type == "local_resources":
-                location = kwargs.get("location")
-                if not location:
-                    return {"error": "Missing required parameter 'location' for local resources search", "status": "error"}
-                resource_type = kwargs.get("resource_type", "general")
-                result = get_local_environmental_resources(location=location, resource_type=resource_type)
-                return {
-                    "query_type": "local_resources",
-                    "location": location,
-                    "resource_type": resource_type,
-                    "result": result,
-                    "description": f"Local environmental resources in {location}",
-                    "status": "success"
-                }
+                result = _cached_local_resources(location=args.location, resource_type=args.resource_type)
+                return SearchResult(
+                    query_type="local_resources",
+                    location=args.location,
+                    resource_type=args.resource_type,
+                    result=result,
+                    description=f"Local environmental resources in {args.location}"
+                )
             
             elif query_type == "news":
-                topic = kwargs.get("topic", "climate change")
-                result = get_latest_environmental_news(topic=topic)
-                return {
-                    "query_type": "news",
-                    "topic": topic,
-                    "result": result,
-                    "description": f"Latest environmental news about {topic}",
-                    "status": "success"
-                }
+                result = _cached_news(args.topic, int(time() // _NEWS_TTL_SECONDS))
+                return SearchResult(
+                    query_type="news",
+                    topic=args.topic,
+                    result=result,
+                    description=f"Latest environmental news about {args.topic}"
+                )
             
-            elif query_type == "practice_info":
-                practice = kwargs.get("practice")
-                if not practice:
-                    return {"error": "Missing required parameter 'practice' for practice info search", "status": "error"}
-                result = get_sustainability_practice_info(practice=practice)
-                return {
-                    "query_type": "practice_info",
-                    "practice": practice,
-                    "result": result,
-                    "description": f"Information about sustainability practice: {practice}",
-                    "status": "success"
-                }
-            else:
-                return {"error": f"Unknown query type: {query_type}", "status": "error"}
+            else:  # practice_info
+                result = _cached_practice_info(practice=args.practice)
+                return SearchResult(
+                    query_type="practice_info",
+                    practice=args.practice,
+                    result=result,
+                    description=f"Information about sustainability practice: {args.practice}"
+                )
         
         except Exception as e:
-            logger.error(f"Error in environmental search: {str(e)}")
+            logger.error("Error in environmental search: %s", e)
             return {"error": str(e), "status": "error"}
     
-    def _convert_units(self, from_value: float, from_unit: str, to_unit: str) -> Dict[str, Any]:
+    def _convert_units(self, from_value: float, from_unit: str, to_unit: str) -> ToolResult:
         """Convert sustainability units with structured output."""
         try:
-            result = convert_units_with_context(from_value=from_value, from_unit=from_unit, to_unit=to_unit)
-            return {
-                "conversion": {
+            factor = _FAST_CONV.get((from_unit.lower(), to_unit.lower()))
+            if factor is not None:
+                to_value = round(from_value * factor, 6)
+            else:
+                to_value = convert_units_with_context(from_value=from_value, from_unit=from_unit, to_unit=to_unit)["converted_value"]
+            return ConversionResult(
+                conversion={
                     "from_value": from_value,
                     "from_unit": from_unit,
-                    "to_value": result["converted_value"],
+                    "to_value": to_value,
                     "to_unit": to_unit
                 },
-                "description": f"Converted {from_value} {from_unit} to {result['converted_value']} {to_unit}",
-                "status": "success"
-            }
+                description=f"Converted {from_value} {from_unit} to {to_value} {to_unit}"
+            )
         except Exception as e:
-            logger.error(f"Error in unit conversion: {str(e)}")
+            logger.error("Error in unit conversion: %s", e)
             return {"error": str(e), "status": "error"}
     
-    async def chat_with_sustainability_assistant(self, messages: List[Dict[str, str]], 
-                                               max_tokens: int = 1000, 
-                                               temperature: float = 0.7) -> Dict[str, Any]:
-        """Main method to interact with the OpenAI API using EcoAgent tools."""
+    def _convert_units_batch(self, values: List[float], from_unit: str, to_unit: str) -> ToolResult:
+        """Convert a list of values between two units with structured output.
         
+        Common unit pairs are converted with one vectorized multiply; other
+        pairs fall back to the per-value converter.
+        """
         try:
-            # Call OpenAI API with tools following best practices
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-4o",  # Using latest flagship model that supports function calling
-                messages=messages,
-                tools=self.openai_tools,
-                tool_choice="auto",  # Auto-select which tool to use
-                max_tokens=max_tokens,
-                temperature=temperature
+            factor = _FAST_CONV.get((from_unit.lower(), to_unit.lower()))
+            if factor is not None:
+                to_values = np.round(np.asarray(values, dtype=np.float64) * factor, 6).tolist()
+            else:
+                to_values = [
+                    convert_units_with_context(from_value=value, from_unit=from_unit, to_unit=to_unit)["converted_value"]
+                    for value in values
+                ]
+            return ConversionResult(
+                conversion={
+                    "from_values": values,
+                    "from_unit": from_unit,
+                    "to_values": to_values,
+                    "to_unit": to_unit
+                },
+                description=f"Converted {len(to_values)} values from {from_unit} to {to_unit}"
             )
-            
-            return response
-        
-        except openai.error.AuthenticationError:
-            logger.error("OpenAI API authentication failed. Check your API key.")
-            raise
-        except openai.error.RateLimitError:
-            logger.error("OpenAI API rate limit exceeded.")
-            raise
         except Exception as e:
-            logger.error(f"Error in OpenAI API call: {str(e)}")
-            raise
+            logger.error("Error in batch unit conversion: %s", e)
+            return {"error": str(e), "status": "error"}
     
-    def execute_tool_call(self, tool_name: str, tool_args: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a specific EcoAgent tool based on OpenAI function call."""
-        if tool_name not in self.tools:
+    async def chat_with_sustainability_assistant(self, messages: List[Dict[str, str]], 
+                                               max_tokens: int = 1000, 
+                                               temperature: float = 0.7,
+                                               stream: bool = False) -> Dict[str, Any]:
+        """Main method to interact with the OpenAI API using EcoAgent tools.
+        
+        With ``stream=True`` the awaited result is an async iterator of chunks.
+        Rate-limit errors and timeouts are retried with exponential backoff
+        and jitter before giving up.
+        """
+        
+        for attempt in range(_API_MAX_ATTEMPTS):
+            try:
+                # Call OpenAI API with tools following best practices
+                response = await self.client.chat.completions.create(
+                    model="gpt-4o",  # Using latest flagship model that supports function calling
+                    messages=messages,
+                    tool_choice="auto",  # Auto-select which tool to use
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    stream=stream,
+                    extra_body=self._tools_body
+                )
+                
+                return response
+            
+            except openai.AuthenticationError:
+                logger.error("OpenAI API authentication failed. Check your API key.")
+                raise
+            except (openai.RateLimitError, openai.APITimeoutError) as e:
+                if attempt == _API_MAX_ATTEMPTS - 1:
+                    logger.error("OpenAI API rate limit or timeout persisted after %d attempts.", _API_MAX_ATTEMPTS)
+                    raise
+                delay = 2 ** attempt + random.random() * 0.3
+                logger.warning("OpenAI API call failed (%s); retrying in %.1fs", type(e).__name__, delay)
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error("Error in OpenAI API call: %s", e)
+                raise
+    
+    async def execute_tool_call(self, tool_name: str, tool_args: Dict[str, Any]) -> ToolResult:
+        """Execute a specific EcoAgent tool based on OpenAI function call.
+        
+        Synchronous tools run in a worker thread so that several tool calls
+        from one model turn can proceed concurrently.
+        """
+        tool_func = self._dispatch.get(tool_name)
+        if tool_func is None:
             return {"error": f"Tool '{tool_name}' not found", "status": "error"}
         
         try:
-            tool_func = self.tools[tool_name]["function"]
-            result = tool_func(**tool_args)
+            if asyncio.iscoroutinefunction(tool_func):
+                result = await tool_func(**tool_args)
+            else:
+                result = await asyncio.to_thread(tool_func, **tool_args)
             return result  # Return the structured result directly
         except Exception as e:
-            logger.error(f"Error executing tool '{tool_name}': {str(e)}")
+            logger.error("Error executing tool '%s': %s", tool_name, e)
             return {"error": str(e), "status": "error"}
     
+    async def _run_tool_call(self, tool_name: str, arguments: str) -> ToolResult:
+        """Decode a streamed tool call's JSON arguments and execute it.
+        
+        Malformed arguments become a tool error result for the model rather
+        than an exception.
+        """
+        try:
+            tool_args = _loads(arguments or "{}")
+        except ValueError:
+            tool_args = None
+        if not isinstance(tool_args, dict):
+            logger.warning("Malformed arguments for tool '%s': %r", tool_name, arguments)
+            return {"error": f"Invalid arguments for tool '{tool_name}'", "status": "error"}
+        return await self.execute_tool_call(tool_name, tool_args)
+    
+    async def _stream_tool_calls(self, messages: List[Dict[str, Any]]):
+        """Stream a completion, starting each tool call as soon as its arguments are complete.
+        
+        Tool execution overlaps with the rest of the model's output instead of
+        waiting for the whole completion. If the stream fails, tools already
+        started are cancelled before the error propagates.
+        
+        Returns:
+            Tuple of (content, tool_calls, tool_tasks), with tool_tasks in the
+            same order as tool_calls
+        """
+        content_parts: List[str] = []
+        calls: Dict[int, Dict[str, Any]] = {}
+        tasks: Dict[int, asyncio.Task] = {}
+        
+        try:
+            stream = await self.chat_with_sustainability_assistant(messages, stream=True)
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                content = delta.content
+                if content:
+                    content_parts.append(content)
+                
+                for call_delta in delta.tool_calls or ():
+                    index = call_delta.index
+                    call = calls.setdefault(index, {"id": None, "type": "function", "function": {"name": "", "arguments": ""}})
+                    if call_delta.id:
+                        call["id"] = call_delta.id
+                    function = call_delta.function
+                    if function is not None:
+                        call["function"]["name"] += function.name or ""
+                        call["function"]["arguments"] += function.arguments or ""
+                    
+                    # Start the tool once its arguments form a complete JSON object
+                    arguments = call["function"]["arguments"]
+                    if index not in tasks and arguments.endswith("}"):
+                        try:
+                            tool_args = _loads(arguments)
+                        except ValueError:
+                            continue
+                        tasks[index] = asyncio.create_task(self.execute_tool_call(call["function"]["name"], tool_args))
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        
+        order = sorted(calls)
+        for index in order:
+            if index not in tasks:
+                call = calls[index]
+                tasks[index] = asyncio.create_task(
+                    self._run_tool_call(call["function"]["name"], call["function"]["arguments"])
+                )
+        
+        return "".join(content_parts), [calls[i] for i in order], [tasks[i] for i in order]
+    
     async def run_conversation(self, user_input: str) -> str:
         """Run a complete conversation with tool usage following OpenAI best practices.
         
@@ -502,78 +943,87 @@ class EcoAgentChatGPT:
         - Keep responses focused and actionable
         """
         messages = [
-            {
-                "role": "system", 
-                "content": """You are EcoAgent, a sustainability assistant integrated into ChatGPT.
-
-Your job: Help users understand and reduce their environmental impact.
-
-What makes you valuable:
-1. KNOW: You access real-time carbon calculations, environmental data, and local resources
-2. DO: You provide personalized, actionable recommendations for reducing environmental impact
-3. SHOW: You present environmental data in clear, structured formats with context
-
-Guidelines:
-- Always use tools to provide accurate, data-driven responses
-- Be conversational but specific - include numbers and context
-- If a user's intent is vague, ask 1-2 clarifying questions max (then show something useful)
-- Start with a quick win on first interaction - show immediate value
-- Explain what you're doing and why the answer matters for their sustainability goals
-- Format numerical results clearly with context (e.g., "That's equivalent to...")
-- Keep responses concise and actionable
-
-When to use tools:
-- Carbon questions: use calculate_carbon_footprint
-- "How can I reduce?" questions: use get_sustainability_recommendations
-- "Where do I..." or "What's happening with..." questions: use search_environmental_data
-- Unit questions: use convert_units_with_context"""
-            },
+            {"role": "system", "content": _SYSTEM_PROMPT},
             {
                 "role": "user",
                 "content": user_input
             }
         ]
         
-        # Get initial response from OpenAI
-        response = await self.chat_with_sustainability_assistant(messages)
-        message = response.choices[0].message
+        routed = _route_intent(user_input)
+        if routed:
+            # Obvious request: run the tool locally and only ask the model
+            # to phrase the result
+            tool_name, tool_args = routed
+            tool_calls = [{
+                "id": "call_local_0",
+                "type": "function",
+                "function": {"name": tool_name, "arguments": _dumps(tool_args)},
+            }]
+            tool_tasks = [asyncio.create_task(self.execute_tool_call(tool_name, tool_args))]
+            final_message = await self._complete_with_tool_results(list(messages), tool_calls, tool_tasks)
+            if not final_message.tool_calls:
+                return final_message.content
+            # The model wants more than the routed tool; let it choose the
+            # tools itself
+            logger.info("Routed request needed more tools; retrying through the model: %s", user_input[:100])
+        
+        # Stream the initial response from OpenAI; tools start while it streams
+        content, tool_calls, tool_tasks = await self._stream_tool_calls(messages)
         
         # If the model wants to call a tool
-        if hasattr(message, 'tool_calls') and message.tool_calls:
-            messages.append({
-                "role": "assistant",
-                "content": None,
-                "tool_calls": message.tool_calls
-            })
-            
-            # Execute each tool call following best practices
-            for tool_call in message.tool_calls:
-                tool_name = tool_call.function.name
-                tool_args = json.loads(tool_call.function.arguments)
-                
-                # Execute the tool and get structured result
-                tool_result = self.execute_tool_call(tool_name, tool_args)
-                
-                # Add tool result to messages
-                messages.append({
-                    "role": "tool",
-                    "name": tool_name,
-                    "content": json.dumps(tool_result),
-                })
-            
-            # Get final response from OpenAI with tool results
-            final_response = await self.chat_with_sustainability_assistant(messages)
-            return final_response.choices[0].message.content
+        if tool_calls:
+            final_message = await self._complete_with_tool_results(messages, tool_calls, tool_tasks)
+            return final_message.content
         else:
             # If no tool call needed, return the content directly
-            return message.content if message.content else "I can help you with sustainability questions! Try asking about carbon footprints or environmental recommendations."
+            return content if content else "I can help you with sustainability questions! Try asking about carbon footprints or environmental recommendations."
+    
+    async def _complete_with_tool_results(self, messages: List[Dict[str, Any]], tool_calls, tool_tasks):
+        """Append the tool calls and their results to ``messages`` and ask for the final answer.
+        
+        Returns:
+            The message of the follow-up completion
+        """
+        messages.append({
+            "role": "assistant",
+            "content": None,
+            "tool_calls": tool_calls
+        })
+        
+        async def paired(tool_call, task):
+            return tool_call, await task
+        
+        # Add each tool result to messages as soon as it finishes. Chat
+        # Completions needs every result before it can continue, so the
+        # follow-up call still waits for the slowest tool, but encoding
+        # the faster results overlaps with it.
+        for finished in asyncio.as_completed([paired(call, task) for call, task in zip(tool_calls, tool_tasks)]):
+            tool_call, tool_result = await finished
+            messages.append({
+                "role": "tool",
+                "tool_call_id": tool_call["id"],
+                "name": tool_call["function"]["name"],
+                "content": _dumps(tool_result),
+            })
+        
+        # Get final response from OpenAI with tool results
+        final_response = await self.chat_with_sustainability_assistant(messages)
+        return final_response.choices[0].message
+
+
+# Shared by every ChatGPTInterface
+_ECOAGENT_SINGLETON = EcoAgentChatGPT()
+
 
 # Simple interface for ChatGPT app following OpenAI best practices
 class ChatGPTInterface:
     """A focused interface for ChatGPT integration with EcoAgent tools following OpenAI best practices."""
     
     def __init__(self):
-        self.ecoagent = EcoAgentChatGPT()
+        # Interfaces may be created per request; they all share one agent
+        # (and so one OpenAI connection pool per event loop)
+        self.ecoagent = _ECOAGENT_SINGLETON
     
     async def process_message(self, user_message: str) -> str:
         """Process a user message and return the assistant's response."""
@@ -600,11 +1050,21 @@ def main():
         "Tell me about composting as a sustainability practice"
     ]
     
+    async def run_samples():
+        # The sample questions are independent, so ask them all at once
+        try:
+            return await asyncio.gather(*(interface.process_message(msg) for msg in sample_messages))
+        finally:
+            # asyncio.run closes this loop next; release its connection pool
+            await interface.ecoagent.aclose()
+    
+    responses = asyncio.run(run_samples())
+    
     print("Sample responses:")
-    for i, msg in enumerate(sample_messages, 1):
+    for i, (msg, response) in enumerate(zip(sample_messages, responses), 1):
         print(f"\nQ{i}: {msg}")
-        response = asyncio.run(interface.process_message(msg))
         print(f"A{i}: {response}")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""Tests for the ChatGPT integration's local routing and tool streaming."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.tools.chatgpt_integration import EcoAgentChatGPT, _route_intent
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("Convert 10 lbs to kg please",
+     ("convert_units_with_context", {"from_value": 10.0, "from_unit": "lbs", "to_unit": "kg"})),
+    ("convert 3.5 Miles into km",
+     ("convert_units_with_context", {"from_value": 3.5, "from_unit": "miles", "to_unit": "km"})),
+    ("I drove 120 miles in a 30 mpg car",
+     ("calculate_carbon_footprint", {"calculation_type": "transportation", "miles_driven": 120.0, "vehicle_mpg": 30.0})),
+])
+def test_route_intent_matches_obvious_requests(message, expected):
+    assert _route_intent(message) == expected
+
+
+@pytest.mark.parametrize("message", [
+    "convert 10 kg to miles",
+    "convert 5 km to lbs",
+    "convert 10 lbs",
+    "How can I reduce my footprint?",
+    "I drove 120 miles yesterday",
+    "convert 10 kg to miles; I drove 5 miles at 30 mpg",
+    "how much would I save driving 100 miles at 50 mpg instead of 25 mpg?",
+    "I drove 120 miles in a 30 mpg car, and what alternatives are there?",
+    "I drove 120 miles at 30 mpg versus flying",
+    "convert 10 lbs to kg and 5 miles to km",
+])
+def test_route_intent_leaves_other_requests_to_the_model(message):
+    assert _route_intent(message) is None
+
+
+def _tool_delta(index, call_id=None, name=None, arguments=None):
+    function = SimpleNamespace(name=name, arguments=arguments)
+    return SimpleNamespace(index=index, id=call_id, function=function)
+
+
+def _chunk(content=None, tool_calls=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+class _FakeStream:
+    """Async iterator over canned chunks; raises ``error`` once they run out."""
+
+    def __init__(self, chunks, error=None):
+        self._chunks = list(chunks)
+        self._error = error
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        if self._chunks:
+            return self._chunks.pop(0)
+        if self._error is not None:
+            raise self._error
+        raise StopAsyncIteration
+
+
+def test_run_conversation_streams_tools_and_reports_malformed_arguments(monkeypatch):
+    agent = EcoAgentChatGPT()
+    requests = []
+
+    async def fake_chat(messages, max_tokens=1000, temperature=0.7, stream=False):
+        requests.append(list(messages))
+        if stream:
+            return _FakeStream([
+                _chunk(tool_calls=[_tool_delta(0, "call_a", "convert_units_with_context", '{"from_value": 2, ')]),
+                _chunk(tool_calls=[_tool_delta(0, arguments='"from_unit": "lbs", "to_unit": "kg"}')]),
+                _chunk(tool_calls=[_tool_delta(1, "call_b", "convert_units_with_context", '{"from_value": ')]),
+            ])
+        message = SimpleNamespace(content="done", tool_calls=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(agent, "chat_with_sustainability_assistant", fake_chat)
+
+    assert asyncio.run(agent.run_conversation("How heavy is 2 lbs in metric?")) == "done"
+
+    tool_messages = {m["tool_call_id"]: json.loads(m["content"]) for m in requests[-1] if m["role"] == "tool"}
+    assert tool_messages["call_a"]["status"] == "success"
+    assert tool_messages["call_a"]["conversion"]["to_value"] == pytest.approx(0.907184)
+    assert tool_messages["call_b"]["status"] == "error"
+
+
+def test_routed_request_falls_back_when_model_asks_for_more_tools(monkeypatch):
+    agent = EcoAgentChatGPT()
+    streamed = []
+
+    async def fake_chat(messages, max_tokens=1000, temperature=0.7, stream=False):
+        if stream:
+            streamed.append(list(messages))
+            return _FakeStream([_chunk(content="streamed answer")])
+        tool_call = {"id": "call_more", "type": "function",
+                     "function": {"name": "get_sustainability_recommendations", "arguments": "{}"}}
+        message = SimpleNamespace(content=None, tool_calls=[tool_call])
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(agent, "chat_with_sustainability_assistant", fake_chat)
+
+    answer = asyncio.run(agent.run_conversation("I drove 120 miles in a 30 mpg car"))
+
+    assert answer == "streamed answer"
+    assert [m["role"] for m in streamed[0]] == ["system", "user"]
+
+
+def test_stream_failure_cancels_started_tools(monkeypatch):
+    agent = EcoAgentChatGPT()
+    cancelled = []
+
+    async def slow_tool(tool_name, tool_args):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(tool_name)
+            raise
+
+    async def fake_chat(messages, max_tokens=1000, temperature=0.7, stream=False):
+        return _FakeStream(
+            [_chunk(tool_calls=[_tool_delta(0, "call_a", "convert_units_with_context", '{"from_value": 1}')])],
+            error=RuntimeError("stream dropped"),
+        )
+
+    monkeypatch.setattr(agent, "execute_tool_call", slow_tool)
+    monkeypatch.setattr(agent, "chat_with_sustainability_assistant", fake_chat)
+
+    async def run():
+        with pytest.raises(RuntimeError, match="stream dropped"):
+            await agent._stream_tool_calls([{"role": "user", "content": "hi"}])
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert cancelled == ["convert_units_with_context"]
+
+
+def test_client_is_kept_per_event_loop(monkeypatch):
+    import src.tools.chatgpt_integration as integration
+
+    closed = []
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            pass
+
+        async def close(self):
+            closed.append(self)
+
+    monkeypatch.setattr(integration.openai, "AsyncOpenAI", FakeClient)
+    agent = EcoAgentChatGPT()
+
+    async def current_client():
+        return agent.client
+
+    loop_a, loop_b = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        client_a = loop_a.run_until_complete(current_client())
+        client_b = loop_b.run_until_complete(current_client())
+        assert client_a is not client_b
+        assert loop_a.run_until_complete(current_client()) is client_a
+
+        loop_b.run_until_complete(agent.aclose())
+        assert closed == [client_b]
+        assert loop_a.run_until_complete(current_client()) is client_a
+    finally:
+        loop_a.close()
+        loop_b.close()
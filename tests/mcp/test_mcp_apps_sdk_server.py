@@ -0,0 +1,80 @@
+"""Tests for the Apps SDK server's headless stdio transport and widget reloading."""
+
+import asyncio
+import io
+import json
+import os
+import signal
+import sys
+from pathlib import Path
+
+import pytest
+
+# The Apps SDK server imports its base class as a top-level module
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src" / "mcp_server"))
+
+from src.sdk.mcp_apps_sdk_server import EcoAgentAppsSDK
+
+
+def _serve(monkeypatch, lines):
+    """Feed ``lines`` to _serve_stdio and return the decoded responses."""
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdin", io.StringIO("".join(line + "\n" for line in lines)))
+    monkeypatch.setattr(sys, "stdout", stdout)
+    server = EcoAgentAppsSDK()
+    monkeypatch.setattr(server, "start_widget_reloader", lambda: None)
+
+    asyncio.run(server._serve_stdio())
+
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+def test_serve_stdio_survives_bad_lines(monkeypatch):
+    responses = _serve(monkeypatch, [
+        "{not json",
+        "[1, 2]",
+        "1",
+        json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {}}),
+        json.dumps({"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": [1]}),
+        json.dumps({"jsonrpc": "2.0", "method": "tools/list"}),
+        json.dumps({"jsonrpc": "2.0", "id": 3, "method": "initialize"}),
+    ])
+
+    assert [r["id"] for r in responses] == [None, None, None, 1, 2, 3]
+    assert [r["error"]["code"] for r in responses[:5]] == [-32700, -32600, -32600, -32602, -32602]
+    assert responses[5]["result"]["serverInfo"]["name"] == "EcoAgent Apps SDK"
+
+
+def test_serve_stdio_lists_tools(monkeypatch):
+    responses = _serve(monkeypatch, [
+        json.dumps({"jsonrpc": "2.0", "id": "tools", "method": "tools/list"}),
+    ])
+
+    assert responses[0]["id"] == "tools"
+    assert responses[0]["result"]["tools"]
+
+
+def test_headless_serve_does_not_import_gradio(monkeypatch):
+    _serve(monkeypatch, [
+        json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/list"}),
+    ])
+
+    assert "gradio" not in sys.modules
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="SIGHUP is POSIX-only")
+def test_widget_reloader_thread_reloads_on_sighup(monkeypatch):
+    import src.sdk.mcp_apps_sdk_server as apps_sdk
+
+    monkeypatch.setattr(apps_sdk, "watchfiles", None)
+    server = EcoAgentAppsSDK()
+    reloads = []
+    monkeypatch.setattr(server, "reload_widget", lambda: reloads.append(True))
+    previous = signal.getsignal(signal.SIGHUP)
+    try:
+        server.start_widget_reloader_thread()
+        os.kill(os.getpid(), signal.SIGHUP)
+    finally:
+        signal.signal(signal.SIGHUP, previous)
+
+    assert reloads == [True]
@@ -0,0 +1,100 @@
+"""Tests for the minimal MCP server's JSON-RPC handling."""
+
+import asyncio
+import json
+
+from src.mcp_server.mcp_server_minimal import MCPServer, MinimalEcoAgentMCP
+
+
+def _server():
+    return MCPServer(MinimalEcoAgentMCP())
+
+
+def test_mixed_batch_reports_errors_per_member():
+    responses = asyncio.run(_server().handle_batch([
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+        {"jsonrpc": "2.0", "id": 2, "method": "no/such/method"},
+    ]))
+
+    assert [r["id"] for r in responses] == [1, 2]
+    assert "tools" in responses[0]["result"]
+    assert "result" not in responses[1]
+    assert responses[1]["error"]["code"] == -32601
+
+
+def test_batch_rejects_non_object_members():
+    responses = asyncio.run(_server().handle_batch([
+        1,
+        "initialize",
+        {"jsonrpc": "2.0", "id": 3, "method": "initialize"},
+    ]))
+
+    assert len(responses) == 3
+    for response in responses[:2]:
+        assert response["id"] is None
+        assert response["error"]["code"] == -32600
+    assert responses[2]["result"]["protocolVersion"] == "2024-11-05"
+
+
+def test_batch_omits_notifications():
+    responses = asyncio.run(_server().handle_batch([
+        {"jsonrpc": "2.0", "method": "tools/list"},
+        {"jsonrpc": "2.0", "method": "no/such/method"},
+        {"jsonrpc": "2.0", "id": "a", "method": "tools/list"},
+    ]))
+
+    assert [r["id"] for r in responses] == ["a"]
+
+
+def test_empty_batch_is_invalid_request():
+    response = asyncio.run(_server().handle_batch([]))
+
+    assert response == {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+
+
+def test_single_request_gets_envelope():
+    response = asyncio.run(_server().handle_request(
+        {"jsonrpc": "2.0", "id": 7, "method": "tools/call", "params": {"name": "calculate_carbon"}}
+    ))
+
+    assert response["jsonrpc"] == "2.0"
+    assert response["id"] == 7
+    assert response["result"]["status"] == "success"
+
+
+def test_handle_message_wraps_cached_results_with_request_id():
+    server = _server()
+
+    for method in ("initialize", "tools/list"):
+        raw = asyncio.run(server.handle_message(
+            json.dumps({"jsonrpc": "2.0", "id": "req-" + method, "method": method})
+        ))
+        response = json.loads(raw)
+        assert response["jsonrpc"] == "2.0"
+        assert response["id"] == "req-" + method
+        assert "result" in response
+
+    assert json.loads(asyncio.run(server.handle_message(b'{"jsonrpc":"2.0","id":1,"method":"nope"}'))) == {
+        "jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "Method not found"}
+    }
+
+
+def test_handle_message_parse_error_and_notification():
+    server = _server()
+
+    assert json.loads(asyncio.run(server.handle_message(b"{not json")))["error"]["code"] == -32700
+    assert asyncio.run(server.handle_message(b'{"jsonrpc":"2.0","method":"tools/list"}')) is None
+
+
+def test_tool_results_are_plain_json_serializable_copies():
+    server = _server()
+    request = {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+               "params": {"name": "calculate_carbon", "arguments": {}}}
+
+    first = asyncio.run(server.handle_request(request))
+    assert type(first["result"]) is dict
+    assert json.loads(json.dumps(first))["result"]["carbon_footprint"] == 10.5
+
+    first["result"]["carbon_footprint"] = 0
+    second = asyncio.run(server.handle_request(request))
+    assert second["result"]["carbon_footprint"] == 10.5
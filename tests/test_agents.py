@@ -43,17 +43,106 @@ def test_carbon_calculation_functions():
     # Test transportation calculation
     carbon = calculate_transportation_carbon(100, 25)  # 100 miles, 25 mpg
     expected = (100 / 25) * 19.6  # gallons * lbs CO2 per gallon
-    assert carbon == round(expected, 2)
+    assert carbon == pytest.approx(expected)
     
     # Test flight calculation
     carbon = calculate_flight_carbon(1000)  # 1000 miles flown
     expected = 1000 * 0.44
-    assert carbon == round(expected, 2)
+    assert carbon == pytest.approx(expected)
     
     # Test home energy calculation
     carbon = calculate_home_energy_carbon(500, 0.2)  # 500 kWh, 20% renewable
     expected = (500 * 0.8) * 0.954  # non-renewable kWh * lbs CO2 per kWh
-    assert carbon == round(expected, 2)
+    assert carbon == pytest.approx(expected)
+
+
+
+def test_carbon_batch_functions_match_scalar():
+    """Test that the batch calculators agree with the scalar ones row by row."""
+    from ecoagent.tools.carbon_calculator import (
+        calculate_transportation_carbon, calculate_transportation_carbon_batch,
+        calculate_flight_carbon, calculate_flight_carbon_batch,
+        calculate_home_energy_carbon, calculate_home_energy_carbon_batch
+    )
+    
+    trips = [(100, 25), (42.5, 31.0), (0, 18)]
+    assert calculate_transportation_carbon_batch([m for m, _ in trips], [g for _, g in trips]) == pytest.approx(
+        [round(calculate_transportation_carbon(m, g), 2) for m, g in trips]
+    )
+    
+    flights = [(1000, "economy"), (2500, "Business"), (300, "unknown")]
+    assert calculate_flight_carbon_batch([m for m, _ in flights], [c for _, c in flights]) == pytest.approx(
+        [round(calculate_flight_carbon(m, c), 2) for m, c in flights]
+    )
+    
+    bills = [(500, 0.2, "grid"), (800, 0.0, "coal"), (120, 1.0, "solar")]
+    assert calculate_home_energy_carbon_batch(
+        [k for k, _, _ in bills], [r for _, r, _ in bills], [s for _, _, s in bills]
+    ) == pytest.approx([round(calculate_home_energy_carbon(k, r, s), 2) for k, r, s in bills])
+    
+    with pytest.raises(ValueError):
+        calculate_transportation_carbon_batch([10, 20], [25, 0])
+
+def test_total_carbon_result_matches_tool_dict():
+    """Test that the total carbon dataclass and the tool's dict agree."""
+    from ecoagent.tools.carbon_calculator import calculate_total_carbon, total_carbon_result
+    
+    result = total_carbon_result(78.4, 0, 381.6)
+    assert result.total_carbon == pytest.approx(460.0)
+    assert result.breakdown == {'transportation': 78.4, 'home_energy': 381.6}
+    
+    as_dict = calculate_total_carbon(78.4, 0, 381.6)
+    assert as_dict['total_carbon'] == result.total_carbon
+    assert as_dict['breakdown'] == result.breakdown
+
+def test_total_carbon_batch_matches_scalar():
+    """Test that the batch total agrees with per-record scalar totals."""
+    from ecoagent.tools.carbon_calculator import calculate_total_carbon, calculate_total_carbon_batch
+    
+    records = [(78.4, 0, 381.6), (12.0, 440.0, 0)]
+    result = calculate_total_carbon_batch(*(list(column) for column in zip(*records)))
+    
+    assert result['record_totals'] == pytest.approx(
+        [calculate_total_carbon(*record)['total_carbon'] for record in records]
+    )
+    assert result['breakdown'] == pytest.approx({'transportation': 90.4, 'flight': 440.0, 'home_energy': 381.6})
+    assert result['total_carbon'] == pytest.approx(912.0)
+
+
+def test_carbon_batch_results_are_rounded_like_scalar_tools():
+    """Test that batch results are plain 2-decimal floats equal to the rounded scalar tools."""
+    from ecoagent.tools.carbon_calculator import (
+        calculate_total_carbon_batch, calculate_transportation_carbon_batch,
+        calculate_flight_carbon_batch, calculate_home_energy_carbon_batch,
+        flight_carbon_tool, home_energy_tool, total_carbon_tool, transportation_carbon_tool
+    )
+    
+    trips = [(100, 25), (42.5, 31.0), (33, 7)]
+    transport = calculate_transportation_carbon_batch([m for m, _ in trips], [g for _, g in trips])
+    assert transport == [transportation_carbon_tool.func(m, g) for m, g in trips]
+    assert all(type(value) is float for value in transport)
+    
+    flights = [(1000, "economy"), (2500, "business"), (333, "first")]
+    assert calculate_flight_carbon_batch([m for m, _ in flights], [c for _, c in flights]) == [
+        flight_carbon_tool.func(m, c) for m, c in flights
+    ]
+    
+    bills = [(500, 0.2, "grid"), (812, 0.0, "coal"), (120, 0.35, "natural_gas")]
+    assert calculate_home_energy_carbon_batch(
+        [k for k, _, _ in bills], [r for _, r, _ in bills], [s for _, _, s in bills]
+    ) == [home_energy_tool.func(k, r, s) for k, r, s in bills]
+    
+    records = [(78.4, 440.0, 381.6), (12.35, 0, 7.1)]
+    result = calculate_total_carbon_batch(*(list(column) for column in zip(*records)))
+    assert result['record_totals'] == [total_carbon_tool.func(*record)['total_carbon'] for record in records]
+
+def test_agent_carbon_tools_round_results():
+    """Test that agent-facing carbon tools return 2-decimal floats and omit batch variants."""
+    from ecoagent.tools.carbon_calculator import carbon_calculation_tools, transportation_carbon_tool
+    
+    assert transportation_carbon_tool.func(33, 7) == round(33 / 7 * 19.6, 2)
+    assert type(transportation_carbon_tool.func(33, 7)) is float
+    assert not any("batch" in tool.name for tool in carbon_calculation_tools)
 
 
 def test_transportation_recommendation_function():
@@ -78,5 +167,27 @@ def test_energy_efficiency_function():
     assert len(insulation_improvements) > 0
 
 
+def test_recommendation_results_are_independent_copies():
+    """Test that mutating one recommendation result does not leak into later calls."""
+    from ecoagent.recommendation.agent import (
+        suggest_dietary_changes,
+        suggest_energy_efficiency_improvements,
+        suggest_transportation_alternatives,
+    )
+
+    for suggest, args in (
+        (suggest_transportation_alternatives, (2,)),
+        (suggest_energy_efficiency_improvements, ("house", "electric")),
+        (suggest_dietary_changes, ("carbon",)),
+    ):
+        first = suggest(*args)
+        expected = [dict(entry) for entry in first]
+        first[0]["savings"] = "100 lbs"
+        first[0].clear()
+        first.append({"option": "Teleport"})
+
+        assert suggest(*args) == expected
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
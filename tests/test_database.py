@@ -0,0 +1,48 @@
+"""Tests for the EcoAgent database's async write path."""
+
+import asyncio
+import tempfile
+import threading
+
+import pytest
+
+from ecoagent.database import EcoAgentDB
+
+
+@pytest.fixture(params=["memory", "file"])
+def database(request):
+    """Create an in-memory or file-backed database with one registered user."""
+    if request.param == "memory":
+        database = EcoAgentDB()
+    else:
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            database = EcoAgentDB(f.name)
+    database.save_user_profile("user1", {"name": "Test User"})
+    return database
+
+
+def test_async_writes_are_visible_to_the_event_loop_thread(database):
+    """Test that writes made off the loop land in the same database the loop reads."""
+    async def write():
+        saved = await database.save_carbon_footprint_batch_async([
+            {'user_id': "user1", 'carbon_type': 'transportation', 'value': 78.4},
+            {'user_id': "user1", 'carbon_type': 'flight', 'value': 440.0, 'context': {'miles_flown': 1000}},
+        ])
+        saved_single = await database.save_carbon_footprint_async("user1", 'energy', 381.6)
+        return saved and saved_single
+    
+    assert asyncio.run(write())
+    
+    values = sorted(record['value'] for record in database.get_carbon_footprints("user1"))
+    assert values == [78.4, 381.6, 440.0]
+
+
+def test_in_memory_database_is_shared_across_threads():
+    """Test that every thread sees the same in-memory database."""
+    database = EcoAgentDB()
+    thread = threading.Thread(target=database.save_user_profile, args=("user2", {"name": "Other"}))
+    thread.start()
+    thread.join()
+    
+    assert database.get_user_profile("user2")["name"] == "Other"
+    assert EcoAgentDB().get_user_profile("user2") is None
@@ -0,0 +1,96 @@
+"""Tests for delegation tracking and notification logging."""
+
+import logging
+import time
+
+import pytest
+
+from ecoagent.tools.delegation import DelegationTracker, _LogBatcher
+
+
+def test_log_batcher_flushes_after_max_age(caplog):
+    """Test that queued delegation logs are written without reaching the size threshold."""
+    batcher = _LogBatcher(flush_at=64, max_age=0.05)
+    
+    with caplog.at_level(logging.INFO, logger="ecoagent.tools.delegation"):
+        batcher.push("root_agent", "community_agent", "u1", "composting")
+        assert not caplog.records
+        
+        deadline = time.monotonic() + 2
+        while not caplog.records and time.monotonic() < deadline:
+            time.sleep(0.01)
+    
+    assert len(caplog.records) == 1
+    assert "root_agent -> community_agent | User: u1 | Task: composting" in caplog.records[0].getMessage()
+
+
+def test_log_batcher_flushes_at_size_threshold(caplog):
+    """Test that a full batch is written as one record."""
+    batcher = _LogBatcher(flush_at=3, max_age=60)
+    
+    with caplog.at_level(logging.INFO, logger="ecoagent.tools.delegation"):
+        for i in range(3):
+            batcher.push("root_agent", "recommendation_agent", "u%d" % i, "task")
+    
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage().startswith("Delegations logged (3)")
+
+
+def test_log_delegation_returns_record_and_readers_format_it():
+    """Test that tracker writes return the record and only readers format timestamps."""
+    tracker = DelegationTracker()
+    
+    record = tracker.log_delegation("u1", "root_agent", "community_agent", "composting", "note")
+    assert record.id == 0
+    assert record.status == "initiated"
+    assert isinstance(record.timestamp_ns, int)
+    
+    completed = tracker.mark_delegation_complete(record.id, "done")
+    assert completed is record
+    assert completed.status == "completed"
+    assert completed.result_summary == "done"
+    assert tracker.mark_delegation_complete(999) is None
+    
+    history = tracker.get_delegation_history("u1")
+    assert history[0]["id"] == 0
+    assert isinstance(history[0]["timestamp"], str)
+    assert isinstance(history[0]["completion_timestamp"], str)
+
+
+def test_delegation_history_order_and_limits():
+    """Test that history is oldest-first and honours the limit, per user and overall."""
+    tracker = DelegationTracker()
+    for i in range(6):
+        tracker.log_delegation("u%d" % (i % 2), "root_agent", "community_agent", "task%d" % i, "note")
+    
+    assert [r["task"] for r in tracker.get_delegation_history("u0", limit=2)] == ["task2", "task4"]
+    assert [r["task"] for r in tracker.get_delegation_history("u1", limit=0)] == ["task1", "task3", "task5"]
+    assert [r["id"] for r in tracker.get_delegation_history(limit=3)] == [3, 4, 5]
+    assert tracker.get_delegation_history("nobody") == []
+
+
+def test_count_by_agent():
+    """Test per-agent delegation counts overall and for a single user."""
+    tracker = DelegationTracker()
+    tracker.log_delegation("u1", "root_agent", "community_agent", "a", "note")
+    tracker.log_delegation("u1", "root_agent", "recommendation_agent", "b", "note")
+    tracker.log_delegation("u2", "root_agent", "community_agent", "c", "note")
+    
+    assert tracker.count_by_agent() == {"community_agent": 2, "recommendation_agent": 1}
+    assert tracker.count_by_agent("u1") == {"community_agent": 1, "recommendation_agent": 1}
+    assert tracker.count_by_agent("nobody") == {}
+
+
+def test_delegation_ids_unique_under_threads():
+    """Test that concurrent callers never share a delegation id."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    tracker = DelegationTracker()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        records = list(pool.map(
+            lambda i: tracker.log_delegation("u%d" % (i % 4), "root_agent", "community_agent", "t", "n"),
+            range(400)
+        ))
+    
+    assert len({record.id for record in records}) == 400
+    assert sum(tracker.count_by_agent().values()) == 400